@@ -0,0 +1,128 @@
+import importlib.util
+from abc import ABC, abstractmethod
+
+
+class ASRBackend(ABC):
+    """
+    음성 인식 백엔드 공통 인터페이스
+
+    load()로 모델을 한 번 로드한 뒤 transcribe()를 반복 호출합니다.
+    transcribe()는 16 kHz 모노 float32 배열 또는 오디오 파일 경로를 받아
+    {'text', 'language', 'segments': [{'start', 'end', 'text'}, ...]}를 반환합니다.
+    """
+
+    name = None
+    module = None  # 설치 여부 확인용 모듈 이름
+
+    def __init__(self, model_size, compute_type=None, cpu_threads=None):
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.model = None
+
+    @classmethod
+    def is_available(cls):
+        return importlib.util.find_spec(cls.module) is not None
+
+    @property
+    def model_tag(self):
+        """대본 캐시 구분용 모델 식별자"""
+        return f"{self.name}/{self.model_size}/{self.compute_type}"
+
+    @abstractmethod
+    def load(self):
+        """모델 로드 (작업 프로세스 시작 시 한 번)"""
+
+    @abstractmethod
+    def transcribe(self, audio, language=None):
+        """오디오 인식 결과 {'text', 'language', 'segments'} 반환"""
+
+
+class OpenAIWhisperBackend(ASRBackend):
+    """openai-whisper (PyTorch) 백엔드"""
+
+    name = 'openai-whisper'
+    module = 'whisper'
+
+    @property
+    def model_tag(self):
+        # 기존 캐시와 호환되도록 모델 이름만 사용
+        return self.model_size
+
+    def load(self):
+        import torch
+        if self.cpu_threads:
+            torch.set_num_threads(self.cpu_threads)
+        import whisper
+        self.model = whisper.load_model(self.model_size)
+
+    def transcribe(self, audio, language=None):
+        result = self.model.transcribe(
+            audio,
+            language=language,
+            task="transcribe",
+            fp16=False  # CPU 호환성
+        ) or {}
+        return {
+            'text': result.get('text', ''),
+            'language': result.get('language', language),
+            'segments': [
+                {'start': segment['start'], 'end': segment['end'], 'text': segment['text']}
+                for segment in result.get('segments', [])
+            ],
+        }
+
+
+class FasterWhisperBackend(ASRBackend):
+    """faster-whisper (CTranslate2) 백엔드 - CPU에서 int8 양자화 모델 사용"""
+
+    name = 'faster-whisper'
+    module = 'faster_whisper'
+
+    def load(self):
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(
+            self.model_size,
+            device="cpu",
+            compute_type=self.compute_type or "int8",
+            cpu_threads=self.cpu_threads or 0
+        )
+
+    def transcribe(self, audio, language=None):
+        segments, info = self.model.transcribe(audio, language=language, task="transcribe", beam_size=5)
+        segments = [
+            {'start': segment.start, 'end': segment.end, 'text': segment.text}
+            for segment in segments  # 생성기이므로 여기서 실제 인식이 수행됨
+        ]
+        return {
+            'text': ''.join(segment['text'] for segment in segments),
+            'language': info.language if info else language,
+            'segments': segments,
+        }
+
+
+ASR_BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def get_backend_class(name):
+    """백엔드 이름으로 클래스 조회"""
+    try:
+        return ASR_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 음성 인식 백엔드: {name} (사용 가능: {', '.join(ASR_BACKENDS)})")
+
+
+def is_backend_available(name):
+    """백엔드 패키지 설치 여부 (import하지 않고 확인)"""
+    try:
+        return get_backend_class(name).is_available()
+    except ValueError:
+        return False
+
+
+def create_backend(name, model_size, compute_type=None, cpu_threads=None):
+    """백엔드 객체 생성 (모델은 load() 호출 시 로드)"""
+    return get_backend_class(name)(model_size, compute_type=compute_type, cpu_threads=cpu_threads)
@@ -0,0 +1,105 @@
+"""
+음성 인식 백엔드 실시간 배율(RTF) 측정
+
+같은 로컬 오디오 파일을 백엔드/모델 크기/연산 형식별로 인식하여
+RTF(인식 시간 / 오디오 길이)를 비교합니다. RTF가 1보다 작으면 실시간보다 빠릅니다.
+
+사용 예:
+    python benchmarks/asr_rtf.py sample.wav
+    python benchmarks/asr_rtf.py sample.m4a --backends faster-whisper --models base small \\
+        --compute-types int8 float32 --threads 4
+
+오디오는 ffmpeg로 16 kHz 모노로 디코딩되므로 ffmpeg가 지원하는 형식이면 됩니다.
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from asr_backends import ASR_BACKENDS, create_backend, is_backend_available
+from whisper_pool import SAMPLE_RATE, decode_audio_stream
+
+
+def load_audio(path):
+    """오디오 파일을 Whisper 입력 형식(16 kHz 모노 float32)으로 디코딩"""
+    import numpy as np
+    pcm = decode_audio_stream(path)
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+def run_case(backend_name, model_size, compute_type, threads, audio, language, repeat):
+    """한 가지 설정 측정 (모델 로드 시간, 가장 빠른 인식 시간, 결과)"""
+    backend = create_backend(backend_name, model_size, compute_type=compute_type, cpu_threads=threads)
+
+    start = time.perf_counter()
+    backend.load()
+    load_time = time.perf_counter() - start
+
+    best_time = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = backend.transcribe(audio, language=language)
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    return load_time, best_time, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="음성 인식 백엔드 RTF 측정")
+    parser.add_argument('audio', help="측정에 사용할 로컬 오디오 파일")
+    parser.add_argument('--backends', nargs='+', choices=list(ASR_BACKENDS), default=None,
+                        help="측정할 백엔드 (기본값: 설치된 전체)")
+    parser.add_argument('--models', nargs='+', default=[config.WHISPER_MODEL],
+                        help=f"모델 크기 (기본값: {config.WHISPER_MODEL})")
+    parser.add_argument('--compute-types', nargs='+', default=[config.WHISPER_COMPUTE_TYPE],
+                        help=f"faster-whisper 연산 형식 (기본값: {config.WHISPER_COMPUTE_TYPE})")
+    parser.add_argument('--threads', type=int, default=os.cpu_count(),
+                        help="CPU 스레드 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--language', default=config.WHISPER_LANGUAGE or 'auto',
+                        help="인식 언어 ('auto'는 자동 감지)")
+    parser.add_argument('--repeat', type=int, default=1, help="설정별 반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args(argv)
+
+    backends = args.backends or [name for name in ASR_BACKENDS if is_backend_available(name)]
+    missing = [name for name in backends if not is_backend_available(name)]
+    for name in missing:
+        print(f"건너뜀: {name} 패키지가 설치되어 있지 않습니다.")
+    backends = [name for name in backends if name not in missing]
+    if not backends:
+        print("측정할 수 있는 음성 인식 백엔드가 없습니다.")
+        return 1
+
+    language = None if args.language == 'auto' else args.language
+
+    audio = load_audio(args.audio)
+    duration = len(audio) / SAMPLE_RATE
+    print(f"오디오: {args.audio} ({duration:.1f}초), 스레드 {args.threads}, 언어 {language or '자동 감지'}\n")
+
+    print(f"{'backend':<16}{'model':<12}{'compute':<14}{'load(s)':>9}{'asr(s)':>9}{'RTF':>8}  text")
+    for backend_name in backends:
+        # openai-whisper는 CPU에서 float32만 사용하므로 연산 형식별로 반복하지 않음
+        compute_types = args.compute_types if backend_name != 'openai-whisper' else ['float32']
+        for model_size in args.models:
+            for compute_type in compute_types:
+                try:
+                    load_time, asr_time, result = run_case(
+                        backend_name, model_size, compute_type, args.threads, audio, language, args.repeat
+                    )
+                except Exception as e:
+                    print(f"{backend_name:<16}{model_size:<12}{compute_type:<14}  실패: {e}")
+                    continue
+
+                text = (result.get('text') or '').strip().replace('\n', ' ')
+                print(f"{backend_name:<16}{model_size:<12}{compute_type:<14}"
+                      f"{load_time:9.2f}{asr_time:9.2f}{asr_time / duration:8.3f}  {text[:40]}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
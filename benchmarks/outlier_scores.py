@@ -0,0 +1,70 @@
+"""
+Outlier score 계산 시간 측정
+
+무작위로 만든 영상 통계(조회수, 구독자 수)로 모든 점수 종류를 계산하는
+시간을 측정합니다. numpy가 없으면 순수 Python 계산 시간을 측정합니다.
+
+- compute: 조회수/구독자 수 배열에서 점수 배열 계산 (compute_outlier_scores)
+- arrays: 영상 dict 목록에서 점수 배열 계산, dict 수정 없음 (compute_video_scores)
+- apply: 영상 dict마다 점수 기록까지 포함한 GUI/검색 경로 (apply_outlier_scores)
+
+사용 예:
+    python benchmarks/outlier_scores.py
+    python benchmarks/outlier_scores.py --counts 1000 100000 1000000 --repeat 5
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from outlier_scoring import NUMPY_AVAILABLE, compute_outlier_scores, compute_video_scores, apply_outlier_scores
+
+
+def make_videos(count, seed=0):
+    """로그 정규분포에 가까운 조회수/구독자 수를 가진 영상 목록 (일부는 구독자 수 비공개)"""
+    rng = random.Random(seed)
+    videos = []
+    for _ in range(count):
+        subscribers = 0 if rng.random() < 0.02 else int(rng.lognormvariate(9, 2))
+        views = int(rng.lognormvariate(8, 2.5))
+        videos.append({'view_count': views, 'subscriber_count': subscribers})
+    return videos
+
+
+def best_time(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Outlier score 계산 시간 측정")
+    parser.add_argument('--counts', nargs='+', type=int, default=[1000, 10000, 100000],
+                        help="영상 수 (기본값: 1000 10000 100000)")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args(argv)
+
+    print(f"계산 방식: {'numpy' if NUMPY_AVAILABLE else '순수 Python'}\n")
+    print(f"{'videos':>10}{'compute(ms)':>14}{'arrays(ms)':>12}{'apply(ms)':>12}")
+    for count in args.counts:
+        videos = make_videos(count)
+        views = [video['view_count'] for video in videos]
+        subscribers = [video['subscriber_count'] for video in videos]
+
+        compute_time = best_time(lambda: compute_outlier_scores(views, subscribers), args.repeat)
+        arrays_time = best_time(lambda: compute_video_scores(videos), args.repeat)
+        apply_time = best_time(lambda: apply_outlier_scores(videos), args.repeat)
+        print(f"{count:>10,}{compute_time * 1000:14.1f}{arrays_time * 1000:12.1f}{apply_time * 1000:12.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+프로그램 시작 시간 측정
+
+새 파이썬 프로세스에서 main 모듈 import부터 검색 창이 처음 그려질 때까지의
+시간을 여러 번 측정하고, 무거운 선택 의존성(torch, whisper, yt_dlp)이
+시작 시점에 로드되었는지 함께 확인합니다.
+
+사용 예:
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 10 --import-only
+
+API 키가 설정되어 있지 않으면 측정용 임시 키를 사용하며(네트워크 요청 없음),
+할당량/캐시 파일은 임시 폴더에 기록됩니다.
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import statistics
+import subprocess
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['torch', 'whisper', 'yt_dlp']
+
+# 자식 프로세스에서 실행되는 측정 코드
+CHILD_CODE = r"""
+import sys, json, time
+t0 = time.perf_counter()
+import main
+t_import = time.perf_counter()
+
+result = {'import_ms': (t_import - t0) * 1000}
+if not IMPORT_ONLY:
+    import tkinter as tk
+    root = tk.Tk()
+    app = main.YouTubeDeepSearch(root)
+    root.update()
+    result['window_ms'] = (time.perf_counter() - t0) * 1000
+    if hasattr(app, 'youtube_api'):
+        app.youtube_api.shutdown()
+    root.destroy()
+
+result['heavy_modules'] = [name for name in HEAVY_MODULES if name in sys.modules]
+print('RESULT ' + json.dumps(result))
+"""
+
+
+def run_once(import_only, env):
+    """새 프로세스에서 한 번 측정"""
+    code = f"IMPORT_ONLY = {import_only!r}\nHEAVY_MODULES = {HEAVY_MODULES!r}\n" + CHILD_CODE
+
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', code], cwd=REPO_DIR, env=env,
+                          capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    for line in proc.stdout.splitlines():
+        if line.startswith('RESULT '):
+            result = json.loads(line[len('RESULT '):])
+            result['process_ms'] = wall_ms
+            return result
+
+    raise RuntimeError(f"측정 실패 (종료 코드 {proc.returncode}):\n{proc.stderr.strip()}")
+
+
+def summarize(label, values):
+    if not values:
+        return
+    print(f"{label:<28} 중앙값 {statistics.median(values):8.1f} ms   "
+          f"최소 {min(values):8.1f} ms   최대 {max(values):8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="YouTube DeepSearch 시작 시간 측정")
+    parser.add_argument('--runs', type=int, default=5, help="측정 횟수 (기본값: 5)")
+    parser.add_argument('--import-only', action='store_true',
+                        help="창을 띄우지 않고 import 시간만 측정 (디스플레이가 없는 환경)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ)
+        env.setdefault('YOUTUBE_API_KEY', 'benchmark-dummy-key')
+        env['DEEPSEARCH_CACHE_DIR'] = cache_dir
+
+        results = []
+        for index in range(args.runs):
+            result = run_once(args.import_only, env)
+            results.append(result)
+            print(f"[{index + 1}/{args.runs}] import {result['import_ms']:.1f} ms"
+                  + (f", 첫 창 {result['window_ms']:.1f} ms" if 'window_ms' in result else "")
+                  + f", 프로세스 전체 {result['process_ms']:.1f} ms")
+
+    print()
+    summarize("import main", [r['import_ms'] for r in results])
+    summarize("import ~ 첫 창 표시", [r['window_ms'] for r in results if 'window_ms' in r])
+    summarize("프로세스 전체 (인터프리터 포함)", [r['process_ms'] for r in results])
+
+    loaded = sorted({name for r in results for name in r['heavy_modules']})
+    if loaded:
+        print(f"\n⚠️ 시작 시 로드된 무거운 모듈: {', '.join(loaded)}")
+    else:
+        print(f"\n시작 시 로드된 무거운 모듈 없음 ({', '.join(HEAVY_MODULES)})")
+
+
+if __name__ == "__main__":
+    main()
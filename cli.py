@@ -0,0 +1,417 @@
+"""
+YouTube DeepSearch 명령줄 실행 도구 (GUI 없이 사용)
+
+사용 예:
+    python cli.py search "키워드" --video-type 쇼츠 --min-views 10000 -o results.jsonl
+    python cli.py search --keywords-file keywords.txt --period 1주일 --max-results 200
+    python cli.py channel UCxxxxxxxx --max-results 200
+    python cli.py transcripts --input results.jsonl --workers 8 -o transcripts.jsonl
+    python cli.py thumbnails --input results.jsonl --output-dir thumbnails/
+
+결과는 JSON Lines 형식으로 표준 출력(또는 -o 파일)에 한 줄씩 기록되며,
+진행 로그는 표준 오류로 출력됩니다.
+"""
+import os
+import sys
+import json
+import argparse
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Load environment variables
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
+
+import config
+
+
+# 종료 코드
+EXIT_OK = 0
+EXIT_NO_RESULTS = 1
+EXIT_USAGE = 2  # argparse 기본값과 동일
+EXIT_API_ERROR = 3
+EXIT_QUOTA_EXHAUSTED = 4
+EXIT_PARTIAL_FAILURE = 5
+
+VIDEO_TYPE_CHOICES = ["전체", "쇼츠", "롱폼", "20분 초과"]
+PERIOD_CHOICES = ["전체", "1일", "1주일", "1개월", "3개월", "1년"]
+
+
+def log(message):
+    """진행 로그 출력 (표준 오류)"""
+    print(message, file=sys.stderr, flush=True)
+
+
+class JsonlWriter:
+    """결과를 JSON Lines 형식으로 한 줄씩 기록"""
+
+    def __init__(self, path, stdout):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8') if path else stdout
+        self.count = 0
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self.path:
+            self._file.close()
+
+
+def read_lines(path):
+    """파일 또는 표준 입력('-')에서 비어 있지 않은 줄 읽기"""
+    stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        return [line.strip() for line in stream if line.strip() and not line.startswith('#')]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def read_video_items(args):
+    """
+    명령줄 인자와 입력 파일에서 영상 목록 읽기
+
+    입력 파일의 각 줄은 영상 ID 또는 search/channel 명령의 JSONL 결과 레코드입니다.
+    """
+    items = [{'video_id': video_id} for video_id in args.video_ids]
+
+    if args.input:
+        for line in read_lines(args.input):
+            if line.startswith('{'):
+                record = json.loads(line)
+                if record.get('video_id'):
+                    items.append(record)
+            else:
+                items.append({'video_id': line})
+
+    # 중복 제거 (순서 유지)
+    unique = {}
+    for item in items:
+        unique.setdefault(item['video_id'], item)
+    return list(unique.values())
+
+
+def create_api():
+    """YouTubeAPI 생성 (실패 시 None)"""
+    from youtube_api import YouTubeAPI
+
+    if not config.YOUTUBE_API_KEY or config.YOUTUBE_API_KEY == "YOUR_YOUTUBE_API_KEY_HERE":
+        log("오류: YOUTUBE_API_KEY 환경 변수 또는 .env 파일에 API 키를 설정해주세요.")
+        return None
+
+    try:
+        return YouTubeAPI()
+    except ValueError as e:
+        log(f"오류: {e}")
+        return None
+
+
+def api_error_exit_code(error):
+    """API 오류의 종료 코드 (할당량 초과 403이면 EXIT_QUOTA_EXHAUSTED)"""
+    from googleapiclient.errors import HttpError
+
+    if isinstance(error, HttpError) and error.resp.status == 403:
+        content = error.content.decode('utf-8', 'replace') if isinstance(error.content, bytes) else str(error.content)
+        if 'quotaExceeded' in content or 'dailyLimitExceeded' in content:
+            return EXIT_QUOTA_EXHAUSTED
+    return EXIT_API_ERROR
+
+
+def write_search_results(writer, keyword, videos):
+    """키워드 검색 결과 기록"""
+    for video in videos:
+        writer.write({'keyword': keyword, **video})
+
+
+def cmd_search(api, args, writer):
+    """
+    키워드 검색
+
+    기본적으로 키워드의 모든 페이지를 받은 뒤 전체 결과 기준의 outlier_score로 기록합니다.
+    --stream이면 페이지가 확인되는 즉시 그 페이지까지 받은 결과 기준의 임시 점수로 기록합니다.
+    """
+    from outlier_scoring import OutlierStats
+
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        keywords.extend(read_lines(args.keywords_file))
+    if not keywords:
+        log("오류: 검색할 키워드를 입력해주세요.")
+        return EXIT_USAGE
+
+    video_type = "all" if args.video_type == "전체" else args.video_type
+    upload_period = None if args.period == "전체" else args.period
+    api.outlier_score_method = args.outlier_method
+
+    failed_keywords = 0
+    api_error = False
+    for index, keyword in enumerate(keywords, 1):
+        estimated_quota = api.estimate_search_quota(args.max_results)
+        if not api.check_quota_available(config.QUOTA_COSTS['search.list']):
+            log(f"할당량 소진으로 검색 중단 ({index - 1}/{len(keywords)}개 키워드 완료)")
+            return EXIT_QUOTA_EXHAUSTED
+
+        log(f"[{index}/{len(keywords)}] 검색: {keyword} (예상 할당량 약 {estimated_quota})")
+        written = 0
+        buffered = []
+        try:
+            for batch in api.iter_search_videos(
+                keyword=keyword,
+                video_type=video_type,
+                min_views=args.min_views,
+                max_subscribers=args.max_subscribers,
+                upload_period=upload_period,
+                max_results=args.max_results,
+                progress_callback=log if args.verbose else None
+            ):
+                if args.stream:
+                    write_search_results(writer, keyword, batch)
+                else:
+                    buffered.extend(batch)
+                written += len(batch)
+        except Exception as e:
+            if buffered:
+                # 중단 전까지 받은 결과끼리 같은 기준으로 점수를 다시 매겨 기록
+                partial_stats = OutlierStats()
+                partial_stats.add_videos(buffered)
+                partial_stats.score_videos(buffered, api.outlier_score_method)
+                write_search_results(writer, keyword, buffered)
+            exit_code = api_error_exit_code(e)
+            if exit_code == EXIT_QUOTA_EXHAUSTED:
+                log(f"할당량 초과로 검색 중단 ({keyword}): {e}")
+                return exit_code
+            log(f"검색 오류 ({keyword}): {e}")
+            api_error = True
+            failed_keywords += 1
+            continue
+
+        # 제너레이터가 끝나면 전체 결과 기준 점수로 갱신되어 있음
+        write_search_results(writer, keyword, buffered)
+
+        if not written:
+            failed_keywords += 1
+
+    quota_status = api.get_quota_status()
+    log(f"완료: {writer.count}개 영상 (오늘 할당량 {quota_status['used']}/{quota_status['limit']})")
+
+    if api_error:
+        return EXIT_API_ERROR
+    if writer.count == 0:
+        return EXIT_NO_RESULTS
+    return EXIT_PARTIAL_FAILURE if failed_keywords else EXIT_OK
+
+
+def cmd_channel(api, args, writer):
+    """채널 영상 목록"""
+    api.outlier_score_method = args.outlier_method
+    failed_channels = 0
+    api_error = False
+    for channel_id in args.channel_ids:
+        log(f"채널 영상 가져오는 중: {channel_id}")
+        try:
+            videos = api.fetch_channel_videos(channel_id, max_results=args.max_results)
+        except Exception as e:
+            exit_code = api_error_exit_code(e)
+            if exit_code == EXIT_QUOTA_EXHAUSTED:
+                log(f"할당량 초과로 중단 ({channel_id}): {e}")
+                return exit_code
+            log(f"채널 영상 가져오기 오류 ({channel_id}): {e}")
+            api_error = True
+            failed_channels += 1
+            continue
+
+        if not videos:
+            failed_channels += 1
+        for video in videos:
+            writer.write(video)
+
+    log(f"완료: {writer.count}개 영상")
+
+    if api_error:
+        return EXIT_API_ERROR
+    if writer.count == 0:
+        return EXIT_NO_RESULTS
+    return EXIT_PARTIAL_FAILURE if failed_channels else EXIT_OK
+
+
+def cmd_transcripts(api, args, writer):
+    """대본 일괄 추출"""
+    items = read_video_items(args)
+    if not items:
+        log("오류: 대본을 추출할 영상 ID를 입력해주세요.")
+        return EXIT_USAGE
+
+    video_ids = [item['video_id'] for item in items]
+    transcripts = api.get_transcript_batch(
+        video_ids,
+        progress_callback=log if args.verbose else None,
+        max_workers=args.workers
+    )
+
+    # 자막이 없는 영상은 Whisper로 재시도
+    # (작업 프로세스 풀 크기만큼 동시에 인식)
+    if args.whisper:
+        missing_ids = [video_id for video_id in video_ids if video_id not in transcripts]
+        if missing_ids:
+            with ThreadPoolExecutor(max_workers=config.WHISPER_POOL_SIZE) as executor:
+                futures = {
+                    executor.submit(api.get_video_transcript, video_id, use_whisper=True): video_id
+                    for video_id in missing_ids
+                }
+                for future in as_completed(futures):
+                    transcript = future.result()
+                    if transcript:
+                        transcripts[futures[future]] = transcript
+
+    for video_id in video_ids:
+        transcript = transcripts.get(video_id)
+        writer.write({'video_id': video_id, 'ok': transcript is not None, 'transcript': transcript})
+
+    success_count = sum(1 for video_id in video_ids if video_id in transcripts)
+    log(f"완료: {success_count}/{len(video_ids)}개 대본 추출")
+
+    if success_count == 0:
+        return EXIT_NO_RESULTS
+    return EXIT_PARTIAL_FAILURE if success_count < len(video_ids) else EXIT_OK
+
+
+def cmd_thumbnails(api, args, writer):
+    """썸네일 일괄 다운로드 (이미 받은 파일은 건너뜀)"""
+    from thumbnail_exporter import STATUS_FAILED, STATUS_SKIPPED
+
+    items = read_video_items(args)
+    if not items:
+        log("오류: 썸네일을 다운로드할 영상 ID를 입력해주세요.")
+        return EXIT_USAGE
+
+    export_items = [(item['video_id'], os.path.join(args.output_dir, f"{item['video_id']}.jpg")) for item in items]
+
+    def on_progress(done, total, result):
+        if args.verbose:
+            log(f"썸네일 다운로드 중... ({done}/{total}) {result['video_id']}: {result['status']}")
+
+    results = api.export_thumbnails(export_items, progress_callback=on_progress, max_workers=args.workers)
+
+    for result in results:
+        ok = result['status'] != STATUS_FAILED
+        writer.write({
+            'video_id': result['video_id'],
+            'ok': ok,
+            'path': result['path'] if ok else None,
+            'status': result['status'],
+            'variant': result['variant'],
+            'error': result['error'],
+        })
+
+    success_count = sum(1 for result in results if result['status'] != STATUS_FAILED)
+    skipped_count = sum(1 for result in results if result['status'] == STATUS_SKIPPED)
+    http_stats = api.get_http_stats()
+    log(f"완료: {success_count}/{len(items)}개 썸네일 (기존 파일 {skipped_count}개 건너뜀, "
+        f"연결 {http_stats['connections']}개, 재사용률 {http_stats['reuse_rate']:.0f}%)")
+
+    if success_count == 0:
+        return EXIT_NO_RESULTS
+    return EXIT_PARTIAL_FAILURE if success_count < len(items) else EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="YouTube DeepSearch 명령줄 도구 (결과는 JSON Lines로 출력)"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_common(sub):
+        sub.add_argument('-o', '--output', help="결과 JSONL 파일 경로 (기본값: 표준 출력, 기존 파일에 이어서 기록)")
+        sub.add_argument('-v', '--verbose', action='store_true', help="세부 진행 상황 출력")
+
+    def add_outlier_method(sub):
+        sub.add_argument('--outlier-method', choices=list(config.OUTLIER_SCORE_LABELS),
+                         default=config.OUTLIER_SCORE_METHOD,
+                         help=f"outlier_score에 기록할 점수 종류 (기본값: {config.OUTLIER_SCORE_METHOD}, "
+                              "channel은 채널별 기준값 조회 할당량 추가 사용)")
+
+    # search
+    search = subparsers.add_parser('search', help="키워드로 영상 검색")
+    search.add_argument('keywords', nargs='*', help="검색 키워드")
+    search.add_argument('--keywords-file', help="키워드 목록 파일 (한 줄에 하나, '-'는 표준 입력)")
+    search.add_argument('--video-type', choices=VIDEO_TYPE_CHOICES, default="전체", help="영상 유형")
+    search.add_argument('--min-views', type=int, default=0, help="최소 조회수")
+    search.add_argument('--max-subscribers', type=int, default=None, help="최대 구독자 수")
+    search.add_argument('--period', choices=PERIOD_CHOICES, default="전체", help="업로드 기간")
+    search.add_argument('--max-results', type=int, default=config.DEFAULT_MAX_RESULTS,
+                        help=f"키워드당 최대 결과 수 (기본값: {config.DEFAULT_MAX_RESULTS})")
+    search.add_argument('--stream', action='store_true',
+                        help="검색 페이지마다 바로 기록 (outlier_score는 그 페이지까지 받은 결과 기준의 임시 값)")
+    add_outlier_method(search)
+    add_common(search)
+
+    # channel
+    channel = subparsers.add_parser('channel', help="채널 영상 목록 가져오기")
+    channel.add_argument('channel_ids', nargs='+', help="채널 ID")
+    channel.add_argument('--max-results', type=int, default=200, help="채널당 최대 영상 수 (기본값: 200)")
+    add_outlier_method(channel)
+    add_common(channel)
+
+    # transcripts
+    transcripts = subparsers.add_parser('transcripts', help="대본 일괄 추출")
+    transcripts.add_argument('video_ids', nargs='*', help="영상 ID")
+    transcripts.add_argument('--input', help="영상 ID 또는 JSONL 결과 파일 ('-'는 표준 입력)")
+    transcripts.add_argument('--workers', type=int, default=config.TRANSCRIPT_MAX_WORKERS,
+                             help=f"동시 추출 작업 수 (기본값: {config.TRANSCRIPT_MAX_WORKERS})")
+    transcripts.add_argument('--whisper', action='store_true', help="자막이 없는 영상은 Whisper로 추출")
+    add_common(transcripts)
+
+    # thumbnails
+    thumbnails = subparsers.add_parser('thumbnails', help="썸네일 일괄 다운로드")
+    thumbnails.add_argument('video_ids', nargs='*', help="영상 ID")
+    thumbnails.add_argument('--input', help="영상 ID 또는 JSONL 결과 파일 ('-'는 표준 입력)")
+    thumbnails.add_argument('--output-dir', required=True, help="썸네일 저장 폴더")
+    thumbnails.add_argument('--workers', type=int, default=config.THUMBNAIL_MAX_WORKERS,
+                            help=f"동시 다운로드 수 (기본값: {config.THUMBNAIL_MAX_WORKERS})")
+    add_common(thumbnails)
+
+    return parser
+
+
+COMMANDS = {
+    'search': cmd_search,
+    'channel': cmd_channel,
+    'transcripts': cmd_transcripts,
+    'thumbnails': cmd_thumbnails,
+}
+
+
+def main(argv=None):
+    """명령줄 진입점 (종료 코드 반환)"""
+    args = build_parser().parse_args(argv)
+    stdout = sys.stdout
+
+    # 라이브러리의 print 로그가 JSONL 출력과 섞이지 않도록 표준 오류로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        api = create_api()
+        if api is None:
+            return EXIT_API_ERROR
+
+        writer = JsonlWriter(args.output, stdout)
+        try:
+            return COMMANDS[args.command](api, args, writer)
+        except KeyboardInterrupt:
+            log("중단됨")
+            return 130
+        except Exception as e:
+            log(f"오류: {e}")
+            return EXIT_API_ERROR
+        finally:
+            writer.close()
+            api.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,20 +9,106 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
 
+# API 할당량 설정 (태평양 시간 자정 기준 일일 초기화)
+QUOTA_DAILY_LIMIT = 10000  # 기본 일일 할당량
+QUOTA_WARNING_THRESHOLD = 8000  # 경고 임계값
+QUOTA_COSTS = {  # 엔드포인트별 단위 비용
+    'search.list': 100,
+    'videos.list': 1,
+    'channels.list': 1,
+    'playlistItems.list': 1,
+}
+
 # 검색 관련 설정
 MAX_RESULTS_PER_REQUEST = 50  # YouTube API 제한
 DEFAULT_MAX_RESULTS = 100
 MAX_TOTAL_RESULTS = 1000
 
+# 캐시 설정
+CACHE_DIR = os.getenv("DEEPSEARCH_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache"))
+METADATA_CACHE_PATH = os.path.join(CACHE_DIR, "metadata.sqlite3")
+QUOTA_STATE_PATH = os.path.join(CACHE_DIR, "quota.json")
+
+# 캐시 TTL (초) - 정적 필드(제목, 길이, 채널 ID 등)는 길게, 통계 필드는 짧게
+CACHE_STATIC_TTL = 30 * 24 * 3600  # 30일
+CACHE_VIDEO_STATS_TTL = int(os.getenv("DEEPSEARCH_VIDEO_STATS_TTL", 6 * 3600))  # 조회수/좋아요/댓글 수
+CACHE_CHANNEL_STATS_TTL = int(os.getenv("DEEPSEARCH_CHANNEL_STATS_TTL", 24 * 3600))  # 구독자 수
+
+# 채널 영상 목록 동기화 (다시 열 때 새 업로드만 확인)
+# 이 기간이 지나면 업로드 목록을 처음부터 다시 읽어 삭제/비공개 전환된 영상을 반영
+CHANNEL_SYNC_TTL = int(os.getenv("DEEPSEARCH_CHANNEL_SYNC_TTL", 7 * 24 * 3600))  # 7일
+
+# 대본 캐시 설정
+TRANSCRIPT_CACHE_PATH = os.path.join(CACHE_DIR, "transcripts.sqlite3")
+TRANSCRIPT_UNAVAILABLE_TTL = 24 * 3600  # 자막 없음 기록 유지 시간 (1일)
+
+# 대본 일괄 추출 설정
+TRANSCRIPT_MAX_WORKERS = 4  # 동시 추출 작업 수 (1이면 순차 처리)
+TRANSCRIPT_REQUESTS_PER_SECOND = 5  # 자막 서버 요청 속도 제한 (전체 작업 공유)
+
+# Whisper(음성 인식) 설정
+ASR_BACKEND = os.getenv("DEEPSEARCH_ASR_BACKEND", "openai-whisper")  # "openai-whisper" 또는 "faster-whisper" (CTranslate2)
+WHISPER_MODEL = os.getenv("DEEPSEARCH_WHISPER_MODEL", "base")  # tiny, base, small, medium, large-v3 등
+WHISPER_COMPUTE_TYPE = os.getenv("DEEPSEARCH_WHISPER_COMPUTE_TYPE", "int8")  # faster-whisper 연산 형식 (int8, int8_float32, float32)
+WHISPER_LANGUAGE = os.getenv("DEEPSEARCH_WHISPER_LANGUAGE", "ko") or None  # "auto"이면 언어 자동 감지
+if WHISPER_LANGUAGE == "auto":
+    WHISPER_LANGUAGE = None
+WHISPER_POOL_SIZE = 2  # 음성 인식 작업 프로세스 수
+WHISPER_TORCH_THREADS = None  # 작업 프로세스당 CPU 스레드 수 (torch/CTranslate2, None이면 CPU 코어 수 / 프로세스 수)
+WHISPER_CHUNK_SECONDS = 120  # 긴 오디오를 나누어 동시에 인식할 조각 길이 (초)
+WHISPER_SPLIT_WINDOW_SECONDS = 10  # 조각 끝부분에서 무음 지점을 찾을 구간 길이 (초)
+WHISPER_MAX_DURATION = 3 * 60 * 60  # 음성 인식할 최대 영상 길이 (초, None이면 제한 없음)
+
+# API 서비스 객체 풀에 보관할 최대 객체 수 (동시 요청 스레드 수 이상 권장)
+API_SERVICE_POOL_MAX_IDLE = 8
+
+# HTTP 설정 (썸네일 등 API 외 직접 요청)
+HTTP_TIMEOUT = (5, 30)  # (연결, 읽기) 타임아웃 (초)
+HTTP_POOL_CONNECTIONS = 10  # 연결 풀을 유지할 호스트 수
+HTTP_POOL_MAXSIZE = 16  # 호스트당 유지할 최대 연결 수 (동시 다운로드 수 이상)
+HTTP_MAX_RETRIES = 2  # 일시적 오류(429, 5xx) 재시도 횟수
+HTTP_ACCEPT_GZIP = True  # gzip 압축 응답 허용
+THUMBNAIL_MAX_WORKERS = 8  # 썸네일 동시 다운로드 수 (HTTP_POOL_MAXSIZE 이하)
+
+# 썸네일 미리보기 설정
+THUMBNAIL_PREVIEW_SIZE = (320, 180)  # 미리보기 크기 (픽셀)
+THUMBNAIL_PREVIEW_CACHE_MB = 32  # 디코딩된 미리보기 이미지 캐시 한도 (MB)
+THUMBNAIL_PREVIEW_PREFETCH = 2  # 선택한 행 앞뒤로 미리 받을 영상 수
+THUMBNAIL_PREVIEW_WORKERS = 3  # 미리보기 다운로드/디코딩 작업 스레드 수
+
 # 영상 길이 기준 (초)
 SHORTS_MAX_DURATION = 60  # 1분 이하는 쇼츠
 
+# Outlier score 설정
+# zscore: 조회수/구독자 비율 z-score 절댓값 (기존 방식), signed: 부호 있는 z-score,
+# log_zscore: 로그 비율 z-score, robust: 로그 비율의 중앙값/MAD 기반 점수,
+# channel: 채널 최근 업로드 조회수 중앙값 대비 배수 (선택 시 채널별 기준값을 추가로 조회)
+OUTLIER_SCORE_METHOD = "zscore"
+OUTLIER_SCORE_LABELS = {
+    "zscore": "Z-score (절댓값)",
+    "signed": "Z-score (부호)",
+    "log_zscore": "로그 비율 Z-score",
+    "robust": "중앙값/MAD",
+    "channel": "채널 평소 조회수 대비 (배)",
+}
+# 검색 결과를 페이지 단위로 받을 때 중앙값/MAD 근사에 쓰는 로그 비율 히스토그램 폭
+OUTLIER_MEDIAN_BIN_WIDTH = 0.01
+
+# 채널 기준 Outlier score (영상 조회수 / 채널 최근 업로드 조회수 중앙값)
+CHANNEL_BASELINE_SAMPLE_SIZE = 20  # 기준값 계산에 사용할 채널별 최근 업로드 수 (최대 50, playlistItems.list 1회)
+CHANNEL_BASELINE_TTL = int(os.getenv("DEEPSEARCH_CHANNEL_BASELINE_TTL", 3 * 24 * 3600))  # 기준값 캐시 유지 시간 (3일)
+CHANNEL_BASELINE_QUOTA_RESERVE = 500  # 남은 할당량이 이보다 적어지면 기준값 조회 중단 (검색용으로 남겨 둠)
+CHANNEL_BASELINE_MAX_WORKERS = 4  # 채널별 최근 업로드 목록 동시 조회 수
+
 # GUI 설정
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
 ANALYSIS_WINDOW_WIDTH = 1000
 ANALYSIS_WINDOW_HEIGHT = 700
 
+# 트리뷰 행 삽입 시 한 번에 사용할 최대 시간 (ms) - 나머지는 after()로 나누어 삽입
+TREE_INSERT_BUDGET_MS = 30
+
 # 컬럼 설정
 MAIN_COLUMNS = ["Title", "Views", "Outlier Score", "Duration", "Subscribers", "Channel"]
 MAIN_COLUMN_WIDTHS = [300, 100, 100, 80, 100, 150]
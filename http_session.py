@@ -0,0 +1,162 @@
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+
+
+class HttpSession:
+    """
+    스레드 안전 공유 HTTP 세션
+
+    연결 풀(HTTPAdapter)은 모든 스레드가 함께 사용하고, requests.Session은
+    스레드마다 따로 두어 쿠키/헤더 상태가 섞이지 않도록 합니다.
+    같은 호스트(i.ytimg.com 등)로의 요청은 keep-alive 연결을 재사용하여
+    매번 TLS 연결을 새로 맺지 않습니다.
+    """
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, timeout=None, retries=None, gzip=None):
+        self.timeout = timeout if timeout is not None else config.HTTP_TIMEOUT
+        self.gzip = gzip if gzip is not None else config.HTTP_ACCEPT_GZIP
+
+        retry = Retry(
+            total=retries if retries is not None else config.HTTP_MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['HEAD', 'GET']),
+        )
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections or config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or config.HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'errors': 0, 'bytes': 0}
+
+    def _get_session(self):
+        """현재 스레드의 Session (공유 연결 풀 사용)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            if not self.gzip:
+                session.headers['Accept-Encoding'] = 'identity'
+            self._local.session = session
+        return session
+
+    def request(self, method, url, **kwargs):
+        """HTTP 요청 (기본 타임아웃 적용)"""
+        kwargs.setdefault('timeout', self.timeout)
+        try:
+            response = self._get_session().request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._counters['requests'] += 1
+                self._counters['errors'] += 1
+            raise
+
+        with self._lock:
+            self._counters['requests'] += 1
+            if not kwargs.get('stream'):
+                self._counters['bytes'] += len(response.content)
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def download(self, url, save_path, chunk_size=64 * 1024):
+        """
+        파일 다운로드 (메모리에 전부 올리지 않고 나누어 저장)
+
+        임시 파일(.part)에 기록한 뒤 완료되면 이름을 바꾸므로, 중단된 다운로드가
+        완성된 파일처럼 남지 않습니다.
+
+        Returns:
+            bool: 성공 여부 (HTTP 200이 아니면 False)
+
+        Raises:
+            IOError: 받은 크기가 Content-Length와 다른 경우
+        """
+        part_path = save_path + '.part'
+        size = 0
+        try:
+            with self.get(url, stream=True) as response:
+                if response.status_code != 200:
+                    return False
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+                        size += len(chunk)
+
+                expected_size = get_content_length(response)
+                if expected_size is not None and size != expected_size:
+                    raise IOError(f"다운로드가 완료되지 않았습니다 ({size}/{expected_size} bytes)")
+
+            os.replace(part_path, save_path)
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            with self._lock:
+                self._counters['bytes'] += size
+        return True
+
+    def get_stats(self):
+        """
+        요청 수와 연결 재사용 통계 반환
+
+        연결 수는 urllib3 연결 풀이 새로 맺은 연결 수이며,
+        재사용률은 새 연결 없이 처리된 요청의 비율입니다.
+        """
+        with self._lock:
+            stats = dict(self._counters)
+
+        pool_requests = 0
+        connections = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            pool_requests += getattr(pool, 'num_requests', 0)
+            connections += getattr(pool, 'num_connections', 0)
+
+        stats['connections'] = connections
+        stats['reused'] = max(0, pool_requests - connections)
+        stats['reuse_rate'] = (stats['reused'] / pool_requests * 100) if pool_requests else 0.0
+        return stats
+
+    def close(self):
+        self._adapter.close()
+
+
+def get_content_length(response):
+    """압축되지 않은 응답의 Content-Length (없으면 None)"""
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return None
+    try:
+        return int(response.headers['Content-Length'])
+    except (KeyError, ValueError):
+        return None
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session():
+    """프로그램 전체에서 함께 쓰는 HttpSession (처음 호출 시 생성)"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = HttpSession()
+        return _shared_session
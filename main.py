@@ -2,10 +2,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import time
+from collections import deque, OrderedDict
 from datetime import datetime
 from PIL import Image, ImageTk
-import requests
 from io import BytesIO
 
 # Load environment variables
@@ -18,6 +20,8 @@ except ImportError:
 
 import config
 from youtube_api import YouTubeAPI
+from thumbnail_exporter import STATUS_DOWNLOADED, STATUS_SKIPPED, STATUS_FAILED, preview_thumbnail_url
+from outlier_scoring import SCORE_METHODS, SCORE_CHANNEL, select_outlier_score
 
 
 class CheckboxTreeview(ttk.Frame):
@@ -28,6 +32,9 @@ class CheckboxTreeview(ttk.Frame):
         # 체크박스 상태 저장
         self.checked_items = set()
         
+        # 항목 ID -> 항목 데이터 (O(1) 조회)
+        self.item_data = {}
+        
         # 체크박스 컬럼을 추가한 컬럼 리스트
         all_columns = ["☐"] + list(columns)
         all_widths = [30] + list(column_widths)
@@ -104,9 +111,7 @@ class CheckboxTreeview(ttk.Frame):
             checkbox_state = "☑"
         
         # 첫 번째 컬럼(체크박스) 업데이트
-        values = list(self.tree.item(item)['values'])
-        values[0] = checkbox_state
-        self.tree.item(item, values=values)
+        self.tree.set(item, "☐", checkbox_state)
         
         self.selection_change_callback()
     
@@ -124,19 +129,24 @@ class CheckboxTreeview(ttk.Frame):
         
         # 모든 항목의 체크박스 상태 업데이트
         for item in all_items:
-            values = list(self.tree.item(item)['values'])
-            values[0] = checkbox_state
-            self.tree.item(item, values=values)
+            self.tree.set(item, "☐", checkbox_state)
         
         self.selection_change_callback()
     
-    def insert(self, parent, index, **kwargs):
-        """항목 삽입"""
+    def insert(self, parent, index, data=None, **kwargs):
+        """항목 삽입 (data는 항목 ID로 조회할 수 있도록 저장)"""
         values = kwargs.get('values', [])
         # 체크박스 컬럼 추가
         values = ["☐"] + list(values)
         kwargs['values'] = values
-        return self.tree.insert(parent, index, **kwargs)
+        item = self.tree.insert(parent, index, **kwargs)
+        if data is not None:
+            self.item_data[item] = data
+        return item
+    
+    def get_item_data(self, item):
+        """항목 ID에 해당하는 데이터 반환"""
+        return self.item_data.get(item)
     
     def get_children(self):
         """자식 항목들 반환"""
@@ -146,6 +156,7 @@ class CheckboxTreeview(ttk.Frame):
         """항목 삭제"""
         for item in items:
             self.checked_items.discard(item)
+            self.item_data.pop(item, None)
         return self.tree.delete(*items)
     
     def get_checked_items(self):
@@ -157,9 +168,7 @@ class CheckboxTreeview(ttk.Frame):
         all_items = self.tree.get_children()
         self.checked_items = set(all_items)
         for item in all_items:
-            values = list(self.tree.item(item)['values'])
-            values[0] = "☑"
-            self.tree.item(item, values=values)
+            self.tree.set(item, "☐", "☑")
         self.selection_change_callback()
     
     def deselect_all(self):
@@ -167,9 +176,7 @@ class CheckboxTreeview(ttk.Frame):
         all_items = self.tree.get_children()
         self.checked_items.clear()
         for item in all_items:
-            values = list(self.tree.item(item)['values'])
-            values[0] = "☐"
-            self.tree.item(item, values=values)
+            self.tree.set(item, "☐", "☐")
         self.selection_change_callback()
     
     def move(self, item, parent, index):
@@ -181,6 +188,315 @@ class CheckboxTreeview(ttk.Frame):
         return self.tree.item(item, option, **kwargs)
 
 
+# 컬럼별 정렬 키 (게시일은 ISO 8601 문자열이므로 문자열 비교로 정렬)
+SORT_KEY_FUNCS = {
+    'Title': lambda video: video['title'].lower(),
+    'Views': lambda video: video['view_count'],
+    'Outlier Score': lambda video: video['outlier_score'],
+    'Duration': lambda video: video['duration_seconds'],
+    'Subscribers': lambda video: video['subscriber_count'],
+    'Channel': lambda video: video['channel_title'].lower(),
+    'Published': lambda video: video.get('published_at') or '',
+}
+
+
+class TreeSorter:
+    """
+    트리뷰 컬럼 정렬
+
+    컬럼별 정렬 키는 결과 집합당 한 번만 계산하여 보관하고, 같은 컬럼을 다시
+    정렬하면 현재 순서를 뒤집기만 합니다. 재배치는 set_children 한 번으로 처리합니다.
+    """
+    def __init__(self, tree, get_item_map):
+        self.tree = tree  # ttk.Treeview
+        self.get_item_map = get_item_map  # {항목 ID: 영상 정보}를 반환하는 함수
+        self._key_cache = {}
+        self._directions = {}
+        self._last_column = None
+        self._last_count = 0
+    
+    def invalidate(self, column=None):
+        """정렬 키 캐시 초기화 (column이 None이면 결과 집합 전체가 바뀐 경우)"""
+        if column is None:
+            self._key_cache.clear()
+            self._last_column = None
+        else:
+            self._key_cache.pop(column, None)
+            if self._last_column == column:
+                self._last_column = None
+    
+    def _get_keys(self, column):
+        """컬럼의 정렬 키 (새로 추가된 항목만 계산)"""
+        item_map = self.get_item_map()
+        keys = self._key_cache.setdefault(column, {})
+        if len(keys) != len(item_map):
+            key_func = SORT_KEY_FUNCS.get(column, lambda video: 0)
+            for item, video in item_map.items():
+                if item not in keys:
+                    keys[item] = key_func(video)
+        return keys
+    
+    def sort(self, column):
+        """컬럼 기준 정렬 후 새 항목 순서 반환 (오름차순/내림차순 번갈아 적용)"""
+        current_sort = self._directions.get(column, 'asc')
+        children = self.tree.get_children()
+        
+        if column == self._last_column and len(children) == self._last_count:
+            # 같은 컬럼 재정렬: 현재 순서를 뒤집기만 함
+            order = children[::-1]
+        else:
+            keys = self._get_keys(column)
+            order = sorted(children, key=keys.__getitem__, reverse=(current_sort == 'desc'))
+        
+        # 한 번의 호출로 전체 항목 재배치
+        self.tree.set_children('', *order)
+        
+        self._directions[column] = 'desc' if current_sort == 'asc' else 'asc'
+        self._last_column = column
+        self._last_count = len(order)
+        return order
+
+
+class ChunkedTreeInserter:
+    """
+    트리뷰에 많은 행을 시간 분할하여 삽입
+
+    한 번에 budget_ms 동안만 행을 삽입하고 나머지는 after()로 예약하여
+    수천 개의 행을 표시하는 동안에도 창이 응답하도록 합니다.
+    """
+    def __init__(self, widget, insert_row, budget_ms=None):
+        self.widget = widget  # after()를 예약할 위젯
+        self.insert_row = insert_row  # 항목 1개를 실제로 삽입하는 함수
+        self.budget = (budget_ms if budget_ms is not None else config.TREE_INSERT_BUDGET_MS) / 1000
+        self._queue = deque()
+        self._job = None
+        self._drain_callbacks = []
+        # 삽입 도중 창이 닫히면 남은 예약 작업 취소 (닫힌 트리뷰에 삽입하지 않도록)
+        widget.bind('<Destroy>', self._on_destroy, add='+')
+    
+    @property
+    def pending(self):
+        """아직 삽입되지 않은 항목 수"""
+        return len(self._queue)
+    
+    def enqueue(self, items):
+        """삽입할 항목 추가"""
+        self._queue.extend(items)
+        self._schedule()
+    
+    def clear(self):
+        """대기 중인 항목과 예약된 작업 취소"""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        self._queue.clear()
+        self._drain_callbacks.clear()
+    
+    def after_drain(self, callback):
+        """대기 중인 항목이 모두 삽입된 뒤 callback 실행"""
+        if not self._queue and self._job is None:
+            callback()
+        else:
+            self._drain_callbacks.append(callback)
+    
+    def _on_destroy(self, event):
+        # 하위 위젯의 <Destroy>도 전달되므로 대상 위젯 자체가 닫힐 때만 처리
+        if event.widget is self.widget:
+            self.clear()
+    
+    def _schedule(self):
+        if self._job is None and self._queue:
+            self._job = self.widget.after(1, self._process)
+    
+    def _process(self):
+        self._job = None
+        deadline = time.perf_counter() + self.budget
+        while self._queue and time.perf_counter() < deadline:
+            self.insert_row(self._queue.popleft())
+        
+        if self._queue:
+            # 남은 항목은 이벤트 처리 후 이어서 삽입
+            self._job = self.widget.after(1, self._process)
+        else:
+            callbacks, self._drain_callbacks = self._drain_callbacks, []
+            for callback in callbacks:
+                callback()
+
+
+class PhotoImageLRUCache:
+    """
+    메모리 한도 기반 PhotoImage LRU 캐시
+
+    항목 수가 아니라 이미지 크기(가로 x 세로 x 4바이트)의 합으로 한도를 관리하여
+    많은 영상을 훑어보아도 메모리 사용량이 max_bytes를 넘지 않습니다.
+    Tk 스레드에서만 사용합니다.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._images = OrderedDict()  # key -> (PhotoImage, 바이트 수)
+    
+    def __contains__(self, key):
+        return key in self._images
+    
+    def __len__(self):
+        return len(self._images)
+    
+    def get(self, key):
+        """이미지 조회 (최근 사용으로 표시)"""
+        entry = self._images.get(key)
+        if entry is None:
+            return None
+        self._images.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key, photo):
+        """이미지 저장 후 한도를 넘으면 가장 오래 사용하지 않은 이미지부터 제거"""
+        if key in self._images:
+            self.total_bytes -= self._images.pop(key)[1]
+        size = photo.width() * photo.height() * 4
+        self._images[key] = (photo, size)
+        self.total_bytes += size
+        
+        while self.total_bytes > self.max_bytes and len(self._images) > 1:
+            _, (_, old_size) = self._images.popitem(last=False)
+            self.total_bytes -= old_size
+
+
+class ThumbnailPreviewLoader:
+    """
+    썸네일 미리보기 로더
+
+    다운로드와 JPEG 디코딩/축소는 작업 스레드에서 하고, PhotoImage 생성과
+    캐시 저장은 after()로 Tk 스레드에서 합니다. 선택이 바뀌면 더 이상 필요 없는
+    대기 요청은 내려받지 않고 건너뜁니다.
+    """
+    def __init__(self, widget, http_session, size=None, cache_mb=None, max_workers=None):
+        self.widget = widget  # after()를 예약할 위젯 (프로그램 종료까지 유지되는 창)
+        self.http_session = http_session
+        self.size = size or config.THUMBNAIL_PREVIEW_SIZE
+        self.cache = PhotoImageLRUCache((cache_mb or config.THUMBNAIL_PREVIEW_CACHE_MB) * 1024 * 1024)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or config.THUMBNAIL_PREVIEW_WORKERS)
+        self._waiters = {}  # video_id -> [callback, ...] (Tk 스레드에서만 접근)
+        self._wanted = frozenset()  # 현재 선택과 주변 영상 (작업 스레드에서 읽음)
+    
+    def show(self, video_id, neighbor_ids, callback):
+        """
+        선택한 영상의 썸네일 요청 및 주변 영상 미리 받기
+        
+        callback(video_id, photo)는 Tk 스레드에서 호출되며, 실패 시 photo는 None입니다.
+        캐시에 있으면 즉시 호출됩니다.
+        """
+        self._wanted = frozenset([video_id, *neighbor_ids])
+        self._request(video_id, callback)
+        for neighbor_id in neighbor_ids:
+            self._request(neighbor_id)
+    
+    def _request(self, video_id, callback=None):
+        photo = self.cache.get(video_id)
+        if photo is not None:
+            if callback:
+                callback(video_id, photo)
+            return
+        
+        if video_id in self._waiters:
+            if callback:
+                self._waiters[video_id].append(callback)
+            return
+        
+        self._waiters[video_id] = [callback] if callback else []
+        self._executor.submit(self._fetch, video_id)
+    
+    def _fetch(self, video_id):
+        """썸네일 다운로드 및 디코딩 (작업 스레드)"""
+        image = None
+        if video_id in self._wanted:
+            try:
+                response = self.http_session.get(preview_thumbnail_url(video_id))
+                if response.status_code == 200:
+                    image = Image.open(BytesIO(response.content))
+                    image.draft('RGB', self.size)  # JPEG는 디코딩 단계에서 바로 축소
+                    image = image.convert('RGB')
+                    image.thumbnail(self.size)
+            except Exception as e:
+                print(f"썸네일 미리보기 오류 ({video_id}): {e}")
+                image = None
+        
+        try:
+            self.widget.after(0, self._deliver, video_id, image)
+        except (RuntimeError, tk.TclError):
+            pass  # 창이 닫힘
+    
+    def _deliver(self, video_id, image):
+        """PhotoImage 생성 및 콜백 호출 (Tk 스레드)"""
+        callbacks = self._waiters.pop(video_id, [])
+        photo = None
+        if image is not None:
+            photo = ImageTk.PhotoImage(image)
+            self.cache.put(video_id, photo)
+        
+        for callback in callbacks:
+            try:
+                callback(video_id, photo)
+            except tk.TclError:
+                pass  # 미리보기 창이 닫힘
+    
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ThumbnailPreviewPane(ttk.LabelFrame):
+    """선택한 영상의 썸네일 미리보기 영역"""
+    def __init__(self, parent, loader, **kwargs):
+        super().__init__(parent, text="미리보기", padding="5", **kwargs)
+        self.loader = loader
+        self.current_id = None
+        self._photo = None  # 표시 중인 이미지 참조 유지 (캐시에서 제거되어도 사라지지 않도록)
+        
+        width, height = loader.size
+        # 빈 이미지를 기본으로 두어 레이블 크기를 픽셀 단위로 고정
+        self._placeholder = tk.PhotoImage(width=width, height=height)
+        self.image_label = tk.Label(self, image=self._placeholder, text="영상을 선택해주세요",
+                                    compound=tk.CENTER, bg='#202020', fg='white')
+        self.image_label.pack()
+        
+        self.title_label = ttk.Label(self, text="", wraplength=width, justify=tk.LEFT)
+        self.title_label.pack(fill=tk.X, pady=(5, 0))
+    
+    def show(self, video, neighbor_ids=()):
+        """영상 썸네일 표시 (주변 영상은 미리 받기)"""
+        self.current_id = video['video_id']
+        self.title_label.config(text=video.get('title', ''))
+        if video['video_id'] not in self.loader.cache:
+            self._set_image(None, "불러오는 중...")
+        self.loader.show(video['video_id'], list(neighbor_ids), self._on_loaded)
+    
+    def clear(self):
+        self.current_id = None
+        self.title_label.config(text="")
+        self._set_image(None, "영상을 선택해주세요")
+    
+    def _on_loaded(self, video_id, photo):
+        if video_id != self.current_id or not self.winfo_exists():
+            return
+        self._set_image(photo, "" if photo else "미리보기 없음")
+    
+    def _set_image(self, photo, text):
+        self._photo = photo
+        self.image_label.config(image=photo or self._placeholder, text=text)
+
+
+def get_neighbor_items(tree, item, count):
+    """트리뷰에서 item 앞뒤로 count개씩 항목 ID 반환 (가까운 순서)"""
+    neighbors = []
+    prev_item = next_item = item
+    for _ in range(count):
+        next_item = tree.next(next_item) if next_item else ''
+        prev_item = tree.prev(prev_item) if prev_item else ''
+        neighbors.extend(i for i in (next_item, prev_item) if i)
+    return neighbors
+
+
 class YouTubeDeepSearch:
     def __init__(self, root):
         self.root = root
@@ -195,9 +511,14 @@ class YouTubeDeepSearch:
             self.root.destroy()
             return
         
+        # 썸네일 미리보기 로더 (채널 분석 창과 공유)
+        self.thumbnail_loader = ThumbnailPreviewLoader(self.root, self.youtube_api.http_session)
+        
         # 데이터 저장 변수
         self.current_videos = []
+        self.video_by_item = {}  # 트리뷰 항목 ID(video_id) -> 영상 정보
         self.selected_video = None
+        self.search_generation = 0  # 이전 검색의 늦은 결과 무시용
         
         # GUI 구성
         self.setup_ui()
@@ -269,9 +590,18 @@ class YouTubeDeepSearch:
         max_results_entry = ttk.Entry(search_frame, textvariable=self.max_results_var, width=10)
         max_results_entry.grid(row=2, column=3, sticky=tk.W, pady=(5, 0), padx=(0, 10))
         
+        # Outlier score 기준 (변경 시 재검색 없이 점수 열만 갱신)
+        ttk.Label(search_frame, text="Outlier 기준:").grid(row=3, column=0, sticky=tk.W, pady=(5, 0), padx=(0, 5))
+        self.outlier_method_var = tk.StringVar(value=config.OUTLIER_SCORE_LABELS[self.youtube_api.outlier_score_method])
+        outlier_method_combo = ttk.Combobox(search_frame, textvariable=self.outlier_method_var,
+                                            values=[config.OUTLIER_SCORE_LABELS[method] for method in SCORE_METHODS],
+                                            state="readonly", width=18)
+        outlier_method_combo.grid(row=3, column=1, sticky=tk.W, pady=(5, 0), padx=(0, 10))
+        outlier_method_combo.bind('<<ComboboxSelected>>', self.change_outlier_method)
+        
         # 검색 버튼
         search_button = ttk.Button(search_frame, text="검색", command=self.search_videos)
-        search_button.grid(row=0, column=4, rowspan=3, padx=(10, 0), pady=5)
+        search_button.grid(row=0, column=4, rowspan=4, padx=(10, 0), pady=5)
         
         # 그리드 가중치 설정
         search_frame.columnconfigure(1, weight=1)
@@ -315,9 +645,13 @@ class YouTubeDeepSearch:
         v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
+        # 썸네일 미리보기
+        self.preview_pane = ThumbnailPreviewPane(result_frame, self.thumbnail_loader)
+        self.preview_pane.grid(row=0, column=2, rowspan=2, sticky=tk.N, padx=(5, 0))
+        
         # 버튼 프레임
         button_frame = ttk.Frame(result_frame)
-        button_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
+        button_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(5, 0))
         
         # 채널 분석 버튼
         channel_analysis_button = ttk.Button(button_frame, text="채널 분석", 
@@ -339,9 +673,15 @@ class YouTubeDeepSearch:
         self.progress_bar = ttk.Progressbar(status_frame, mode='indeterminate')
         self.progress_text = ttk.Label(status_frame, text="", font=('Arial', 8))
         
+        # 행 삽입기 (대량 결과를 나누어 삽입)
+        self.row_inserter = ChunkedTreeInserter(self.tree, self.insert_search_row)
+        
+        # 정렬기
+        self.sorter = TreeSorter(self.tree, lambda: self.video_by_item)
+        
         # 이벤트 바인딩
         self.tree.bind('<Double-1>', self.on_video_double_click)
-        self.tree.bind('<ButtonRelease-1>', self.on_video_select)
+        self.tree.bind('<<TreeviewSelect>>', self.on_video_select)  # 마우스/키보드 선택 모두 처리
         
         # 그리드 가중치 설정
         result_frame.columnconfigure(0, weight=1)
@@ -383,14 +723,30 @@ class YouTubeDeepSearch:
         if upload_period == "전체":
             upload_period = None
         
+        # 예상 할당량 확인
+        estimated_quota = self.youtube_api.estimate_search_quota(max_results)
+        remaining_quota = self.youtube_api.get_quota_status()['remaining']
+        if estimated_quota > remaining_quota:
+            if not messagebox.askyesno(
+                "할당량 경고",
+                f"예상 할당량(약 {estimated_quota:,})이 오늘 남은 할당량({remaining_quota:,})보다 많습니다.\n"
+                "검색 도중 할당량이 소진될 수 있습니다. 계속하시겠습니까?"
+            ):
+                return
+        
         # 상태 업데이트
-        self.status_label.config(text="검색 준비 중...")
+        self.status_label.config(text=f"검색 준비 중... (예상 할당량: 약 {estimated_quota:,} / 남은 할당량: {remaining_quota:,})")
         self.show_progress("영상 검색 중...")
         
-        # 별도 스레드에서 검색 실행
+        # 새 검색 시작 (이전 검색의 결과는 무시)
+        self.search_generation += 1
+        generation = self.search_generation
+        self.clear_search_results()
+        
+        # 별도 스레드에서 검색 실행 (페이지 단위로 결과 표시)
         def search_thread():
             try:
-                videos = self.youtube_api.search_videos(
+                for batch in self.youtube_api.iter_search_videos(
                     keyword=keyword,
                     video_type=video_type,
                     min_views=min_views,
@@ -398,13 +754,16 @@ class YouTubeDeepSearch:
                     upload_period=upload_period,
                     max_results=max_results,
                     progress_callback=self.update_search_progress
-                )
+                ):
+                    # UI 업데이트는 메인 스레드에서
+                    self.root.after(0, lambda b=batch: self.update_search_results(b, generation))
                 
-                # UI 업데이트는 메인 스레드에서
-                self.root.after(0, lambda: self.update_search_results(videos))
+                self.root.after(0, lambda: self.finish_search_results(generation))
                 
             except Exception as e:
-                self.root.after(0, lambda: self.show_search_error(str(e)))
+                print(f"검색 중 오류 발생: {e}")
+                error_msg = str(e)
+                self.root.after(0, lambda: self.show_search_error(error_msg))
         
         threading.Thread(target=search_thread, daemon=True).start()
     
@@ -415,42 +774,122 @@ class YouTubeDeepSearch:
             self.root.update()
         self.root.after(0, update_ui)
     
-    def update_search_results(self, videos):
-        """검색 결과 업데이트"""
-        self.hide_progress()  # 프로그레스 바 숨김
-        self.current_videos = videos
+    def clear_search_results(self):
+        """검색 결과 초기화"""
+        self.row_inserter.clear()
+        self.sorter.invalidate()
+        self.current_videos = []
+        self.video_by_item = {}
         
         # 기존 항목 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         
-        # 새 항목 추가
-        for video in videos:
-            # 지속 시간 포맷팅
-            duration = self.format_duration(video['duration_seconds'])
-            
-            # 조회수 포맷팅
-            views = self.format_number(video['view_count'])
+        # 선택 상태 초기화
+        self.selected_video = None
+        self.selected_info_label.config(text="영상을 선택해주세요")
+        self.preview_pane.clear()
+    
+    def update_search_results(self, videos, generation=None):
+        """검색 결과 추가 (페이지 단위로 도착한 영상들을 목록 끝에 나누어 삽입)"""
+        if generation is not None and generation != self.search_generation:
+            return
+        
+        self.row_inserter.enqueue(videos)
+        
+        # 상태 업데이트
+        received = len(self.current_videos) + self.row_inserter.pending
+        self.status_label.config(text=f"검색 중... {received}개 영상")
+    
+    def insert_search_row(self, video):
+        """검색 결과 1개를 트리뷰와 current_videos에 함께 추가 (항목 ID는 video_id)"""
+        if video['video_id'] in self.video_by_item:
+            return  # 여러 페이지에 중복으로 나온 영상
+        
+        self.current_videos.append(video)
+        self.video_by_item[video['video_id']] = video
+        
+        # 지속 시간 포맷팅
+        duration = self.format_duration(video['duration_seconds'])
+        
+        # 조회수 포맷팅
+        views = self.format_number(video['view_count'])
+        
+        # 구독자 수 포맷팅
+        subscribers = self.format_number(video['subscriber_count'])
+        
+        # 트리뷰에 추가
+        self.tree.insert('', 'end', iid=video['video_id'], values=(
+            video['title'][:50] + "..." if len(video['title']) > 50 else video['title'],
+            views,
+            video['outlier_score'],
+            duration,
+            subscribers,
+            video['channel_title'][:20] + "..." if len(video['channel_title']) > 20 else video['channel_title']
+        ))
+    
+    def finish_search_results(self, generation=None):
+        """검색 완료 처리 (모든 행 삽입 후 최종 Outlier Score 반영)"""
+        if generation is not None and generation != self.search_generation:
+            return
+        
+        def finish():
+            self.hide_progress()  # 프로그레스 바 숨김
             
-            # 구독자 수 포맷팅
-            subscribers = self.format_number(video['subscriber_count'])
+            # 전체 결과 기준으로 계산된 Outlier Score 갱신
+            self.refresh_outlier_scores()
             
-            # 트리뷰에 추가
-            self.tree.insert('', 'end', values=(
-                video['title'][:50] + "..." if len(video['title']) > 50 else video['title'],
-                views,
-                video['outlier_score'],
-                duration,
-                subscribers,
-                video['channel_title'][:20] + "..." if len(video['channel_title']) > 20 else video['channel_title']
-            ))
+            # 상태 업데이트
+            quota_status = self.youtube_api.get_quota_status()
+            status_text = f"총 {len(self.current_videos)}개 영상을 찾았습니다. (오늘 할당량: {quota_status['used']:,}/{quota_status['limit']:,})"
+            search_stats = self.youtube_api.last_search_stats
+            if search_stats.get('rejected_total'):
+                status_text += (f" 필터 제외: {search_stats['rejected_total']}/{search_stats['fetched']}개"
+                                f" (낭비된 할당량 약 {search_stats['wasted_quota_estimate']:,})")
+            self.status_label.config(text=status_text)
+        
+        self.row_inserter.after_drain(finish)
+    
+    def refresh_outlier_scores(self):
+        """트리뷰의 Outlier Score 열을 영상 정보의 값으로 갱신"""
+        for item, video in self.video_by_item.items():
+            self.tree.set(item, 'Outlier Score', video['outlier_score'])
+        self.sorter.invalidate('Outlier Score')
+    
+    def change_outlier_method(self, event=None):
+        """Outlier score 기준 변경 (계산해 둔 점수 중에서 선택)"""
+        labels = {label: method for method, label in config.OUTLIER_SCORE_LABELS.items()}
+        method = labels.get(self.outlier_method_var.get(), config.OUTLIER_SCORE_METHOD)
+        self.youtube_api.outlier_score_method = method
+        select_outlier_score(self.current_videos, method)
+        self.refresh_outlier_scores()
+        
+        # 채널 기준 점수는 채널별 기준값이 필요하므로 아직 없는 영상만 백그라운드에서 계산
+        if method == SCORE_CHANNEL:
+            missing = [video for video in self.current_videos
+                       if SCORE_CHANNEL not in video.get('outlier_scores', {})]
+            if missing:
+                self.load_channel_scores(missing)
+    
+    def load_channel_scores(self, videos):
+        """채널 기준값을 조회하여 채널 기준 점수 반영"""
+        self.status_label.config(text=f"채널 기준값 조회 중... ({len(videos)}개 영상)")
         
-        # 상태 업데이트
-        self.status_label.config(text=f"총 {len(videos)}개 영상을 찾았습니다.")
+        def load_thread():
+            try:
+                self.youtube_api.calculate_channel_scores(videos)
+            except Exception as e:
+                print(f"채널 기준값 조회 오류: {e}")
+            self.root.after(0, finish)
         
-        # 선택 상태 초기화
-        self.selected_video = None
-        self.selected_info_label.config(text="영상을 선택해주세요")
+        def finish():
+            if self.youtube_api.outlier_score_method == SCORE_CHANNEL:
+                select_outlier_score(self.current_videos, SCORE_CHANNEL)
+                self.refresh_outlier_scores()
+            quota_status = self.youtube_api.get_quota_status()
+            self.status_label.config(text=f"총 {len(self.current_videos)}개 영상 "
+                                          f"(오늘 할당량: {quota_status['used']:,}/{quota_status['limit']:,})")
+        
+        threading.Thread(target=load_thread, daemon=True).start()
     
     def show_search_error(self, error_msg):
         """검색 오류 표시"""
@@ -483,67 +922,26 @@ class YouTubeDeepSearch:
     
     def sort_treeview(self, column):
         """트리뷰 정렬"""
-        # 현재 정렬 상태 확인
-        current_sort = getattr(self, f'sort_{column}', 'asc')
-        reverse = current_sort == 'desc'
-        
-        # 트리뷰의 모든 항목과 해당하는 비디오 데이터 가져오기
-        items_data = []
-        for i, child in enumerate(self.tree.get_children()):
-            if i < len(self.current_videos):
-                video_data = self.current_videos[i]
-                items_data.append((child, video_data))
-        
-        # 컬럼별 정렬 키 함수
-        def sort_key(item):
-            video = item[1]  # video_data
-            
-            if column == 'Title':
-                return video['title'].lower()
-            elif column == 'Views':
-                return video['view_count']
-            elif column == 'Outlier Score':
-                return video['outlier_score']
-            elif column == 'Duration':
-                return video['duration_seconds']
-            elif column == 'Subscribers':
-                return video['subscriber_count']
-            elif column == 'Channel':
-                return video['channel_title'].lower()
-            else:
-                return 0
-        
-        # 정렬 실행
-        items_data.sort(key=sort_key, reverse=reverse)
-        
-        # 트리뷰와 current_videos 동시에 재정렬
-        sorted_videos = []
-        for i, (child, video_data) in enumerate(items_data):
-            self.tree.move(child, '', i)
-            sorted_videos.append(video_data)
+        order = self.sorter.sort(column)
         
-        # current_videos 업데이트
-        self.current_videos = sorted_videos
-        
-        # 정렬 상태 업데이트
-        setattr(self, f'sort_{column}', 'desc' if current_sort == 'asc' else 'asc')
+        # current_videos도 같은 순서로 재정렬
+        self.current_videos = [self.video_by_item[item] for item in order]
     
     def on_video_double_click(self, event):
         """영상 더블클릭 이벤트"""
         selection = self.tree.selection()
         if selection:
-            index = self.tree.get_children().index(selection[0])
-            if index < len(self.current_videos):
-                video = self.current_videos[index]
+            video = self.video_by_item.get(selection[0])
+            if video:
                 webbrowser.open(video['url'])
     
     def on_video_select(self, event):
         """영상 선택 이벤트"""
         selection = self.tree.selection()
         if selection:
-            index = self.tree.get_children().index(selection[0])
-            if index < len(self.current_videos):
-                self.selected_video = self.current_videos[index]
+            video = self.video_by_item.get(selection[0])
+            if video:
+                self.selected_video = video
                 # 선택된 영상 정보 표시
                 title = self.selected_video['title']
                 if len(title) > 30:
@@ -551,9 +949,13 @@ class YouTubeDeepSearch:
                 self.selected_info_label.config(
                     text=f"선택: {title} (채널: {self.selected_video['channel_title']})"
                 )
+                self.preview_pane.show(
+                    video, get_neighbor_items(self.tree, selection[0], config.THUMBNAIL_PREVIEW_PREFETCH)
+                )
         else:
             self.selected_video = None
             self.selected_info_label.config(text="영상을 선택해주세요")
+            self.preview_pane.clear()
     
     def open_channel_analysis(self):
         """채널 분석 창 열기"""
@@ -562,13 +964,15 @@ class YouTubeDeepSearch:
             return
         
         # 채널 분석 창 생성
-        analysis_window = ChannelAnalysisWindow(self.root, self.youtube_api, self.selected_video)
+        analysis_window = ChannelAnalysisWindow(self.root, self.youtube_api, self.selected_video,
+                                                self.thumbnail_loader)
 
 
 class ChannelAnalysisWindow:
-    def __init__(self, parent, youtube_api, video):
+    def __init__(self, parent, youtube_api, video, thumbnail_loader):
         self.youtube_api = youtube_api
         self.video = video
+        self.thumbnail_loader = thumbnail_loader
         self.channel_videos = []
         self.selected_videos = []
         
@@ -599,17 +1003,28 @@ class ChannelAnalysisWindow:
         videos_frame = ttk.LabelFrame(main_frame, text="채널 영상 목록", padding="5")
         videos_frame.pack(fill=tk.BOTH, expand=True)
         
+        # 썸네일 미리보기 (트리뷰보다 먼저 배치해야 오른쪽 공간이 확보됨)
+        self.preview_pane = ThumbnailPreviewPane(videos_frame, self.thumbnail_loader)
+        self.preview_pane.pack(side=tk.RIGHT, anchor=tk.N, padx=(5, 0))
+        
         # 트리뷰 설정
         self.tree = CheckboxTreeview(videos_frame, config.CHANNEL_COLUMNS, config.CHANNEL_COLUMN_WIDTHS, height=15)
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # 행 삽입기 (대량 목록을 나누어 삽입)
+        self.row_inserter = ChunkedTreeInserter(self.window, self.insert_video_row)
+        
+        # 정렬기
+        self.sorter = TreeSorter(self.tree.tree, lambda: self.tree.item_data)
         
         # 콜백 함수 설정
         self.tree.sort_callback = self.sort_treeview
         self.tree.double_click_callback = self.on_video_double_click
         self.tree.selection_change_callback = self.update_selection_status
         
-        # 추가 이벤트 바인딩 (더블클릭)
+        # 추가 이벤트 바인딩 (더블클릭, 미리보기)
         self.tree.tree.bind('<Double-1>', lambda event: self.on_video_double_click())
+        self.tree.tree.bind('<<TreeviewSelect>>', self.on_preview_select)
         
         # 버튼 프레임
         button_frame = ttk.Frame(main_frame)
@@ -633,6 +1048,17 @@ class ChannelAnalysisWindow:
         # 약간의 지연 후 선택 상태 업데이트 (GUI 업데이트 후)
         self.window.after(100, self.update_selection_status)
     
+    def on_preview_select(self, event):
+        """선택한 영상의 썸네일 미리보기"""
+        selection = self.tree.tree.selection()
+        video = self.tree.get_item_data(selection[0]) if selection else None
+        if video:
+            self.preview_pane.show(
+                video, get_neighbor_items(self.tree.tree, selection[0], config.THUMBNAIL_PREVIEW_PREFETCH)
+            )
+        else:
+            self.preview_pane.clear()
+    
     def update_selection_status(self):
         """선택 상태 업데이트"""
         checked_count = len(self.tree.get_checked_items())
@@ -659,43 +1085,57 @@ class ChannelAnalysisWindow:
                 videos = self.youtube_api.get_channel_videos(self.video['channel_id'], max_results=200)
                 self.window.after(0, lambda: self.update_video_list(videos))
             except Exception as e:
-                self.window.after(0, lambda: self.show_load_error(str(e)))
+                error_msg = str(e)
+                self.window.after(0, lambda: self.show_load_error(error_msg))
         
         threading.Thread(target=load_thread, daemon=True).start()
     
     def update_video_list(self, videos):
-        """영상 목록 업데이트"""
-        self.channel_videos = videos
+        """영상 목록 업데이트 (행은 나누어 삽입)"""
+        self.row_inserter.clear()
+        self.sorter.invalidate()
+        self.channel_videos = []
         
         # 기존 항목 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         
         # 새 항목 추가
-        for video in videos:
-            # 날짜 포맷팅
-            published_date = datetime.strptime(video['published_at'][:10], '%Y-%m-%d').strftime('%Y-%m-%d')
-            
-            # 지속 시간 포맷팅
-            duration = self.format_duration(video['duration_seconds'])
-            
-            # 조회수 포맷팅
-            views = self.format_number(video['view_count'])
-            
-            # 트리뷰에 추가
-            self.tree.insert('', 'end', values=(
-                video['title'][:50] + "..." if len(video['title']) > 50 else video['title'],
-                views,
-                video['outlier_score'],
-                duration,
-                published_date
-            ))
+        self.status_label.config(text=f"영상 목록 표시 중... ({len(videos)}개)")
+        self.row_inserter.enqueue(videos)
         
-        # 상태 업데이트
-        self.status_label.config(text=f"총 {len(videos)}개 영상")
+        def finish():
+            # 상태 업데이트
+            self.status_label.config(text=f"총 {len(self.channel_videos)}개 영상")
+            
+            # 초기 선택 상태 업데이트
+            self.update_selection_status()
         
-        # 초기 선택 상태 업데이트
-        self.update_selection_status()
+        self.row_inserter.after_drain(finish)
+    
+    def insert_video_row(self, video):
+        """채널 영상 1개를 트리뷰와 channel_videos에 함께 추가 (항목 ID는 video_id)"""
+        if self.tree.get_item_data(video['video_id']) is not None:
+            return  # 이미 추가된 영상
+        
+        self.channel_videos.append(video)
+        
+        # 날짜 포맷팅 (ISO 8601 문자열의 날짜 부분)
+        published_date = video['published_at'][:10]
+        
+        # 지속 시간 포맷팅
+        duration = self.format_duration(video['duration_seconds'])
+        
+        # 조회수 포맷팅
+        views = self.format_number(video['view_count'])
+        
+        # 트리뷰에 추가
+        self.tree.insert('', 'end', iid=video['video_id'], data=video, values=(
+            video['title'][:50] + "..." if len(video['title']) > 50 else video['title'],
+            views,
+            video['outlier_score'],
+            duration,
+            published_date
+        ))
     
     def show_load_error(self, error_msg):
         """로드 오류 표시"""
@@ -718,51 +1158,10 @@ class ChannelAnalysisWindow:
     
     def sort_treeview(self, column):
         """트리뷰 정렬"""
-        # 현재 정렬 상태 확인
-        current_sort = getattr(self, f'sort_{column}', 'asc')
-        reverse = current_sort == 'desc'
-        
-        # 트리뷰의 모든 항목과 해당하는 비디오 데이터 가져오기
-        items_data = []
-        for i, child in enumerate(self.tree.get_children()):
-            if i < len(self.channel_videos):
-                video_data = self.channel_videos[i]
-                items_data.append((child, video_data))
-        
-        # 컬럼별 정렬 키 함수
-        def sort_key(item):
-            video = item[1]  # video_data
-            
-            if column == 'Title':
-                return video['title'].lower()
-            elif column == 'Views':
-                return video['view_count']
-            elif column == 'Outlier Score':
-                return video['outlier_score']
-            elif column == 'Duration':
-                return video['duration_seconds']
-            elif column == 'Published':
-                try:
-                    return datetime.strptime(video['published_at'][:10], '%Y-%m-%d')
-                except:
-                    return datetime.min
-            else:
-                return 0
-        
-        # 정렬 실행
-        items_data.sort(key=sort_key, reverse=reverse)
-        
-        # 트리뷰와 channel_videos 동시에 재정렬
-        sorted_videos = []
-        for i, (child, video_data) in enumerate(items_data):
-            self.tree.move(child, '', i)
-            sorted_videos.append(video_data)
+        order = self.sorter.sort(column)
         
-        # channel_videos 업데이트
-        self.channel_videos = sorted_videos
-        
-        # 정렬 상태 업데이트
-        setattr(self, f'sort_{column}', 'desc' if current_sort == 'asc' else 'asc')
+        # channel_videos도 같은 순서로 재정렬
+        self.channel_videos = [self.tree.get_item_data(item) for item in order]
     
     def select_all(self):
         """전체 선택"""
@@ -776,16 +1175,15 @@ class ChannelAnalysisWindow:
     def get_selected_videos(self):
         """선택된 영상들 가져오기"""
         selected_videos = []
-        checked_items = self.tree.get_checked_items()
+        checked_items = set(self.tree.get_checked_items())
         
         try:
-            for item in checked_items:
-                # 트리에서 항목의 인덱스 찾기
-                all_children = list(self.tree.get_children())
-                if item in all_children:
-                    index = all_children.index(item)
-                    if 0 <= index < len(self.channel_videos):
-                        selected_videos.append(self.channel_videos[index])
+            # 화면에 표시된 순서대로 체크된 항목의 영상 정보 조회
+            for item in self.tree.get_children():
+                if item in checked_items:
+                    video = self.tree.get_item_data(item)
+                    if video:
+                        selected_videos.append(video)
         except Exception as e:
             print(f"선택된 영상 가져오기 오류: {e}")
         
@@ -849,28 +1247,46 @@ class ChannelAnalysisWindow:
             self.window.update()
             
             def download_thread():
-                success_count = 0
-                for i, video in enumerate(selected_videos):
-                    try:
-                        # 안전한 파일명 생성
-                        safe_title = "".join(c for c in video['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                        safe_title = safe_title[:50]  # 길이 제한
-                        
-                        file_name = f"{i+1:03d}_{safe_title}_{video['video_id']}.jpg"
-                        file_path = os.path.join(folder_path, file_name)
-                        
-                        if self.youtube_api.download_thumbnail(video['thumbnail_url'], file_path):
-                            success_count += 1
-                        
-                        # 진행상황 업데이트
-                        progress = f"썸네일 다운로드 중... ({i+1}/{len(selected_videos)})"
-                        self.window.after(0, lambda p=progress: self.status_label.config(text=p))
-                        
-                    except Exception as e:
-                        print(f"썸네일 다운로드 오류 ({video['title']}): {e}")
+                # 파일명은 영상 ID 기준이므로 선택/정렬 순서와 관계없이 같은 영상은 같은 경로가 되어
+                # 다시 내보내면 기존 파일은 건너뜀
+                items = []
+                for video in selected_videos:
+                    # 안전한 파일명 생성
+                    safe_title = "".join(c for c in video['title'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                    safe_title = safe_title[:50]  # 길이 제한
+                    
+                    file_name = f"{video['video_id']}_{safe_title}.jpg"
+                    items.append((video['video_id'], os.path.join(folder_path, file_name)))
+                
+                def on_progress(done, total, result):
+                    # 진행상황 업데이트
+                    progress = f"썸네일 다운로드 중... ({done}/{total})"
+                    self.window.after(0, lambda p=progress: self.status_label.config(text=p))
                 
-                # 완료 메시지
-                message = f"썸네일 다운로드 완료!\n성공: {success_count}/{len(selected_videos)}"
+                try:
+                    results = self.youtube_api.export_thumbnails(items, progress_callback=on_progress)
+                except Exception as e:
+                    error_msg = str(e)
+                    print(f"썸네일 다운로드 오류: {error_msg}")
+                    self.window.after(0, lambda: messagebox.showerror("오류", f"썸네일 다운로드 중 오류가 발생했습니다:\n{error_msg}"))
+                    return
+                
+                downloaded = [r for r in results if r['status'] == STATUS_DOWNLOADED]
+                skipped = [r for r in results if r['status'] == STATUS_SKIPPED]
+                failed = [r for r in results if r['status'] == STATUS_FAILED]
+                
+                http_stats = self.youtube_api.get_http_stats()
+                print(f"썸네일 HTTP 연결 {http_stats['connections']}개, 재사용률 {http_stats['reuse_rate']:.0f}%")
+                
+                # 완료 메시지 (실패한 파일은 최대 10개까지 표시)
+                message = (f"썸네일 다운로드 완료!\n성공: {len(downloaded) + len(skipped)}/{len(selected_videos)}"
+                           f" (기존 파일 {len(skipped)}개 건너뜀)")
+                if failed:
+                    title_by_id = {video['video_id']: video['title'] for video in selected_videos}
+                    failed_lines = [f"- {title_by_id.get(r['video_id'], r['video_id'])[:40]}: {r['error']}" for r in failed[:10]]
+                    if len(failed) > 10:
+                        failed_lines.append(f"... 외 {len(failed) - 10}개")
+                    message += f"\n\n실패 {len(failed)}개:\n" + "\n".join(failed_lines)
                 self.window.after(0, lambda: messagebox.showinfo("완료", message))
                 self.window.after(0, lambda: self.status_label.config(text=f"총 {len(self.channel_videos)}개 영상"))
             
@@ -893,86 +1309,31 @@ class ChannelAnalysisWindow:
             
             def extract_thread():
                 extracted_count = 0
+                completed_count = 0
+                log_lock = threading.Lock()
                 
                 try:
-                    for i, video in enumerate(selected_videos):
-                        try:
+                    # 파일 경로를 미리 정해 동시 작업 간 파일명 충돌 방지
+                    reserved_paths = set()
+                    jobs = [(video, self._reserve_transcript_path(folder_path, video, reserved_paths))
+                            for video in selected_videos]
+                    
+                    with ThreadPoolExecutor(max_workers=config.TRANSCRIPT_MAX_WORKERS) as executor:
+                        futures = [
+                            executor.submit(self._extract_single_transcript, video, file_path, folder_path, log_lock)
+                            for video, file_path in jobs
+                        ]
+                        
+                        for future in as_completed(futures):
+                            completed_count += 1
+                            if future.result():
+                                extracted_count += 1
+                            
                             # 진행상황 업데이트
-                            progress = f"대본 추출 중... ({i+1}/{len(selected_videos)})"
+                            progress = f"대본 추출 중... ({completed_count}/{len(selected_videos)})"
                             def update_progress(text=progress):
                                 self.status_label.config(text=text)
                             self.window.after(0, update_progress)
-                            
-                            # 안전한 파일명 생성: "채널명 : 영상제목" (Windows에서는 콜론을 언더스코어로 변경)
-                            channel_name = "".join(c for c in video['channel_title'] if c.isalnum() or c in (' ', '-', '_')).strip()
-                            video_title = "".join(c for c in video['title'] if c.isalnum() or c in (' ', '-', '_')).strip()
-                            
-                            # 파일명 길이 제한
-                            channel_name = channel_name[:30]
-                            video_title = video_title[:50]
-                            
-                            filename = f"{channel_name} _ {video_title}.txt"
-                            file_path = os.path.join(folder_path, filename)
-                            
-                            # 중복 파일명 처리
-                            counter = 1
-                            original_path = file_path
-                            while os.path.exists(file_path):
-                                name, ext = os.path.splitext(original_path)
-                                file_path = f"{name}_{counter}{ext}"
-                                counter += 1
-                            
-                            # 대본 가져오기 (개선된 오류 처리)
-                            try:
-                                # 진행상황 표시
-                                def update_detailed_progress(text=f"대본 추출 중... ({video['title'][:30]}...)"):
-                                    self.status_label.config(text=text)
-                                self.window.after(0, update_detailed_progress)
-                                
-                                transcript = self.youtube_api.get_video_transcript(video['video_id'], use_whisper=True)
-                                
-                                if transcript and transcript.strip():
-                                    # 성공적으로 추출된 경우
-                                    if "오류가 발생했습니다" in transcript or "추출할 수 없습니다" in transcript or "자막이 없는 영상입니다" in transcript:
-                                        # 오류 메시지인 경우 - 오류 로그에만 기록
-                                        print(f"대본 추출 실패: {video['title'][:50]}... - {transcript}")
-                                        # 오류인 경우 파일을 생성하지 않고 다음 영상으로
-                                    else:
-                                        # 정상적인 대본인 경우 - 대본 내용만 저장
-                                        with open(file_path, 'w', encoding='utf-8') as f:
-                                            f.write(transcript)
-                                        extracted_count += 1
-                                        print(f"대본 추출 성공: {video['title'][:50]}...")
-                                else:
-                                    print(f"대본 추출 실패: {video['title'][:50]}... - 대본이 없거나 비공개 영상")
-                                    # 실패한 경우 파일을 생성하지 않음
-                                    
-                            except Exception as transcript_error:
-                                print(f"대본 추출 오류: {video['title'][:50]}... - {str(transcript_error)[:100]}...")
-                                # 오류인 경우 파일을 생성하지 않음
-                                
-                                # 요청 간격 조정 (API 제한 방지)
-                                import time
-                                time.sleep(0.5)
-                                
-                        except Exception as e:
-                            error_msg = f"파일 생성 오류: {e}"
-                            print(f"파일 생성 오류 ({video['title']}): {e}")
-                            
-                            # 상세 오류 로그 파일 생성
-                            try:
-                                error_file = os.path.join(folder_path, "오류_로그.txt")
-                                with open(error_file, 'a', encoding='utf-8') as ef:
-                                    ef.write(f"{'='*80}\n")
-                                    ef.write(f"오류 발생 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                                    ef.write(f"영상 제목: {video['title']}\n")
-                                    ef.write(f"영상 ID: {video['video_id']}\n")
-                                    ef.write(f"채널명: {video['channel_title']}\n")
-                                    ef.write(f"오류 내용: {error_msg}\n")
-                                    ef.write(f"영상 URL: {video['url']}\n")
-                                    ef.write(f"{'='*80}\n\n")
-                            except Exception as log_error:
-                                print(f"오류 로그 작성 실패: {log_error}")
                     
                     # 완료 메시지
                     message = f"대본 추출 완료!\n\n"
@@ -989,8 +1350,9 @@ class ChannelAnalysisWindow:
                     self.window.after(0, show_complete)
                     
                 except Exception as e:
+                    error_msg = str(e)  # except 블록이 끝나면 e가 삭제되므로 미리 저장
                     def show_error():
-                        messagebox.showerror("저장 오류", f"대본 추출 중 오류가 발생했습니다:\n{e}")
+                        messagebox.showerror("저장 오류", f"대본 추출 중 오류가 발생했습니다:\n{error_msg}")
                     self.window.after(0, show_error)
                 
                 def reset_status():
@@ -999,14 +1361,90 @@ class ChannelAnalysisWindow:
             
             threading.Thread(target=extract_thread, daemon=True).start()
     
+    def _reserve_transcript_path(self, folder_path, video, reserved_paths):
+        """대본 파일 경로 생성 (기존 파일 및 이미 예약된 경로와 겹치지 않도록)"""
+        # 안전한 파일명 생성: "채널명 : 영상제목" (Windows에서는 콜론을 언더스코어로 변경)
+        channel_name = "".join(c for c in video['channel_title'] if c.isalnum() or c in (' ', '-', '_')).strip()
+        video_title = "".join(c for c in video['title'] if c.isalnum() or c in (' ', '-', '_')).strip()
+        
+        # 파일명 길이 제한
+        channel_name = channel_name[:30]
+        video_title = video_title[:50]
+        
+        filename = f"{channel_name} _ {video_title}.txt"
+        file_path = os.path.join(folder_path, filename)
+        
+        # 중복 파일명 처리
+        counter = 1
+        original_path = file_path
+        while os.path.exists(file_path) or file_path in reserved_paths:
+            name, ext = os.path.splitext(original_path)
+            file_path = f"{name}_{counter}{ext}"
+            counter += 1
+        
+        reserved_paths.add(file_path)
+        return file_path
+    
+    def _extract_single_transcript(self, video, file_path, folder_path, log_lock):
+        """영상 1개의 대본을 추출하여 저장 (작업 스레드에서 실행, 성공 여부 반환)"""
+        try:
+            # 대본 가져오기 (개선된 오류 처리)
+            try:
+                # 진행상황 표시
+                def update_detailed_progress(text=f"대본 추출 중... ({video['title'][:30]}...)"):
+                    self.status_label.config(text=text)
+                self.window.after(0, update_detailed_progress)
+                
+                # Whisper 처리 진행상황 (작업 프로세스에서 전달)
+                def whisper_progress(message, title=video['title'][:30]):
+                    self.window.after(0, lambda: self.status_label.config(text=f"{message} ({title}...)"))
+                
+                transcript = self.youtube_api.get_video_transcript(
+                    video['video_id'], use_whisper=True, progress_callback=whisper_progress
+                )
+                
+                if transcript and transcript.strip():
+                    # 성공적으로 추출된 경우 - 대본 내용만 저장 (실패하면 None)
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(transcript)
+                    print(f"대본 추출 성공: {video['title'][:50]}...")
+                    return True
+                else:
+                    print(f"대본 추출 실패: {video['title'][:50]}... - 대본이 없거나 비공개 영상")
+                    # 실패한 경우 파일을 생성하지 않음
+                    
+            except Exception as transcript_error:
+                print(f"대본 추출 오류: {video['title'][:50]}... - {str(transcript_error)[:100]}...")
+                # 오류인 경우 파일을 생성하지 않음
+                
+        except Exception as e:
+            error_msg = f"파일 생성 오류: {e}"
+            print(f"파일 생성 오류 ({video['title']}): {e}")
+            
+            # 상세 오류 로그 파일 생성 (여러 작업이 동시에 기록하므로 잠금)
+            try:
+                error_file = os.path.join(folder_path, "오류_로그.txt")
+                with log_lock, open(error_file, 'a', encoding='utf-8') as ef:
+                    ef.write(f"{'='*80}\n")
+                    ef.write(f"오류 발생 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    ef.write(f"영상 제목: {video['title']}\n")
+                    ef.write(f"영상 ID: {video['video_id']}\n")
+                    ef.write(f"채널명: {video['channel_title']}\n")
+                    ef.write(f"오류 내용: {error_msg}\n")
+                    ef.write(f"영상 URL: {video['url']}\n")
+                    ef.write(f"{'='*80}\n\n")
+            except Exception as log_error:
+                print(f"오류 로그 작성 실패: {log_error}")
+        
+        return False
+    
     def on_video_double_click(self):
         """영상 더블클릭 이벤트"""
         try:
             selection = self.tree.tree.selection()
             if selection:
-                index = list(self.tree.tree.get_children()).index(selection[0])
-                if 0 <= index < len(self.channel_videos):
-                    video = self.channel_videos[index]
+                video = self.tree.get_item_data(selection[0])
+                if video:
                     webbrowser.open(video['url'])
         except Exception as e:
             print(f"더블클릭 이벤트 오류: {e}")
@@ -1032,6 +1470,12 @@ def main():
     root = tk.Tk()
     app = YouTubeDeepSearch(root)
     root.mainloop()
+    
+    # 백그라운드 작업 프로세스 정리
+    if hasattr(app, 'thumbnail_loader'):
+        app.thumbnail_loader.close()
+    if hasattr(app, 'youtube_api'):
+        app.youtube_api.shutdown()
 
 
 if __name__ == "__main__":
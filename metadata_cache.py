@@ -0,0 +1,306 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+
+import config
+
+
+# 영상 필드 중 자주 변하는 통계 필드 (짧은 TTL)
+VIDEO_STATS_FIELDS = ('view_count', 'like_count', 'comment_count')
+
+# 채널 필드 중 자주 변하는 통계 필드 (짧은 TTL)
+CHANNEL_STATS_FIELDS = ('subscriber_count',)
+
+# 캐시에 저장하지 않는 파생 필드
+VIDEO_DERIVED_FIELDS = ('subscriber_count', 'outlier_score', 'outlier_scores', 'channel_median_views')
+
+
+class MetadataCache:
+    """
+    영상/채널 메타데이터 SQLite 캐시
+
+    제목, 길이, 채널 ID 같은 정적 필드와 조회수, 구독자 수 같은 통계 필드를
+    서로 다른 TTL로 관리합니다. 채널별 최근 업로드 조회수 기준값과
+    채널 영상 목록 동기화 상태(업로드 영상 ID 목록)도 함께 보관합니다.
+    여러 스레드에서 동시에 사용할 수 있습니다.
+    """
+
+    def __init__(self, db_path=None, static_ttl=None, video_stats_ttl=None, channel_stats_ttl=None,
+                 baseline_ttl=None, sync_ttl=None):
+        self.db_path = db_path or config.METADATA_CACHE_PATH
+        self.static_ttl = static_ttl if static_ttl is not None else config.CACHE_STATIC_TTL
+        self.video_stats_ttl = video_stats_ttl if video_stats_ttl is not None else config.CACHE_VIDEO_STATS_TTL
+        self.channel_stats_ttl = channel_stats_ttl if channel_stats_ttl is not None else config.CACHE_CHANNEL_STATS_TTL
+        self.baseline_ttl = baseline_ttl if baseline_ttl is not None else config.CHANNEL_BASELINE_TTL
+        self.sync_ttl = sync_ttl if sync_ttl is not None else config.CHANNEL_SYNC_TTL
+
+        self._lock = threading.Lock()
+        self._counters = {
+            'video_hits': 0,
+            'video_misses': 0,
+            'channel_hits': 0,
+            'channel_misses': 0,
+            'baseline_hits': 0,
+            'baseline_misses': 0,
+        }
+
+        self._conn = self._connect()
+
+    def _connect(self):
+        """DB 연결 및 테이블 생성 (실패 시 메모리 DB 사용)"""
+        try:
+            if self.db_path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: 메타데이터 캐시 파일을 열 수 없어 메모리 캐시를 사용합니다: {e}")
+            self.db_path = ':memory:'
+            conn = sqlite3.connect(':memory:', check_same_thread=False)
+
+        for table, key in (('videos', 'video_id'), ('channels', 'channel_id')):
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                f"{key} TEXT PRIMARY KEY, "
+                "static_data TEXT, static_updated_at REAL, "
+                "stats_data TEXT, stats_updated_at REAL)"
+            )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS channel_baselines ("
+            "channel_id TEXT PRIMARY KEY, data TEXT, updated_at REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS channel_sync ("
+            "channel_id TEXT PRIMARY KEY, video_ids TEXT, exhausted INTEGER, synced_at REAL)"
+        )
+        conn.commit()
+        return conn
+
+    def _load_rows(self, table, key, ids):
+        """ID 목록에 해당하는 행 조회"""
+        rows = {}
+        ids = list(dict.fromkeys(ids))
+        # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT {key}, static_data, static_updated_at, stats_data, stats_updated_at "
+                f"FROM {table} WHERE {key} IN ({placeholders})",
+                chunk
+            )
+            for row in cursor:
+                rows[row[0]] = row[1:]
+        return rows
+
+    def _is_fresh(self, updated_at, ttl, now):
+        return updated_at is not None and (now - updated_at) < ttl
+
+    def get_videos(self, video_ids):
+        """
+        캐시된 영상 정보 조회
+
+        Returns:
+            dict: {video_id: {'static': dict, 'stats': dict 또는 None}}
+                  정적 필드가 없거나 만료된 영상은 포함되지 않으며,
+                  통계 필드만 만료된 경우 'stats'가 None
+        """
+        now = time.time()
+        result = {}
+
+        with self._lock:
+            rows = self._load_rows('videos', 'video_id', video_ids)
+
+            for video_id in dict.fromkeys(video_ids):
+                row = rows.get(video_id)
+                if not row or not row[0] or not self._is_fresh(row[1], self.static_ttl, now):
+                    self._counters['video_misses'] += 1
+                    continue
+
+                stats = None
+                if row[2] and self._is_fresh(row[3], self.video_stats_ttl, now):
+                    stats = json.loads(row[2])
+                    self._counters['video_hits'] += 1
+                else:
+                    self._counters['video_misses'] += 1
+
+                result[video_id] = {'static': json.loads(row[0]), 'stats': stats}
+
+        return result
+
+    def put_videos(self, videos):
+        """영상 정보 전체 저장 (정적 + 통계 필드)"""
+        now = time.time()
+        records = []
+        for video in videos:
+            static = {k: v for k, v in video.items()
+                      if k not in VIDEO_STATS_FIELDS and k not in VIDEO_DERIVED_FIELDS}
+            stats = {k: video[k] for k in VIDEO_STATS_FIELDS if k in video}
+            records.append((video['video_id'], json.dumps(static, ensure_ascii=False), now,
+                            json.dumps(stats), now))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO videos "
+                "(video_id, static_data, static_updated_at, stats_data, stats_updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                records
+            )
+            self._conn.commit()
+
+    def put_video_stats(self, stats_by_id):
+        """영상 통계 필드만 갱신"""
+        now = time.time()
+        records = [(json.dumps(stats), now, video_id) for video_id, stats in stats_by_id.items()]
+
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE videos SET stats_data = ?, stats_updated_at = ? WHERE video_id = ?",
+                records
+            )
+            self._conn.commit()
+
+    def get_channels(self, channel_ids):
+        """
+        캐시된 채널 통계 조회
+
+        Returns:
+            dict: {channel_id: {'subscriber_count': int, ...}} (만료되지 않은 항목만)
+        """
+        now = time.time()
+        result = {}
+
+        with self._lock:
+            rows = self._load_rows('channels', 'channel_id', channel_ids)
+
+            for channel_id in dict.fromkeys(channel_ids):
+                row = rows.get(channel_id)
+                if row and row[2] and self._is_fresh(row[3], self.channel_stats_ttl, now):
+                    result[channel_id] = json.loads(row[2])
+                    self._counters['channel_hits'] += 1
+                else:
+                    self._counters['channel_misses'] += 1
+
+        return result
+
+    def put_channels(self, channels_info):
+        """채널 통계 저장 ({channel_id: {'subscriber_count': int, ...}})"""
+        now = time.time()
+        records = []
+        for channel_id, info in channels_info.items():
+            stats = {k: info[k] for k in CHANNEL_STATS_FIELDS if k in info}
+            records.append((channel_id, json.dumps(stats), now))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO channels (channel_id, stats_data, stats_updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(channel_id) DO UPDATE SET "
+                "stats_data = excluded.stats_data, stats_updated_at = excluded.stats_updated_at",
+                records
+            )
+            self._conn.commit()
+
+    def get_channel_baselines(self, channel_ids):
+        """
+        캐시된 채널 조회수 기준값 조회
+
+        Returns:
+            dict: {channel_id: {'median_views': float, 'sample_size': int}} (만료되지 않은 항목만)
+        """
+        now = time.time()
+        result = {}
+        ids = list(dict.fromkeys(channel_ids))
+
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = self._conn.execute(
+                    f"SELECT channel_id, data, updated_at FROM channel_baselines WHERE channel_id IN ({placeholders})",
+                    chunk
+                )
+                for channel_id, data, updated_at in cursor:
+                    if data and self._is_fresh(updated_at, self.baseline_ttl, now):
+                        result[channel_id] = json.loads(data)
+
+            self._counters['baseline_hits'] += len(result)
+            self._counters['baseline_misses'] += len(ids) - len(result)
+
+        return result
+
+    def put_channel_baselines(self, baselines):
+        """채널 조회수 기준값 저장 ({channel_id: {'median_views': float, 'sample_size': int}})"""
+        now = time.time()
+        records = [(channel_id, json.dumps(baseline), now) for channel_id, baseline in baselines.items()]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO channel_baselines (channel_id, data, updated_at) VALUES (?, ?, ?)",
+                records
+            )
+            self._conn.commit()
+
+    def get_channel_sync(self, channel_id):
+        """
+        채널 영상 목록 동기화 상태 조회
+
+        Returns:
+            dict: {'video_ids': 최신순 업로드 영상 ID 목록, 'exhausted': 재생목록 끝까지 읽었는지 여부}
+                  (기록이 없거나 마지막 전체 읽기 후 CHANNEL_SYNC_TTL이 지났으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT video_ids, exhausted, synced_at FROM channel_sync WHERE channel_id = ?",
+                (channel_id,)
+            ).fetchone()
+
+        if not row or not row[0] or not self._is_fresh(row[2], self.sync_ttl, time.time()):
+            return None
+        return {'video_ids': json.loads(row[0]), 'exhausted': bool(row[1])}
+
+    def put_channel_sync(self, channel_id, video_ids, exhausted, full_sync=True):
+        """
+        채널 영상 목록 동기화 상태 저장 (video_ids는 최신순)
+
+        synced_at은 업로드 목록을 처음부터 읽은 시각입니다. 새 업로드만 확인한 증분
+        동기화(full_sync=False)는 목록만 갱신하고 시각은 그대로 두므로, 자주 여는 채널도
+        CHANNEL_SYNC_TTL마다 전체 목록을 다시 읽습니다.
+        """
+        with self._lock:
+            if full_sync:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO channel_sync (channel_id, video_ids, exhausted, synced_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (channel_id, json.dumps(list(video_ids)), int(exhausted), time.time())
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE channel_sync SET video_ids = ?, exhausted = ? WHERE channel_id = ?",
+                    (json.dumps(list(video_ids)), int(exhausted), channel_id)
+                )
+            self._conn.commit()
+
+    def get_stats(self):
+        """캐시 적중/미스 카운터 반환"""
+        with self._lock:
+            stats = dict(self._counters)
+
+        for kind in ('video', 'channel', 'baseline'):
+            total = stats[f'{kind}_hits'] + stats[f'{kind}_misses']
+            stats[f'{kind}_hit_rate'] = (stats[f'{kind}_hits'] / total * 100) if total else 0.0
+
+        return stats
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM videos")
+            self._conn.execute("DELETE FROM channels")
+            self._conn.execute("DELETE FROM channel_baselines")
+            self._conn.execute("DELETE FROM channel_sync")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,318 @@
+import math
+import statistics
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    print("Warning: numpy not installed. Outlier scores will be computed without vectorization.")
+
+import config
+
+
+# 점수 종류 (GUI 선택 목록 순서)
+SCORE_ZSCORE = 'zscore'          # 조회수/구독자 비율 z-score의 절댓값 (기존 방식)
+SCORE_SIGNED = 'signed'          # 조회수/구독자 비율 z-score (음수는 평소보다 저조)
+SCORE_LOG_ZSCORE = 'log_zscore'  # log(조회수/구독자) z-score
+SCORE_ROBUST = 'robust'          # log(조회수/구독자)의 중앙값/MAD 기반 점수 (극단값 영향 적음)
+SCORE_CHANNEL = 'channel'        # 조회수 / 채널 최근 업로드 조회수 중앙값 (채널 기준값 필요)
+
+# 결과 집합 통계로 계산하는 점수
+STATISTIC_METHODS = [SCORE_ZSCORE, SCORE_SIGNED, SCORE_LOG_ZSCORE, SCORE_ROBUST]
+SCORE_METHODS = STATISTIC_METHODS + [SCORE_CHANNEL]
+
+# MAD를 정규분포 표준편차 척도로 맞추는 계수
+MAD_SCALE = 1.4826
+
+
+def compute_outlier_scores(view_counts, subscriber_counts):
+    """
+    여러 Outlier score를 한 번에 계산
+
+    구독자 수가 0(비공개)인 영상은 비율 0으로 보고 기존 z-score에만 포함하며,
+    로그/중앙값 기반 점수에서는 통계에서 제외하고 점수 0을 줍니다.
+
+    Args:
+        view_counts (sequence): 조회수 목록
+        subscriber_counts (sequence): 구독자 수 목록 (view_counts와 같은 순서)
+
+    Returns:
+        dict: {점수 종류: 점수 목록 (numpy 배열 또는 list)}
+    """
+    if NUMPY_AVAILABLE:
+        return _compute_numpy(view_counts, subscriber_counts)
+    return _compute_python(view_counts, subscriber_counts)
+
+
+def _compute_numpy(view_counts, subscriber_counts):
+    views = np.asarray(view_counts, dtype=np.float64)
+    subs = np.asarray(subscriber_counts, dtype=np.float64)
+    n = len(views)
+    if n == 0:
+        return {method: np.zeros(0) for method in STATISTIC_METHODS}
+
+    valid = subs > 0
+    ratio = np.divide(views, subs, out=np.zeros(n), where=valid)
+
+    # 비율 z-score (표본 표준편차, 1개뿐이면 1)
+    std = ratio.std(ddof=1) if n > 1 else 1.0
+    signed = (ratio - ratio.mean()) / std if std > 0 else np.zeros(n)
+
+    # 로그 비율 기반 점수 (유효한 영상만 통계에 사용)
+    log_zscore = np.zeros(n)
+    robust = np.zeros(n)
+    if valid.any():
+        log_ratio = np.log1p(views[valid]) - np.log1p(subs[valid])
+        log_std = log_ratio.std(ddof=1) if len(log_ratio) > 1 else 1.0
+        if log_std > 0:
+            log_zscore[valid] = (log_ratio - log_ratio.mean()) / log_std
+
+        median = np.median(log_ratio)
+        mad = np.median(np.abs(log_ratio - median)) * MAD_SCALE
+        if mad > 0:
+            robust[valid] = (log_ratio - median) / mad
+
+    return {
+        SCORE_ZSCORE: np.abs(signed),
+        SCORE_SIGNED: signed,
+        SCORE_LOG_ZSCORE: log_zscore,
+        SCORE_ROBUST: robust,
+    }
+
+
+def _compute_python(view_counts, subscriber_counts):
+    """numpy가 없을 때 사용하는 동일한 계산"""
+    n = len(view_counts)
+    if n == 0:
+        return {method: [] for method in STATISTIC_METHODS}
+
+    ratios = [views / subs if subs > 0 else 0 for views, subs in zip(view_counts, subscriber_counts)]
+    mean = statistics.mean(ratios)
+    std = statistics.stdev(ratios) if n > 1 else 1.0
+    signed = [(ratio - mean) / std if std > 0 else 0.0 for ratio in ratios]
+
+    log_zscore = [0.0] * n
+    robust = [0.0] * n
+    valid_indices = [i for i, subs in enumerate(subscriber_counts) if subs > 0]
+    if valid_indices:
+        log_ratios = [math.log1p(view_counts[i]) - math.log1p(subscriber_counts[i]) for i in valid_indices]
+        log_mean = statistics.mean(log_ratios)
+        log_std = statistics.stdev(log_ratios) if len(log_ratios) > 1 else 1.0
+        median = statistics.median(log_ratios)
+        mad = statistics.median([abs(value - median) for value in log_ratios]) * MAD_SCALE
+
+        for i, value in zip(valid_indices, log_ratios):
+            if log_std > 0:
+                log_zscore[i] = (value - log_mean) / log_std
+            if mad > 0:
+                robust[i] = (value - median) / mad
+
+    return {
+        SCORE_ZSCORE: [abs(value) for value in signed],
+        SCORE_SIGNED: signed,
+        SCORE_LOG_ZSCORE: log_zscore,
+        SCORE_ROBUST: robust,
+    }
+
+
+class OutlierStats:
+    """
+    Outlier score용 누적 통계 (영상을 추가할 때마다 갱신)
+
+    비율과 로그 비율의 평균/분산은 Welford 방식(개수, 평균, M2)으로 누적하고,
+    중앙값/MAD는 로그 비율의 고정 폭 히스토그램으로 근사합니다 (오차는 bin_width 이내).
+    페이지 단위로 결과가 늘어나도 추가된 영상만큼만 계산하면 되며,
+    점수는 현재 통계를 기준으로 필요한 영상만 매깁니다.
+    """
+
+    def __init__(self, bin_width=None):
+        self.bin_width = bin_width or config.OUTLIER_MEDIAN_BIN_WIDTH
+
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        self.log_count = 0
+        self._log_mean = 0.0
+        self._log_m2 = 0.0
+        self._histogram = {}  # {bin 번호: 개수}
+
+        self._summary = None
+
+    def add(self, view_count, subscriber_count):
+        """영상 1개의 통계 추가"""
+        ratio = view_count / subscriber_count if subscriber_count > 0 else 0
+        self.count += 1
+        delta = ratio - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (ratio - self._mean)
+
+        if subscriber_count > 0:
+            log_ratio = math.log1p(view_count) - math.log1p(subscriber_count)
+            self.log_count += 1
+            delta = log_ratio - self._log_mean
+            self._log_mean += delta / self.log_count
+            self._log_m2 += delta * (log_ratio - self._log_mean)
+
+            key = math.floor(log_ratio / self.bin_width)
+            self._histogram[key] = self._histogram.get(key, 0) + 1
+
+        self._summary = None
+
+    def add_videos(self, videos):
+        for video in videos:
+            self.add(video['view_count'], video['subscriber_count'])
+
+    def _approximate_median(self):
+        """히스토그램에서 로그 비율 중앙값 근사 (bin 내부는 선형 보간)"""
+        target = self.log_count / 2
+        cumulative = 0
+        for key in sorted(self._histogram):
+            count = self._histogram[key]
+            if cumulative + count >= target:
+                return (key + (target - cumulative) / count) * self.bin_width
+            cumulative += count
+        return 0.0
+
+    def _approximate_mad(self, median):
+        """히스토그램에서 중앙값과의 절대편차의 중앙값 근사 (bin 중심 기준)"""
+        distances = sorted(
+            (abs((key + 0.5) * self.bin_width - median), count) for key, count in self._histogram.items()
+        )
+        target = self.log_count / 2
+        cumulative = 0
+        for distance, count in distances:
+            cumulative += count
+            if cumulative >= target:
+                return distance
+        return 0.0
+
+    def summary(self):
+        """현재 통계 요약 (다음 add 전까지 재사용)"""
+        if self._summary is None:
+            median = self._approximate_median() if self.log_count else 0.0
+            self._summary = {
+                'count': self.count,
+                'mean': self._mean,
+                # 표본 표준편차 (1개뿐이면 1, compute_outlier_scores와 동일)
+                'std': math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 1.0,
+                'log_count': self.log_count,
+                'log_mean': self._log_mean,
+                'log_std': math.sqrt(self._log_m2 / (self.log_count - 1)) if self.log_count > 1 else 1.0,
+                'median': median,
+                'mad': self._approximate_mad(median) * MAD_SCALE if self.log_count else 0.0,
+            }
+        return self._summary
+
+    def score(self, view_count, subscriber_count):
+        """현재 통계 기준 영상 1개의 점수 {점수 종류: 점수}"""
+        stats = self.summary()
+        ratio = view_count / subscriber_count if subscriber_count > 0 else 0
+        signed = (ratio - stats['mean']) / stats['std'] if stats['std'] > 0 else 0.0
+
+        log_zscore = 0.0
+        robust = 0.0
+        if subscriber_count > 0:
+            log_ratio = math.log1p(view_count) - math.log1p(subscriber_count)
+            if stats['log_std'] > 0:
+                log_zscore = (log_ratio - stats['log_mean']) / stats['log_std']
+            if stats['mad'] > 0:
+                robust = (log_ratio - stats['median']) / stats['mad']
+
+        return {
+            SCORE_ZSCORE: abs(signed),
+            SCORE_SIGNED: signed,
+            SCORE_LOG_ZSCORE: log_zscore,
+            SCORE_ROBUST: robust,
+        }
+
+    def score_videos(self, videos, method=None):
+        """
+        영상 목록에 현재 통계 기준 점수 기록 (apply_outlier_scores와 같은 형식)
+
+        통계는 다시 계산하지 않으므로 전달한 영상 수만큼만 시간이 걸립니다.
+        """
+        for video in videos:
+            scores = self.score(video['view_count'], video['subscriber_count'])
+            video.setdefault('outlier_scores', {}).update(
+                (name, round(value, 2) + 0.0) for name, value in scores.items()
+            )
+        select_outlier_score(videos, method)
+
+
+def compute_video_scores(videos):
+    """
+    영상 목록의 Outlier score 배열 계산 (영상 dict는 수정하지 않음)
+
+    대량의 영상(캐시된 수만~수십만 개)을 오프라인으로 분석할 때는 이 함수로 점수 배열만
+    받는 것이 가장 빠릅니다. 영상마다 점수를 기록하는 apply_outlier_scores는
+    dict를 하나씩 수정하므로 영상 수에 비례하는 Python 루프 비용이 추가됩니다.
+
+    Returns:
+        dict: {점수 종류: 점수 목록 (videos와 같은 순서)}
+    """
+    if NUMPY_AVAILABLE:
+        count = len(videos)
+        views = np.fromiter((video['view_count'] for video in videos), dtype=np.float64, count=count)
+        subs = np.fromiter((video['subscriber_count'] for video in videos), dtype=np.float64, count=count)
+        return compute_outlier_scores(views, subs)
+    return compute_outlier_scores(
+        [video['view_count'] for video in videos],
+        [video['subscriber_count'] for video in videos]
+    )
+
+
+def apply_outlier_scores(videos, method=None):
+    """
+    영상 목록에 Outlier score 기록
+
+    모든 점수 종류를 video['outlier_scores']에 저장하고, 선택한 점수를
+    video['outlier_score']에 기록합니다 (소수점 2자리).
+    """
+    if not videos:
+        return
+
+    scores = compute_video_scores(videos)
+    # + 0.0은 반올림으로 생긴 -0.0을 0.0으로 표시하기 위함
+    if NUMPY_AVAILABLE:
+        columns = [(np.round(values, 2) + 0.0).tolist() for values in scores.values()]
+    else:
+        columns = [[round(value, 2) + 0.0 for value in values] for values in scores.values()]
+
+    names = list(scores)
+    method = method or config.OUTLIER_SCORE_METHOD
+    selected = names.index(method) if method in names else None
+    for video, row in zip(videos, zip(*columns)):
+        existing = video.get('outlier_scores')
+        if existing is None:
+            existing = video['outlier_scores'] = dict(zip(names, row))
+        else:
+            existing.update(zip(names, row))
+        video['outlier_score'] = row[selected] if selected is not None else existing.get(method, 0)
+
+
+def apply_channel_scores(videos, baselines, method=None):
+    """
+    채널 기준 점수 기록 (조회수가 채널 최근 업로드 조회수 중앙값의 몇 배인지)
+
+    기준값이 없는 채널(할당량 부족 등으로 조회하지 못함)의 영상은 0점입니다.
+
+    Args:
+        videos (list): 영상 목록
+        baselines (dict): {channel_id: {'median_views': float, 'sample_size': int}}
+    """
+    for video in videos:
+        baseline = baselines.get(video.get('channel_id'))
+        median_views = baseline['median_views'] if baseline else 0
+        video['channel_median_views'] = median_views if baseline else None
+        score = round(video['view_count'] / median_views, 2) if median_views > 0 else 0.0
+        video.setdefault('outlier_scores', {})[SCORE_CHANNEL] = score
+    select_outlier_score(videos, method)
+
+
+def select_outlier_score(videos, method=None):
+    """이미 계산된 점수 중 표시할 점수 선택 (재계산 없음)"""
+    method = method or config.OUTLIER_SCORE_METHOD
+    for video in videos:
+        video['outlier_score'] = video.get('outlier_scores', {}).get(method, 0)
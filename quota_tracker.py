@@ -0,0 +1,126 @@
+import os
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import config
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # tzdata가 없는 환경에서는 PST 고정 오프셋 사용
+    PACIFIC_TZ = timezone(timedelta(hours=-8))
+
+
+def current_quota_day():
+    """YouTube API 할당량 기준일 (태평양 시간 자정에 초기화)"""
+    return datetime.now(PACIFIC_TZ).strftime("%Y-%m-%d")
+
+
+class QuotaTracker:
+    """
+    스레드 안전 API 할당량 사용량 추적기
+
+    엔드포인트별 단위 비용을 누적하고, 태평양 시간 기준 하루 단위로
+    사용량을 파일에 저장하여 프로그램을 다시 실행해도 유지합니다.
+    """
+
+    def __init__(self, state_path=None, limit=None, warning_threshold=None):
+        self.state_path = state_path or config.QUOTA_STATE_PATH
+        self.limit = limit if limit is not None else config.QUOTA_DAILY_LIMIT
+        self.warning_threshold = (warning_threshold if warning_threshold is not None
+                                  else config.QUOTA_WARNING_THRESHOLD)
+
+        self._lock = threading.Lock()
+        self._day = current_quota_day()
+        self._used = 0
+        self._by_endpoint = {}
+        self._load()
+
+    def _load(self):
+        """저장된 사용량 불러오기 (같은 할당량 기준일인 경우만)"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('day') == self._day:
+                self._used = int(state.get('used', 0))
+                self._by_endpoint = dict(state.get('by_endpoint', {}))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"할당량 기록 불러오기 오류: {e}")
+
+    def _save(self):
+        """현재 사용량 저장 (잠금을 잡은 상태에서 호출)"""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+            tmp_path = self.state_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'day': self._day, 'used': self._used, 'by_endpoint': self._by_endpoint}, f)
+            os.replace(tmp_path, self.state_path)
+        except Exception as e:
+            print(f"할당량 기록 저장 오류: {e}")
+
+    def _roll_over(self):
+        """할당량 기준일이 바뀌었으면 사용량 초기화 (잠금을 잡은 상태에서 호출)"""
+        today = current_quota_day()
+        if today != self._day:
+            self._day = today
+            self._used = 0
+            self._by_endpoint = {}
+
+    @property
+    def used(self):
+        with self._lock:
+            self._roll_over()
+            return self._used
+
+    def charge(self, endpoint, amount=None):
+        """
+        할당량 사용 기록
+
+        Args:
+            endpoint (str): 'search.list' 등 엔드포인트 이름
+            amount (int): 사용량 (기본값: config.QUOTA_COSTS의 단위 비용)
+
+        Returns:
+            int: 기록 후 누적 사용량
+        """
+        if amount is None:
+            amount = config.QUOTA_COSTS.get(endpoint, 1)
+
+        with self._lock:
+            self._roll_over()
+            self._used += amount
+            self._by_endpoint[endpoint] = self._by_endpoint.get(endpoint, 0) + amount
+            used = self._used
+            self._save()
+
+        # 경고 임계값 체크
+        if used >= self.warning_threshold:
+            remaining = self.limit - used
+            print(f"⚠️ API 할당량 경고: {remaining}회 남음 ({used}/{self.limit})")
+
+        return used
+
+    def is_available(self, required=1):
+        """할당량 사용 가능 여부"""
+        return (self.used + required) <= self.limit
+
+    def get_status(self):
+        """현재 할당량 상태 반환"""
+        with self._lock:
+            self._roll_over()
+            used = self._used
+            by_endpoint = dict(self._by_endpoint)
+            day = self._day
+
+        return {
+            'day': day,
+            'used': used,
+            'limit': self.limit,
+            'remaining': self.limit - used,
+            'percentage': (used / self.limit) * 100,
+            'by_endpoint': by_endpoint,
+        }
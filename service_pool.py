@@ -0,0 +1,66 @@
+import threading
+from contextlib import contextmanager
+
+
+class ServicePool:
+    """
+    스레드 안전 API 서비스 객체 풀
+
+    googleapiclient 서비스 객체는 내부 httplib2 전송 계층이 스레드 안전하지 않으므로
+    여러 스레드가 하나의 객체를 공유하면 응답이 섞일 수 있습니다.
+    요청마다 쉬고 있는 서비스 객체를 빌려 쓰고 돌려주므로, 한 객체는 동시에
+    한 스레드에서만 사용되며 짧게 실행되는 스레드도 기존 연결을 재사용합니다.
+    """
+
+    def __init__(self, factory, max_idle=8):
+        self._factory = factory
+        self.max_idle = max_idle
+
+        self._lock = threading.Lock()
+        self._idle = []
+        self._counters = {'created': 0, 'in_use': 0, 'peak_in_use': 0, 'leases': 0}
+
+    def _acquire(self):
+        with self._lock:
+            service = self._idle.pop() if self._idle else None
+            self._counters['leases'] += 1
+            self._counters['in_use'] += 1
+            self._counters['peak_in_use'] = max(self._counters['peak_in_use'], self._counters['in_use'])
+
+        if service is None:
+            try:
+                service = self._factory()
+            except Exception:
+                with self._lock:
+                    self._counters['in_use'] -= 1
+                raise
+            with self._lock:
+                self._counters['created'] += 1
+        return service
+
+    def _release(self, service):
+        with self._lock:
+            self._counters['in_use'] -= 1
+            if len(self._idle) < self.max_idle:
+                self._idle.append(service)
+
+    @contextmanager
+    def lease(self):
+        """서비스 객체를 빌려 사용 (with 블록이 끝나면 반환)"""
+        service = self._acquire()
+        try:
+            yield service
+        finally:
+            self._release(service)
+
+    def prime(self):
+        """서비스 객체 하나를 미리 생성하여 풀에 보관 (생성 오류를 일찍 확인)"""
+        with self.lease():
+            pass
+
+    def get_stats(self):
+        """생성/대여 통계 반환"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['idle'] = len(self._idle)
+        return stats
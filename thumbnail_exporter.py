@@ -0,0 +1,117 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import config
+from http_session import get_content_length
+
+
+THUMBNAIL_BASE_URL = "https://i.ytimg.com/vi"
+
+# 시도할 썸네일 해상도 (앞쪽이 우선)
+THUMBNAIL_VARIANTS = [
+    ('maxres', 'maxresdefault.jpg'),  # 1280x720 (없는 영상도 있음)
+    ('high', 'hqdefault.jpg'),        # 480x360
+]
+
+# 결과 상태
+STATUS_DOWNLOADED = 'downloaded'
+STATUS_SKIPPED = 'skipped'  # 이미 같은 크기의 파일이 있음
+STATUS_FAILED = 'failed'
+
+
+def preview_thumbnail_url(video_id):
+    """미리보기용 썸네일 주소 (mqdefault, 320x180)"""
+    return f"{THUMBNAIL_BASE_URL}/{video_id}/mqdefault.jpg"
+
+
+def thumbnail_urls(video_id):
+    """해상도별 썸네일 주소 목록 [(이름, URL), ...]"""
+    return [(variant, f"{THUMBNAIL_BASE_URL}/{video_id}/{file_name}") for variant, file_name in THUMBNAIL_VARIANTS]
+
+
+class ThumbnailExporter:
+    """
+    썸네일 일괄 내보내기 (동시 다운로드, 이어받기)
+
+    여러 작업 스레드가 공유 HTTP 세션으로 썸네일을 내려받아 파일에 바로 기록합니다.
+    maxres 해상도를 먼저 시도하고 없으면 high 해상도로 대체하며,
+    이미 같은 크기의 파일이 있으면 건너뛰므로 중단된 내보내기를 다시 실행하면
+    남은 썸네일만 내려받습니다.
+    """
+
+    def __init__(self, http_session, max_workers=None):
+        self.http_session = http_session
+        self.max_workers = max(1, max_workers or config.THUMBNAIL_MAX_WORKERS)
+
+    def _is_complete(self, file_path, url):
+        """기존 파일 크기가 서버의 파일 크기와 같은지 확인 (HEAD 요청)"""
+        local_size = os.path.getsize(file_path)
+        if local_size == 0:
+            return False
+
+        response = self.http_session.head(url)
+        if response.status_code != 200:
+            return None  # 이 해상도는 없음
+        expected_size = get_content_length(response)
+        # 크기를 알 수 없으면 완성된 파일로 간주 (다운로드는 임시 파일에 받은 뒤 이름을 바꿈)
+        return expected_size is None or expected_size == local_size
+
+    def export_one(self, video_id, file_path):
+        """
+        썸네일 하나 내보내기
+
+        Returns:
+            dict: {'video_id', 'path', 'status', 'variant', 'error'}
+        """
+        result = {'video_id': video_id, 'path': file_path, 'status': STATUS_FAILED, 'variant': None, 'error': None}
+
+        try:
+            for variant, url in thumbnail_urls(video_id):
+                if os.path.exists(file_path):
+                    complete = self._is_complete(file_path, url)
+                    if complete is None:
+                        continue
+                    if complete:
+                        result.update(status=STATUS_SKIPPED, variant=variant)
+                        return result
+
+                if self.http_session.download(url, file_path):
+                    result.update(status=STATUS_DOWNLOADED, variant=variant)
+                    return result
+
+            result['error'] = "썸네일을 찾을 수 없습니다."
+        except Exception as e:
+            result['error'] = str(e)
+
+        return result
+
+    def export(self, items, progress_callback=None):
+        """
+        썸네일 일괄 내보내기
+
+        Args:
+            items (list): [(video_id, 저장 경로), ...]
+            progress_callback (function): (완료 수, 전체 수, 결과) 콜백
+
+        Returns:
+            list: 입력 순서대로 export_one 결과 목록
+        """
+        results = [None] * len(items)
+
+        for folder in {os.path.dirname(os.path.abspath(file_path)) for _, file_path in items}:
+            os.makedirs(folder, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.export_one, video_id, file_path): index
+                for index, (video_id, file_path) in enumerate(items)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+                if result['status'] == STATUS_FAILED:
+                    print(f"썸네일 다운로드 실패 ({result['video_id']}): {result['error']}")
+                if progress_callback:
+                    progress_callback(done, len(items), result)
+
+        return results
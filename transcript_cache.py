@@ -0,0 +1,146 @@
+import os
+import time
+import zlib
+import sqlite3
+import threading
+
+import config
+
+
+# 대본 출처
+SOURCE_MANUAL = 'manual'    # 수동 자막
+SOURCE_AUTO = 'auto'        # 자동 생성 자막
+SOURCE_WHISPER = 'whisper'  # Whisper 음성 인식
+
+# 자막이 없는 영상 표시용 (재조회 방지)
+SOURCE_UNAVAILABLE = 'unavailable'
+
+
+class TranscriptCache:
+    """
+    대본 압축 저장소 (SQLite + zlib)
+
+    (video_id, 언어, 출처, Whisper 모델) 단위로 대본을 저장하여
+    같은 영상을 다시 추출할 때 네트워크 요청이나 음성 인식을 생략합니다.
+    """
+
+    def __init__(self, db_path=None, unavailable_ttl=None):
+        self.db_path = db_path or config.TRANSCRIPT_CACHE_PATH
+        self.unavailable_ttl = unavailable_ttl if unavailable_ttl is not None else config.TRANSCRIPT_UNAVAILABLE_TTL
+
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0}
+
+        self._conn = self._connect()
+
+    def _connect(self):
+        """DB 연결 및 테이블 생성 (실패 시 메모리 DB 사용)"""
+        try:
+            if self.db_path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: 대본 캐시 파일을 열 수 없어 메모리 캐시를 사용합니다: {e}")
+            self.db_path = ':memory:'
+            conn = sqlite3.connect(':memory:', check_same_thread=False)
+
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "video_id TEXT NOT NULL, language TEXT NOT NULL, source TEXT NOT NULL, "
+            "model TEXT NOT NULL DEFAULT '', data BLOB, created_at REAL, "
+            "PRIMARY KEY (video_id, language, source, model))"
+        )
+        conn.commit()
+        return conn
+
+    def get(self, video_id, sources, languages=None, model=''):
+        """
+        캐시된 대본 조회
+
+        Args:
+            video_id (str): YouTube 비디오 ID
+            sources (list): 허용할 출처 목록 (앞쪽이 우선)
+            languages (list): 허용할 언어 목록 (앞쪽이 우선, None이면 전체)
+            model (str): Whisper 모델 이름 (Whisper 출처에만 적용)
+
+        Returns:
+            dict: {'text', 'language', 'source', 'model'} 또는 None
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT language, source, model, data FROM transcripts WHERE video_id = ?",
+                (video_id,)
+            ).fetchall()
+
+        candidates = []
+        for language, source, row_model, data in rows:
+            if source not in sources:
+                continue
+            if languages is not None and language not in languages:
+                continue
+            if source == SOURCE_WHISPER and row_model != model:
+                continue
+            language_rank = languages.index(language) if languages is not None else 0
+            candidates.append((sources.index(source), language_rank, language, source, row_model, data))
+
+        with self._lock:
+            if not candidates:
+                self._counters['misses'] += 1
+                return None
+            self._counters['hits'] += 1
+
+        _, _, language, source, row_model, data = min(candidates, key=lambda c: (c[0], c[1]))
+        return {
+            'text': zlib.decompress(data).decode('utf-8'),
+            'language': language,
+            'source': source,
+            'model': row_model,
+        }
+
+    def put(self, video_id, text, language, source, model=''):
+        """대본 저장"""
+        data = zlib.compress(text.encode('utf-8'), 6)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, language, source, model, data, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (video_id, language, source, model, data, time.time())
+            )
+            self._conn.commit()
+
+    def mark_unavailable(self, video_id):
+        """자막이 없는 영상으로 기록"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts (video_id, language, source, model, data, created_at) "
+                "VALUES (?, '', ?, '', NULL, ?)",
+                (video_id, SOURCE_UNAVAILABLE, time.time())
+            )
+            self._conn.commit()
+
+    def is_unavailable(self, video_id):
+        """최근에 자막이 없는 것으로 확인된 영상인지 여부"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at FROM transcripts WHERE video_id = ? AND source = ?",
+                (video_id, SOURCE_UNAVAILABLE)
+            ).fetchone()
+        return bool(row) and (time.time() - row[0]) < self.unavailable_ttl
+
+    def get_stats(self):
+        """캐시 적중/미스 카운터 반환"""
+        with self._lock:
+            stats = dict(self._counters)
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] / total * 100) if total else 0.0
+        return stats
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM transcripts")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,472 @@
+import os
+import sys
+import queue
+import itertools
+import threading
+import subprocess
+import multiprocessing
+from array import array
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+
+import config
+from asr_backends import create_backend
+
+
+# Whisper 입력 형식 (16 kHz 모노, 16비트 PCM)
+SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 2
+
+# 무음 구간 탐색 단위 (30ms)
+SILENCE_FRAME_SECONDS = 0.03
+
+
+class AudioDecodeError(RuntimeError):
+    """오디오 스트림 디코딩 실패"""
+
+
+def _ffmpeg_decode_command(source, http_headers, sample_rate):
+    """원본 스트림을 s16le 모노 PCM으로 표준 출력에 쓰는 ffmpeg 명령"""
+    cmd = ['ffmpeg', '-nostdin', '-loglevel', 'error', '-threads', '0']
+    if http_headers:
+        cmd += ['-headers', ''.join(f"{key}: {value}\r\n" for key, value in http_headers.items())]
+    cmd += ['-i', source, '-vn', '-f', 's16le', '-acodec', 'pcm_s16le',
+            '-ac', '1', '-ar', str(sample_rate), '-']
+    return cmd
+
+
+def decode_audio_stream(source, http_headers=None, sample_rate=SAMPLE_RATE, timeout=None):
+    """
+    오디오 스트림을 16 kHz 모노 PCM으로 메모리에서 디코딩
+
+    ffmpeg 한 번의 파이프로 원본 스트림(URL 또는 파일)을 Whisper 입력 형식으로 변환하여,
+    중간 WAV 파일 저장과 이중 디코딩을 생략합니다.
+
+    Args:
+        source (str): 오디오 스트림 URL 또는 파일 경로
+        http_headers (dict): 스트림 요청에 사용할 HTTP 헤더
+        sample_rate (int): 출력 샘플링 주파수
+        timeout (float): ffmpeg 최대 실행 시간 (초)
+
+    Returns:
+        bytes: 16비트 부호 있는 리틀 엔디언(s16le) 모노 PCM
+    """
+    cmd = _ffmpeg_decode_command(source, http_headers, sample_rate)
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=timeout, check=False)
+    except FileNotFoundError:
+        raise AudioDecodeError("ffmpeg를 찾을 수 없습니다. ffmpeg를 설치해주세요.")
+    except subprocess.TimeoutExpired:
+        raise AudioDecodeError("오디오 디코딩 시간이 초과되었습니다.")
+
+    if result.returncode != 0:
+        raise AudioDecodeError(f"오디오 디코딩 실패: {result.stderr.decode('utf-8', 'replace').strip()}")
+    return result.stdout
+
+
+def _find_quiet_split(buffer, start, end, sample_rate):
+    """
+    buffer[start:end] 구간에서 가장 조용한 30ms 프레임의 가운데 위치(바이트) 반환
+
+    샘플을 4개 중 1개만 사용해 평균 진폭을 비교하므로 numpy 없이도 충분히 빠릅니다.
+    """
+    frame_samples = max(1, int(sample_rate * SILENCE_FRAME_SECONDS))
+    samples = array('h')
+    samples.frombytes(bytes(buffer[start:end]))
+    if sys.byteorder == 'big':
+        samples.byteswap()
+
+    best_index, best_energy = 0, None
+    for index in range(0, len(samples) - frame_samples + 1, frame_samples):
+        energy = sum(abs(sample) for sample in samples[index:index + frame_samples:4])
+        if best_energy is None or energy < best_energy:
+            best_index, best_energy = index, energy
+
+    return start + (best_index + frame_samples // 2) * BYTES_PER_SAMPLE
+
+
+def _drain_stderr(stream, tail):
+    """ffmpeg 표준 오류를 계속 읽어 마지막 몇 줄만 보관 (파이프가 가득 차 ffmpeg가 멈추지 않도록)"""
+    for line in iter(stream.readline, b''):
+        tail.append(line)
+
+
+def iter_audio_chunks(source, http_headers=None, chunk_seconds=None, split_window_seconds=None,
+                      sample_rate=SAMPLE_RATE):
+    """
+    오디오 스트림을 디코딩하면서 무음 구간 기준으로 잘라 순서대로 반환
+
+    ffmpeg 파이프에서 읽은 PCM이 chunk_seconds만큼 쌓이면 마지막
+    split_window_seconds 구간에서 가장 조용한 지점을 찾아 자르므로,
+    영상 길이와 관계없이 메모리에는 조각 하나 분량만 유지됩니다.
+    소비자가 읽지 않으면 ffmpeg도 파이프에서 대기합니다.
+
+    Args:
+        source (str): 오디오 스트림 URL 또는 파일 경로
+        http_headers (dict): 스트림 요청에 사용할 HTTP 헤더
+        chunk_seconds (float): 조각 최대 길이 (초)
+        split_window_seconds (float): 자를 지점을 찾을 조각 끝부분 길이 (초)
+        sample_rate (int): 출력 샘플링 주파수
+
+    Yields:
+        tuple: (조각 시작 시각(초), s16le 모노 PCM bytes)
+    """
+    chunk_seconds = chunk_seconds or config.WHISPER_CHUNK_SECONDS
+    if split_window_seconds is None:
+        split_window_seconds = config.WHISPER_SPLIT_WINDOW_SECONDS
+    split_window_seconds = min(split_window_seconds, chunk_seconds / 2)
+
+    bytes_per_second = sample_rate * BYTES_PER_SAMPLE
+    chunk_bytes = int(chunk_seconds * sample_rate) * BYTES_PER_SAMPLE
+    window_bytes = int(split_window_seconds * sample_rate) * BYTES_PER_SAMPLE
+
+    cmd = _ffmpeg_decode_command(source, http_headers, sample_rate)
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise AudioDecodeError("ffmpeg를 찾을 수 없습니다. ffmpeg를 설치해주세요.")
+
+    # 표준 오류는 별도 스레드에서 읽고 오류 메시지용으로 마지막 20줄만 유지
+    stderr_tail = deque(maxlen=20)
+    stderr_reader = threading.Thread(target=_drain_stderr, args=(process.stderr, stderr_tail), daemon=True)
+    stderr_reader.start()
+
+    buffer = bytearray()
+    offset_bytes = 0
+    try:
+        while True:
+            data = process.stdout.read(64 * 1024)
+            if data:
+                buffer.extend(data)
+
+            while len(buffer) >= chunk_bytes:
+                cut = _find_quiet_split(buffer, chunk_bytes - window_bytes, chunk_bytes, sample_rate)
+                chunk = bytes(buffer[:cut])
+                del buffer[:cut]
+                yield offset_bytes / bytes_per_second, chunk
+                offset_bytes += cut
+
+            if not data:
+                break
+
+        process.wait()
+        stderr_reader.join()
+        if process.returncode != 0:
+            raise AudioDecodeError(
+                f"오디오 디코딩 실패: {b''.join(stderr_tail).decode('utf-8', 'replace').strip()}"
+            )
+
+        # 남은 부분 (홀수 바이트는 버림)
+        remaining = len(buffer) - len(buffer) % BYTES_PER_SAMPLE
+        if remaining:
+            yield offset_bytes / bytes_per_second, bytes(buffer[:remaining])
+    finally:
+        # 소비자가 중간에 멈춘 경우 ffmpeg 종료
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        stderr_reader.join()
+        process.stdout.close()
+        process.stderr.close()
+
+
+def _pcm_to_float(pcm):
+    """s16le PCM을 Whisper 입력용 float32 배열(-1.0 ~ 1.0)로 변환"""
+    import numpy as np
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+
+def _worker_main(worker_id, backend_name, model_name, compute_type, cpu_threads, job_queue, result_queue):
+    """
+    Whisper 작업 프로세스
+
+    음성 인식 백엔드 모델을 한 번만 로드한 뒤 자신의 작업 큐에서 (job_id, audio, options)를 받아
+    음성 인식 결과를 결과 큐로 보냅니다. None을 받으면 종료합니다.
+    """
+    model = None
+    load_error = None
+    try:
+        model = create_backend(backend_name, model_name, compute_type=compute_type, cpu_threads=cpu_threads)
+        model.load()
+    except Exception as e:
+        model = None
+        load_error = f"음성 인식 모델 로드 실패 ({backend_name}/{model_name}): {e}"
+    result_queue.put(('ready', worker_id, load_error))
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+
+        job_id, audio, options = job
+        if model is None:
+            result_queue.put(('error', worker_id, (job_id, load_error)))
+            continue
+
+        try:
+            # PCM 바이트는 파일을 거치지 않고 바로 모델에 전달
+            if isinstance(audio, bytes):
+                audio = _pcm_to_float(audio)
+            result = model.transcribe(audio, **options)
+            result_queue.put(('done', worker_id, (job_id, result)))
+        except Exception as e:
+            result_queue.put(('error', worker_id, (job_id, str(e))))
+
+
+class WhisperWorkerPool:
+    """
+    Whisper 음성 인식 작업 프로세스 풀
+
+    음성 인식을 별도 프로세스에서 실행하여 GIL 경합으로 GUI가 멈추지 않게 하고,
+    여러 영상을 동시에 인식할 수 있도록 합니다. 각 작업 프로세스는 모델을
+    한 번만 로드하며, 작업은 쉬고 있는 프로세스에 하나씩 배정됩니다.
+    작업 프로세스가 비정상 종료되면 처리 중이던 작업은 실패로 처리되고
+    새 작업 프로세스가 시작됩니다.
+    """
+
+    def __init__(self, backend=None, model_name=None, compute_type=None, size=None, torch_threads=None):
+        self.backend = backend or config.ASR_BACKEND
+        self.model_name = model_name or config.WHISPER_MODEL
+        self.compute_type = compute_type or config.WHISPER_COMPUTE_TYPE
+        self.size = max(1, size or config.WHISPER_POOL_SIZE)
+        if torch_threads is None:
+            torch_threads = config.WHISPER_TORCH_THREADS
+        if not torch_threads:
+            torch_threads = max(1, (os.cpu_count() or 1) // self.size)
+        self.torch_threads = torch_threads
+
+        # spawn: Tk/스레드가 있는 부모 프로세스를 fork하지 않음
+        self._ctx = multiprocessing.get_context('spawn')
+        self._result_queue = self._ctx.Queue()
+
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+        self._jobs = {}           # job_id -> (Future, progress_callback, audio, options)
+        self._pending = deque()   # 배정 대기 중인 job_id
+        self._workers = {}        # worker_id -> {'process', 'jobs', 'ready', 'job_id'}
+        self._worker_ids = itertools.count(1)
+        self._closed = False
+
+        with self._lock:
+            for _ in range(self.size):
+                self._start_worker()
+
+        self._collector = threading.Thread(target=self._collect_results, daemon=True)
+        self._collector.start()
+
+    def _start_worker(self):
+        """작업 프로세스 시작 (잠금을 잡은 상태에서 호출)"""
+        worker_id = next(self._worker_ids)
+        job_queue = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.backend, self.model_name, self.compute_type, self.torch_threads,
+                  job_queue, self._result_queue),
+            daemon=True
+        )
+        process.start()
+        self._workers[worker_id] = {'process': process, 'jobs': job_queue, 'ready': False, 'job_id': None}
+
+    def submit(self, audio, progress_callback=None, **options):
+        """
+        음성 인식 작업 제출
+
+        Args:
+            audio (str | bytes): 오디오 파일 경로 또는 16 kHz 모노 s16le PCM (decode_audio_stream 결과)
+            progress_callback (function): 진행상황 콜백 (다른 스레드에서 호출될 수 있음)
+            **options: 백엔드 transcribe 옵션 (language)
+
+        Returns:
+            Future: 인식 결과 {'text', 'language', 'segments'}를 결과로 가지는 Future
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Whisper 작업 풀이 종료되었습니다.")
+            job_id = next(self._job_ids)
+            self._jobs[job_id] = (future, progress_callback, audio, options)
+            self._pending.append(job_id)
+
+        if progress_callback:
+            progress_callback("음성 인식 대기 중...")
+        self._dispatch()
+        return future
+
+    def transcribe(self, audio, progress_callback=None, **options):
+        """음성 인식 작업을 제출하고 결과를 기다림"""
+        return self.submit(audio, progress_callback, **options).result()
+
+    def transcribe_chunks(self, chunks, progress_callback=None, max_in_flight=None, **options):
+        """
+        긴 오디오를 조각별로 여러 작업 프로세스에서 동시에 인식하고 이어붙임
+
+        조각은 순서대로 제출되며, 동시에 처리 중인 조각이 max_in_flight개를 넘으면
+        가장 먼저 제출한 조각의 결과를 기다린 뒤 다음 조각을 읽으므로
+        메모리 사용량이 영상 길이와 관계없이 일정합니다.
+
+        Args:
+            chunks (iterable): (조각 시작 시각(초), 오디오) 목록 (iter_audio_chunks 결과)
+            progress_callback (function): 진행상황 콜백
+            max_in_flight (int): 동시에 제출할 최대 조각 수 (기본값: 작업 프로세스 수 x 2)
+            **options: 백엔드 transcribe 옵션 (language)
+
+        Returns:
+            dict: {'text', 'language', 'segments'} - segments의 시각은 전체 오디오 기준
+        """
+        max_in_flight = max_in_flight or self.size * 2
+        in_flight = deque()  # (조각 번호, 시작 시각, Future)
+        merged = {'text': '', 'language': None, 'segments': []}
+        texts = []
+        submitted = 0
+
+        def collect():
+            index, offset, future = in_flight.popleft()
+            result = future.result() or {}
+            if merged['language'] is None:
+                merged['language'] = result.get('language')
+            text = (result.get('text') or '').strip()
+            if text:
+                texts.append(text)
+            for segment in result.get('segments') or []:
+                merged['segments'].append({
+                    'start': offset + segment['start'],
+                    'end': offset + segment['end'],
+                    'text': segment['text'],
+                })
+            if progress_callback:
+                progress_callback(f"음성 인식 중... ({index}/{submitted}개 조각 완료)")
+
+        try:
+            for offset, audio in chunks:
+                if len(in_flight) >= max_in_flight:
+                    collect()
+                submitted += 1
+                in_flight.append((submitted, offset, self.submit(audio, **options)))
+                del audio
+            while in_flight:
+                collect()
+        finally:
+            # 오류로 중단된 경우 남은 조각 취소 (아직 배정되지 않은 작업은 실행되지 않음)
+            for _, _, future in in_flight:
+                future.cancel()
+
+        merged['text'] = ' '.join(texts)
+        return merged
+
+    def _dispatch(self):
+        """쉬고 있는 작업 프로세스에 대기 중인 작업 배정"""
+        started = []
+        with self._lock:
+            for worker_id, worker in self._workers.items():
+                if not worker['ready'] or worker['job_id'] is not None:
+                    continue
+                job_id = self._pop_pending_job()
+                if job_id is None:
+                    break
+                future, progress_callback, audio, options = self._jobs[job_id]
+                worker['job_id'] = job_id
+                worker['jobs'].put((job_id, audio, options))
+                # 전달한 오디오는 더 이상 보관하지 않음 (동시 처리 시 메모리 절약)
+                self._jobs[job_id] = (future, progress_callback, None, options)
+                started.append((progress_callback, worker_id))
+
+        for progress_callback, worker_id in started:
+            if progress_callback:
+                progress_callback(f"음성 인식 중... (작업 프로세스 {worker_id})")
+
+    def _pop_pending_job(self):
+        """취소되지 않은 다음 대기 작업 꺼내기 (잠금을 잡은 상태에서 호출)"""
+        while self._pending:
+            job_id = self._pending.popleft()
+            if self._jobs[job_id][0].cancelled():
+                del self._jobs[job_id]
+                continue
+            return job_id
+        return None
+
+    @staticmethod
+    def _resolve(future, result=None, error=None):
+        """Future 완료 (이미 취소된 경우 무시)"""
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _collect_results(self):
+        """결과 큐를 읽어 Future를 완료하고, 비정상 종료된 작업 프로세스를 교체"""
+        while True:
+            try:
+                kind, worker_id, payload = self._result_queue.get(timeout=1)
+            except queue.Empty:
+                if self._closed:
+                    break
+                self._check_workers()
+                self._dispatch()
+                continue
+            except (EOFError, OSError):
+                break
+
+            entry = None
+            with self._lock:
+                worker = self._workers.get(worker_id)
+                if kind == 'ready':
+                    if worker:
+                        worker['ready'] = True
+                else:
+                    job_id, result = payload
+                    if worker and worker['job_id'] == job_id:
+                        worker['job_id'] = None
+                    entry = self._jobs.pop(job_id, None)
+
+            if kind == 'ready' and payload:
+                print(payload)
+
+            if entry:
+                if kind == 'done':
+                    self._resolve(entry[0], result=result)
+                else:
+                    self._resolve(entry[0], error=RuntimeError(result))
+
+            self._dispatch()
+
+    def _check_workers(self):
+        """종료된 작업 프로세스의 작업을 실패 처리하고 새 프로세스 시작"""
+        failed = []
+        with self._lock:
+            if self._closed:
+                return
+            for worker_id in [wid for wid, w in self._workers.items() if not w['process'].is_alive()]:
+                worker = self._workers.pop(worker_id)
+                if worker['job_id'] is not None:
+                    entry = self._jobs.pop(worker['job_id'], None)
+                    if entry:
+                        failed.append(entry[0])
+                self._start_worker()
+
+        for future in failed:
+            self._resolve(future, error=RuntimeError("Whisper 작업 프로세스가 비정상 종료되었습니다."))
+
+    def shutdown(self):
+        """작업 프로세스 종료 (처리되지 않은 작업은 취소)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = [entry[0] for entry in self._jobs.values()]
+            self._jobs.clear()
+            self._pending.clear()
+            workers = list(self._workers.values())
+
+        for worker in workers:
+            worker['jobs'].put(None)
+        for worker in workers:
+            worker['process'].join(timeout=5)
+            if worker['process'].is_alive():
+                worker['process'].terminate()
+
+        for future in pending:
+            future.cancel()
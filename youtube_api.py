@@ -1,34 +1,45 @@
-import os
 import re
-import json
-import requests
-import tempfile
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from googleapiclient.discovery import build
-from youtube_transcript_api import YouTubeTranscriptApi
+from googleapiclient.errors import HttpError
+from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
 import config
 import statistics
+from metadata_cache import MetadataCache
+from transcript_cache import TranscriptCache, SOURCE_MANUAL, SOURCE_AUTO, SOURCE_WHISPER
+from rate_limiter import TokenBucket
+from quota_tracker import QuotaTracker
+from whisper_pool import WhisperWorkerPool, AudioDecodeError, iter_audio_chunks
+from asr_backends import create_backend, is_backend_available
+from http_session import get_shared_session
+from service_pool import ServicePool
+from thumbnail_exporter import ThumbnailExporter
+from outlier_scoring import OutlierStats, SCORE_CHANNEL, apply_outlier_scores, apply_channel_scores
 
-try:
-    import yt_dlp
-    YT_DLP_AVAILABLE = True
-except ImportError:
-    YT_DLP_AVAILABLE = False
+# 무거운 선택 의존성(yt-dlp, 음성 인식 백엔드)은 설치 여부만 확인하고
+# 실제 import는 대본 추출에서 처음 사용할 때 수행 (프로그램 시작 시간 단축)
+YT_DLP_AVAILABLE = importlib.util.find_spec("yt_dlp") is not None
+if not YT_DLP_AVAILABLE:
     print("Warning: yt-dlp not installed. Audio download features will be limited.")
 
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-    print("INFO: Whisper available")
-except ImportError:
-    WHISPER_AVAILABLE = False
-    print("Warning: Whisper not installed. Speech recognition features will be limited.")
-except Exception as e:
-    WHISPER_AVAILABLE = False
-    print(f"Warning: Whisper loading error: {e}")
+WHISPER_AVAILABLE = is_backend_available(config.ASR_BACKEND)
+if not WHISPER_AVAILABLE:
+    print(f"Warning: Speech recognition backend '{config.ASR_BACKEND}' not installed. Speech recognition features will be limited.")
     print("   Quick transcript extraction is still available (API quota free)")
 
 
+# 영상 유형별 search.list videoDuration 파라미터
+# (short: 4분 미만, long: 20분 초과)
+VIDEO_TYPE_DURATION_PARAMS = {
+    "쇼츠": "short",
+    "20분 초과": "long",
+}
+
+# 서버 필터만으로 조건이 정확히 일치하여 클라이언트 길이 필터가 필요 없는 유형
+SERVER_FILTERED_VIDEO_TYPES = {"20분 초과"}
 
 
 class YouTubeAPI:
@@ -37,45 +48,107 @@ class YouTubeAPI:
         if self.api_key == "YOUR_YOUTUBE_API_KEY_HERE":
             raise ValueError("YouTube API 키를 config.py 파일에 설정해주세요.")
         
-        # API 할당량 추적
-        self.quota_used = 0
-        self.quota_limit = 10000  # 기본 일일 할당량
-        self.quota_warning_threshold = 8000  # 경고 임계값
+        # 마지막 검색의 필터 통계 (필터로 버려진 결과 확인용)
+        self.last_search_stats = {}
+        
+        # 표시할 Outlier score 종류 (GUI에서 변경 가능)
+        self.outlier_score_method = config.OUTLIER_SCORE_METHOD
+        
+        # API 할당량 추적 (엔드포인트별 비용, 일 단위로 저장)
+        self.quota_tracker = QuotaTracker()
+        self.quota_limit = self.quota_tracker.limit
+        self.quota_warning_threshold = self.quota_tracker.warning_threshold
+        
+        # Whisper 작업 프로세스 풀 (처음 사용할 때 시작)
+        self.whisper_pool = None
+        
+        # 영상/채널 메타데이터 캐시
+        self.metadata_cache = MetadataCache()
         
-        # Whisper 모델을 클래스 변수로 저장 (한 번만 로드)
-        self.whisper_model = None
+        # 대본 캐시 (자막 + Whisper 공용)
+        self.transcript_cache = TranscriptCache()
         
+        # 자막 요청 속도 제한 (모든 추출 스레드 공유)
+        self.transcript_rate_limiter = TokenBucket(config.TRANSCRIPT_REQUESTS_PER_SECOND)
+        self._whisper_lock = threading.Lock()
+        
+        # 썸네일 등 직접 HTTP 요청용 공유 세션 (연결 재사용)
+        self.http_session = get_shared_session()
+        
+        # API 서비스 객체 풀 (httplib2 전송 계층은 스레드 안전하지 않으므로 요청마다 빌려 사용)
+        self.service_pool = ServicePool(self._build_service, max_idle=config.API_SERVICE_POOL_MAX_IDLE)
         try:
-            self.youtube = build(
-                config.YOUTUBE_API_SERVICE_NAME,
-                config.YOUTUBE_API_VERSION,
-                developerKey=self.api_key,
-                cache_discovery=False  # 캐시 비활성화로 인증 문제 방지
-            )
+            self.service_pool.prime()
         except Exception as e:
             raise ValueError(f"YouTube API 초기화 실패: {e}\nAPI 키가 올바른지 확인해주세요.")
     
+    def _build_service(self):
+        """YouTube API 서비스 객체 생성 (동시에 한 스레드에서만 사용해야 함)"""
+        return build(
+            config.YOUTUBE_API_SERVICE_NAME,
+            config.YOUTUBE_API_VERSION,
+            developerKey=self.api_key,
+            cache_discovery=False  # 캐시 비활성화로 인증 문제 방지
+        )
+    
+    @property
+    def quota_used(self):
+        """오늘(태평양 시간 기준) 사용한 할당량"""
+        return self.quota_tracker.used
+    
     def check_quota_available(self, required_quota=1):
         """API 할당량 사용 가능 여부 확인"""
-        return (self.quota_used + required_quota) <= self.quota_limit
+        return self.quota_tracker.is_available(required_quota)
     
-    def use_quota(self, amount=1):
+    def use_quota(self, amount=1, endpoint='other'):
         """할당량 사용 기록"""
-        self.quota_used += amount
-        
-        # 경고 임계값 체크
-        if self.quota_used >= self.quota_warning_threshold:
-            remaining = self.quota_limit - self.quota_used
-            print(f"⚠️ API 할당량 경고: {remaining}회 남음 ({self.quota_used}/{self.quota_limit})")
+        self.quota_tracker.charge(endpoint, amount)
     
     def get_quota_status(self):
         """현재 할당량 상태 반환"""
-        return {
-            'used': self.quota_used,
-            'limit': self.quota_limit,
-            'remaining': self.quota_limit - self.quota_used,
-            'percentage': (self.quota_used / self.quota_limit) * 100
-        }
+        return self.quota_tracker.get_status()
+    
+    def estimate_search_quota(self, max_results):
+        """
+        검색 예상 할당량 계산
+        
+        페이지당 search.list 1회, videos.list 1회, channels.list 최대 1회 기준
+        (필터링으로 결과가 부족하면 페이지가 더 필요할 수 있음)
+        채널 기준 점수를 사용하면 결과마다 다른 채널이고 캐시가 없다고 가정한 기준값 조회 비용을 더합니다.
+        """
+        pages = max(1, -(-max_results // config.MAX_RESULTS_PER_REQUEST))
+        per_page = (config.QUOTA_COSTS['search.list'] + config.QUOTA_COSTS['videos.list']
+                    + config.QUOTA_COSTS['channels.list'])
+        estimate = pages * per_page
+        if self.outlier_score_method == SCORE_CHANNEL:
+            estimate += int(max_results * self._channel_baseline_cost())
+        return estimate
+    
+    def _execute(self, endpoint, **params):
+        """
+        API 요청 실행 및 할당량 기록 (실패한 요청도 할당량이 차감됨)
+        
+        요청마다 서비스 풀에서 서비스 객체를 빌려 사용하므로 여러 스레드에서 동시에 호출해도 안전합니다.
+        
+        Args:
+            endpoint (str): 'videos.list' 형식의 엔드포인트 이름
+            **params: API 요청 파라미터
+        """
+        resource, method = endpoint.split('.')
+        self.quota_tracker.charge(endpoint)
+        with self.service_pool.lease() as service:
+            request = getattr(getattr(service, resource)(), method)(**params)
+            return request.execute()
+    
+    def get_http_stats(self):
+        """공유 HTTP 세션의 요청 수/연결 재사용 통계 반환"""
+        return self.http_session.get_stats()
+    
+    def get_cache_stats(self):
+        """메타데이터/대본 캐시 적중/미스 통계 반환"""
+        stats = self.metadata_cache.get_stats()
+        stats.update({f"transcript_{k}": v for k, v in self.transcript_cache.get_stats().items()})
+        return stats
     
     def search_videos(self, keyword, video_type="all", min_views=0, max_subscribers=None, 
                      upload_period=None, max_results=100, progress_callback=None):
@@ -83,54 +156,103 @@ class YouTubeAPI:
         키워드로 영상 검색
         """
         try:
-            if progress_callback:
-                progress_callback("검색 조건 설정 중...")
-            
-            # 날짜 범위 설정
-            published_after = None
-            if upload_period:
-                if upload_period == "1일":
-                    published_after = (datetime.now() - timedelta(days=1)).isoformat() + 'Z'
-                elif upload_period == "1주일":
-                    published_after = (datetime.now() - timedelta(weeks=1)).isoformat() + 'Z'
-                elif upload_period == "1개월":
-                    published_after = (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
-                elif upload_period == "3개월":
-                    published_after = (datetime.now() - timedelta(days=90)).isoformat() + 'Z'
-                elif upload_period == "1년":
-                    published_after = (datetime.now() - timedelta(days=365)).isoformat() + 'Z'
-            
-            # 검색 수행
             all_videos = []
-            next_page_token = None
-            page_count = 0
+            for batch in self.iter_search_videos(keyword, video_type, min_views, max_subscribers,
+                                                 upload_period, max_results, progress_callback):
+                all_videos.extend(batch)
+            return all_videos
             
-            while len(all_videos) < max_results:
+        except Exception as e:
+            print(f"검색 중 오류 발생: {e}")
+            return []
+    
+    def iter_search_videos(self, keyword, video_type="all", min_views=0, max_subscribers=None,
+                           upload_period=None, max_results=100, progress_callback=None):
+        """
+        키워드로 영상 검색 (페이지 단위 스트리밍)
+        
+        각 검색 페이지의 필터링된 영상 목록을 확인되는 즉시 yield합니다.
+        전달된 영상의 outlier_score는 그때까지 받은 결과 기준의 임시 값이며,
+        제너레이터가 끝까지 소비되면 전체 결과 기준의 값으로 갱신됩니다 (같은 dict 객체를 수정).
+        통계는 페이지마다 추가된 영상만큼만 누적하므로 페이지 수에 비례해 재계산하지 않습니다.
+        오류는 호출자에게 그대로 전달됩니다.
+        """
+        if progress_callback:
+            progress_callback("검색 조건 설정 중...")
+        
+        # 날짜 범위 설정
+        published_after = None
+        if upload_period:
+            if upload_period == "1일":
+                published_after = (datetime.now() - timedelta(days=1)).isoformat() + 'Z'
+            elif upload_period == "1주일":
+                published_after = (datetime.now() - timedelta(weeks=1)).isoformat() + 'Z'
+            elif upload_period == "1개월":
+                published_after = (datetime.now() - timedelta(days=30)).isoformat() + 'Z'
+            elif upload_period == "3개월":
+                published_after = (datetime.now() - timedelta(days=90)).isoformat() + 'Z'
+            elif upload_period == "1년":
+                published_after = (datetime.now() - timedelta(days=365)).isoformat() + 'Z'
+        
+        # 영상 길이 필터는 가능한 한 search.list에서 처리
+        video_duration = VIDEO_TYPE_DURATION_PARAMS.get(video_type)
+        client_video_type = "all" if video_type in SERVER_FILTERED_VIDEO_TYPES else video_type
+        
+        # 검색 수행
+        all_videos = []
+        outlier_stats = OutlierStats()  # 페이지마다 누적하는 Outlier score 통계
+        page_count = 0
+        search_stats = {
+            'pages': 0,
+            'fetched': 0,
+            'rejected': {'views': 0, 'subscribers': 0, 'duration': 0},
+        }
+        self.last_search_stats = search_stats
+        
+        def build_search_params(page_token):
+            # 한 번에 가져올 결과 수 계산 (필터 통과 여부를 모르므로 처리 중인 페이지는 빼지 않음,
+            # search.list는 결과 수와 관계없이 같은 할당량을 사용)
+            remaining = max_results - len(all_videos)
+            results_per_request = min(config.MAX_RESULTS_PER_REQUEST, remaining)
+            
+            # 검색 요청 파라미터
+            search_params = {
+                'part': 'snippet',
+                'q': keyword,
+                'type': 'video',
+                'maxResults': results_per_request,
+                'order': 'relevance'
+            }
+            
+            if published_after:
+                search_params['publishedAfter'] = published_after
+            
+            if video_duration:
+                search_params['videoDuration'] = video_duration
+            
+            if page_token:
+                search_params['pageToken'] = page_token
+            
+            return search_params
+        
+        # search.list는 전용 스레드에서 실행하여
+        # 현재 페이지의 상세 정보를 조회하는 동안 다음 페이지를 미리 요청
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        
+        def fetch_search_page(search_params):
+            return self._execute('search.list', **search_params)
+        
+        try:
+            pending_page = prefetcher.submit(fetch_search_page, build_search_params(None))
+            
+            while pending_page is not None:
                 page_count += 1
                 if progress_callback:
                     progress_callback(f"검색 중... 페이지 {page_count} ({len(all_videos)}/{max_results})")
                 
-                # 한 번에 가져올 결과 수 계산
-                remaining = max_results - len(all_videos)
-                results_per_request = min(config.MAX_RESULTS_PER_REQUEST, remaining)
-                
-                # 검색 요청 파라미터
-                search_params = {
-                    'part': 'snippet',
-                    'q': keyword,
-                    'type': 'video',
-                    'maxResults': results_per_request,
-                    'order': 'relevance'
-                }
-                
-                if published_after:
-                    search_params['publishedAfter'] = published_after
-                
-                if next_page_token:
-                    search_params['pageToken'] = next_page_token
-                
-                # 검색 실행
-                search_response = self.youtube.search().list(**search_params).execute()
+                # 검색 실행 결과 대기
+                search_response = pending_page.result()
+                pending_page = None
                 
                 if not search_response.get('items'):
                     break
@@ -138,6 +260,12 @@ class YouTubeAPI:
                 # 비디오 ID 추출
                 video_ids = [item['id']['videoId'] for item in search_response['items']]
                 
+                # 현재 페이지가 모두 통과해도 max_results에 못 미치면 다음 페이지 미리 요청
+                next_page_token = search_response.get('nextPageToken')
+                if (next_page_token and len(all_videos) + len(video_ids) < max_results
+                        and self.check_quota_available(config.QUOTA_COSTS['search.list'])):
+                    pending_page = prefetcher.submit(fetch_search_page, build_search_params(next_page_token))
+                
                 if progress_callback:
                     progress_callback(f"영상 정보 분석 중... ({len(video_ids)}개 영상)")
                 
@@ -145,88 +273,302 @@ class YouTubeAPI:
                 videos_detail = self._get_videos_detail(video_ids)
                 
                 # 필터링 및 추가
+                search_stats['pages'] += 1
+                search_stats['fetched'] += len(videos_detail)
+                batch = []
                 for video in videos_detail:
-                    if self._filter_video(video, video_type, min_views, max_subscribers):
-                        all_videos.append(video)
+                    reject_reason = self._get_filter_reject_reason(
+                        video, client_video_type, min_views, max_subscribers
+                    )
+                    if reject_reason:
+                        search_stats['rejected'][reject_reason] += 1
+                    else:
+                        batch.append(video)
                 
-                # 다음 페이지 토큰 확인
-                next_page_token = search_response.get('nextPageToken')
-                if not next_page_token:
+                # 현재 페이지 결과 바로 전달 (max_results 초과분 제외, 점수는 지금까지의 통계 기준)
+                batch = batch[:max_results - len(all_videos)]
+                all_videos.extend(batch)
+                if batch:
+                    outlier_stats.add_videos(batch)
+                    outlier_stats.score_videos(batch, self.outlier_score_method)
+                    if self.outlier_score_method == SCORE_CHANNEL:
+                        # 페이지에 새로 나온 채널의 기준값만 일괄 조회 (나머지는 캐시)
+                        self.calculate_channel_scores(batch)
+                    yield batch
+                
+                if len(all_videos) >= max_results:
                     break
-            
-            if progress_callback:
-                progress_callback("영상 품질 점수 계산 중...")
-            
-            # Outlier score 계산
-            self._calculate_outlier_scores(all_videos)
-            
-            if progress_callback:
-                progress_callback("검색 완료!")
-            
-            return all_videos[:max_results]
-            
-        except Exception as e:
-            print(f"검색 중 오류 발생: {e}")
-            return []
+                
+                # 필터링으로 결과가 부족해진 경우 다음 페이지 요청
+                if (pending_page is None and next_page_token
+                        and self.check_quota_available(config.QUOTA_COSTS['search.list'])):
+                    pending_page = prefetcher.submit(fetch_search_page, build_search_params(next_page_token))
+        finally:
+            # 더 이상 필요 없는 미리 요청은 기다리지 않음
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+        
+        # 필터로 버려진 결과와 그만큼 낭비된 search.list 할당량 추정
+        rejected_total = sum(search_stats['rejected'].values())
+        search_stats['rejected_total'] = rejected_total
+        search_stats['wasted_quota_estimate'] = (
+            round(search_stats['pages'] * config.QUOTA_COSTS['search.list'] * rejected_total / search_stats['fetched'])
+            if search_stats['fetched'] else 0
+        )
+        if rejected_total:
+            print(f"필터 제외: {rejected_total}/{search_stats['fetched']}개 {search_stats['rejected']} "
+                  f"(낭비된 할당량 약 {search_stats['wasted_quota_estimate']})")
+        
+        if progress_callback:
+            progress_callback("영상 품질 점수 계산 중...")
+        
+        # 최종 통계 기준으로 전체 결과의 Outlier score 갱신 (통계는 재계산하지 않음)
+        outlier_stats.score_videos(all_videos, self.outlier_score_method)
+        
+        if progress_callback:
+            progress_callback("검색 완료!")
     
     def _get_videos_detail(self, video_ids):
-        """비디오 상세 정보 가져오기"""
+        """비디오 상세 정보 가져오기 (캐시에 없거나 만료된 항목만 API 요청)"""
         try:
-            videos_response = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
+            cached = self.metadata_cache.get_videos(video_ids)
             
-            detailed_videos = []
+            videos = {}
+            stale_stats_ids = []
+            for video_id, record in cached.items():
+                if record['stats'] is None:
+                    stale_stats_ids.append(video_id)
+                else:
+                    videos[video_id] = {**record['static'], **record['stats']}
             
-            for item in videos_response['items']:
-                # 채널 정보 가져오기
-                channel_info = self._get_channel_info(item['snippet']['channelId'])
+            missing_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in cached]
+            
+            # 캐시에 없는 영상: 전체 정보 조회
+            for start in range(0, len(missing_ids), config.MAX_RESULTS_PER_REQUEST):
+                chunk = missing_ids[start:start + config.MAX_RESULTS_PER_REQUEST]
+                videos_response = self._execute(
+                    'videos.list',
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(chunk)
+                )
                 
-                video_data = {
-                    'video_id': item['id'],
-                    'title': item['snippet']['title'],
-                    'channel_id': item['snippet']['channelId'],
-                    'channel_title': item['snippet']['channelTitle'],
-                    'published_at': item['snippet']['publishedAt'],
-                    'view_count': int(item['statistics'].get('viewCount', 0)),
-                    'like_count': int(item['statistics'].get('likeCount', 0)),
-                    'comment_count': int(item['statistics'].get('commentCount', 0)),
-                    'duration': item['contentDetails']['duration'],
-                    'duration_seconds': self._parse_duration(item['contentDetails']['duration']),
-                    'subscriber_count': channel_info.get('subscriber_count', 0),
-                    'thumbnail_url': item['snippet']['thumbnails'].get('high', {}).get('url', ''),
-                    'description': item['snippet'].get('description', ''),
-                    'url': f"https://www.youtube.com/watch?v={item['id']}"
-                }
+                fetched = [self._build_video_data(item) for item in videos_response.get('items', [])]
+                self.metadata_cache.put_videos(fetched)
+                for video_data in fetched:
+                    videos[video_data['video_id']] = video_data
+            
+            # 통계만 만료된 영상: statistics 파트만 조회
+            for start in range(0, len(stale_stats_ids), config.MAX_RESULTS_PER_REQUEST):
+                chunk = stale_stats_ids[start:start + config.MAX_RESULTS_PER_REQUEST]
+                videos_response = self._execute(
+                    'videos.list',
+                    part='statistics',
+                    id=','.join(chunk)
+                )
                 
+                refreshed = {item['id']: self._parse_video_stats(item) for item in videos_response.get('items', [])}
+                self.metadata_cache.put_video_stats(refreshed)
+                for video_id, stats in refreshed.items():
+                    videos[video_id] = {**cached[video_id]['static'], **stats}
+            
+            # 페이지 내 고유 채널 정보를 일괄 조회
+            channels_info = self._get_channels_info([video['channel_id'] for video in videos.values()])
+            
+            detailed_videos = []
+            for video_id in dict.fromkeys(video_ids):
+                video_data = videos.get(video_id)
+                if not video_data:
+                    continue
+                channel_info = channels_info.get(video_data['channel_id'], {'subscriber_count': 0})
+                video_data['subscriber_count'] = channel_info.get('subscriber_count', 0)
                 detailed_videos.append(video_data)
             
             return detailed_videos
             
+        except HttpError:
+            raise  # 할당량 초과 등 API 오류는 호출자에게 전달
         except Exception as e:
             print(f"비디오 상세 정보 가져오기 오류: {e}")
             return []
     
+    def _build_video_data(self, item):
+        """videos.list 응답 항목을 영상 정보 딕셔너리로 변환"""
+        video_data = {
+            'video_id': item['id'],
+            'title': item['snippet']['title'],
+            'channel_id': item['snippet']['channelId'],
+            'channel_title': item['snippet']['channelTitle'],
+            'published_at': item['snippet']['publishedAt'],
+            'duration': item['contentDetails']['duration'],
+            'duration_seconds': self._parse_duration(item['contentDetails']['duration']),
+            'thumbnail_url': item['snippet']['thumbnails'].get('high', {}).get('url', ''),
+            'description': item['snippet'].get('description', ''),
+            'url': f"https://www.youtube.com/watch?v={item['id']}"
+        }
+        video_data.update(self._parse_video_stats(item))
+        return video_data
+    
+    def _parse_video_stats(self, item):
+        """videos.list 응답 항목에서 통계 필드 추출"""
+        statistics_data = item.get('statistics', {})
+        return {
+            'view_count': int(statistics_data.get('viewCount', 0)),
+            'like_count': int(statistics_data.get('likeCount', 0)),
+            'comment_count': int(statistics_data.get('commentCount', 0))
+        }
+    
     def _get_channel_info(self, channel_id):
         """채널 정보 가져오기"""
+        return self._get_channels_info([channel_id]).get(channel_id, {'subscriber_count': 0})
+    
+    def _get_channels_info(self, channel_ids):
+        """
+        여러 채널 정보를 일괄 조회 (channels.list 1회당 최대 50개)
+        
+        Returns:
+            dict: {channel_id: {'subscriber_count': int}} 형태
+        """
+        # 순서를 유지하며 중복 제거
+        unique_ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+        
+        # 캐시에 없거나 만료된 채널만 API 요청
+        channels_info = self.metadata_cache.get_channels(unique_ids)
+        missing_ids = [cid for cid in unique_ids if cid not in channels_info]
+        
+        for start in range(0, len(missing_ids), config.MAX_RESULTS_PER_REQUEST):
+            chunk = missing_ids[start:start + config.MAX_RESULTS_PER_REQUEST]
+            fetched = {}
+            try:
+                channel_response = self._execute(
+                    'channels.list',
+                    part='statistics',
+                    id=','.join(chunk),
+                    maxResults=len(chunk)
+                )
+                
+                for item in channel_response.get('items', []):
+                    stats = item.get('statistics', {})
+                    fetched[item['id']] = {
+                        'subscriber_count': int(stats.get('subscriberCount', 0))
+                    }
+                
+                # 응답에 없는 채널(삭제/정지/비공개)도 0으로 캐시하여 매 검색마다 다시 요청하지 않음
+                for channel_id in chunk:
+                    fetched.setdefault(channel_id, {'subscriber_count': 0})
+                
+                self.metadata_cache.put_channels(fetched)
+                channels_info.update(fetched)
+                    
+            except Exception as e:
+                print(f"채널 정보 가져오기 오류: {e}")
+        
+        # 응답에 없는 채널은 0으로 채움
+        for channel_id in unique_ids:
+            channels_info.setdefault(channel_id, {'subscriber_count': 0})
+        
+        return channels_info
+    
+    def _get_uploads_playlist_id(self, channel_id):
+        """채널 ID에서 업로드 재생목록 ID 계산 (UC... -> UU..., channels.list 호출 없음)"""
+        if channel_id and channel_id.startswith('UC'):
+            return 'UU' + channel_id[2:]
+        return None
+    
+    def _get_recent_upload_ids(self, channel_id, count):
+        """채널의 최근 업로드 영상 ID 목록 (playlistItems.list 1회, 실패 시 None)"""
+        playlist_id = self._get_uploads_playlist_id(channel_id)
+        if not playlist_id:
+            return None
         try:
-            channel_response = self.youtube.channels().list(
-                part='statistics',
-                id=channel_id
-            ).execute()
-            
-            if channel_response['items']:
-                stats = channel_response['items'][0]['statistics']
-                return {
-                    'subscriber_count': int(stats.get('subscriberCount', 0))
-                }
-            
-            return {'subscriber_count': 0}
-            
+            playlist_response = self._execute(
+                'playlistItems.list',
+                part='contentDetails',
+                playlistId=playlist_id,
+                maxResults=count
+            )
         except Exception as e:
-            print(f"채널 정보 가져오기 오류: {e}")
-            return {'subscriber_count': 0}
+            print(f"채널 최근 업로드 가져오기 오류 ({channel_id}): {e}")
+            return None
+        return [item['contentDetails']['videoId'] for item in playlist_response.get('items', [])]
+    
+    def _channel_baseline_cost(self):
+        """채널 1개의 기준값 조회 예상 비용 (playlistItems.list 1회 + videos.list 묶음 요청의 몫)"""
+        sample_size = min(config.CHANNEL_BASELINE_SAMPLE_SIZE, config.MAX_RESULTS_PER_REQUEST)
+        return (config.QUOTA_COSTS['playlistItems.list']
+                + config.QUOTA_COSTS['videos.list'] * sample_size / config.MAX_RESULTS_PER_REQUEST)
+    
+    def get_channel_baselines(self, channel_ids):
+        """
+        채널별 조회수 기준값 (최근 업로드 조회수 중앙값) 일괄 조회
+        
+        캐시에 없는 채널만 playlistItems.list(채널당 1회)로 최근 업로드를 확인하고,
+        모든 채널의 영상 조회수는 videos.list로 50개씩 묶어 조회합니다.
+        남은 할당량이 CHANNEL_BASELINE_QUOTA_RESERVE 아래로 내려가는 채널은 건너뜁니다.
+        
+        Returns:
+            dict: {channel_id: {'median_views': float, 'sample_size': int}} (건너뛴 채널 제외)
+        """
+        unique_ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+        baselines = self.metadata_cache.get_channel_baselines(unique_ids)
+        missing_ids = [cid for cid in unique_ids if cid not in baselines]
+        if not missing_ids:
+            return baselines
+        
+        sample_size = min(config.CHANNEL_BASELINE_SAMPLE_SIZE, config.MAX_RESULTS_PER_REQUEST)
+        budget = self.get_quota_status()['remaining'] - config.CHANNEL_BASELINE_QUOTA_RESERVE
+        affordable = max(0, int(budget // self._channel_baseline_cost()))
+        if affordable < len(missing_ids):
+            print(f"할당량 부족으로 채널 기준값 조회 건너뜀: {len(missing_ids) - affordable}/{len(missing_ids)}개 채널")
+            missing_ids = missing_ids[:affordable]
+        if not missing_ids:
+            return baselines
+        
+        # 채널별 최근 업로드 목록 (채널마다 별도 요청이므로 동시에 조회)
+        with ThreadPoolExecutor(max_workers=config.CHANNEL_BASELINE_MAX_WORKERS) as executor:
+            upload_ids = dict(zip(
+                missing_ids,
+                executor.map(lambda cid: self._get_recent_upload_ids(cid, sample_size), missing_ids)
+            ))
+        
+        # 조회수는 캐시에 통계가 남아 있는 영상을 제외하고 채널 구분 없이 묶어서 조회
+        all_video_ids = list(dict.fromkeys(vid for ids in upload_ids.values() if ids for vid in ids))
+        view_counts = {
+            video_id: record['stats']['view_count']
+            for video_id, record in self.metadata_cache.get_videos(all_video_ids).items()
+            if record['stats'] is not None
+        }
+        fetch_ids = [vid for vid in all_video_ids if vid not in view_counts]
+        for start in range(0, len(fetch_ids), config.MAX_RESULTS_PER_REQUEST):
+            chunk = fetch_ids[start:start + config.MAX_RESULTS_PER_REQUEST]
+            try:
+                videos_response = self._execute('videos.list', part='statistics', id=','.join(chunk))
+            except Exception as e:
+                print(f"채널 기준값 조회수 가져오기 오류: {e}")
+                continue
+            refreshed = {item['id']: self._parse_video_stats(item) for item in videos_response.get('items', [])}
+            self.metadata_cache.put_video_stats(refreshed)
+            view_counts.update((video_id, stats['view_count']) for video_id, stats in refreshed.items())
+        
+        # 요청이 실패한 채널(None)은 저장하지 않아 다음에 다시 시도
+        fetched = {}
+        for channel_id, ids in upload_ids.items():
+            if ids is None:
+                continue
+            views = [view_counts[vid] for vid in ids if vid in view_counts]
+            fetched[channel_id] = {
+                'median_views': statistics.median(views) if views else 0,
+                'sample_size': len(views),
+            }
+        
+        self.metadata_cache.put_channel_baselines(fetched)
+        baselines.update(fetched)
+        return baselines
+    
+    def calculate_channel_scores(self, videos):
+        """영상 목록의 채널 기준 Outlier score 계산 (채널 기준값을 일괄 조회)"""
+        if not videos:
+            return
+        baselines = self.get_channel_baselines([video['channel_id'] for video in videos])
+        apply_channel_scores(videos, baselines, self.outlier_score_method)
     
     def _parse_duration(self, duration):
         """YouTube duration 형식(PT15M33S)을 초로 변환"""
@@ -242,112 +584,157 @@ class YouTubeAPI:
     
     def _filter_video(self, video, video_type, min_views, max_subscribers):
         """비디오 필터링"""
+        return self._get_filter_reject_reason(video, video_type, min_views, max_subscribers) is None
+    
+    def _get_filter_reject_reason(self, video, video_type, min_views, max_subscribers):
+        """필터에 걸린 이유 반환 ('views', 'subscribers', 'duration', 통과 시 None)"""
         # 조회수 필터
         if video['view_count'] < min_views:
-            return False
+            return 'views'
         
         # 구독자 수 필터
         if max_subscribers and video['subscriber_count'] > max_subscribers:
-            return False
+            return 'subscribers'
         
         # 비디오 타입 필터
         duration_seconds = video['duration_seconds']
         
         if video_type == "쇼츠" and duration_seconds > config.SHORTS_MAX_DURATION:
-            return False
+            return 'duration'
         elif video_type == "롱폼" and duration_seconds <= config.SHORTS_MAX_DURATION:
-            return False
+            return 'duration'
         elif video_type == "20분 초과":
             if duration_seconds <= 1200:  # 20분 이하
-                return False
+                return 'duration'
         
-        return True
+        return None
     
     def _calculate_outlier_scores(self, videos):
-        """Outlier score 계산 (조회수 대비 구독자 수 비율)"""
-        if not videos:
-            return
+        """Outlier score 계산 (모든 점수 종류를 한 번에 계산하고 outlier_score_method 점수를 표시)"""
+        apply_outlier_scores(videos, self.outlier_score_method)
+        if self.outlier_score_method == SCORE_CHANNEL:
+            self.calculate_channel_scores(videos)
+    
+    def _resolve_uploads_playlist_id(self, channel_id):
+        """채널의 업로드 재생목록 ID (채널 ID에서 계산할 수 없으면 channels.list 조회)"""
+        playlist_id = self._get_uploads_playlist_id(channel_id)
+        if playlist_id:
+            return playlist_id
         
-        # 비율 계산 (조회수 / 구독자 수)
-        ratios = []
-        for video in videos:
-            if video['subscriber_count'] > 0:
-                ratio = video['view_count'] / video['subscriber_count']
-                ratios.append(ratio)
-            else:
-                ratios.append(0)
+        channel_response = self._execute(
+            'channels.list',
+            part='contentDetails',
+            id=channel_id
+        )
+        if not channel_response['items']:
+            return None
+        return channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+    
+    def _read_upload_ids(self, playlist_id, limit, known_ids=()):
+        """
+        업로드 재생목록을 최신순으로 읽어 영상 ID 수집 (known_ids 중 하나가 나오면 중단)
         
-        if not ratios:
-            return
+        Returns:
+            tuple: (새 영상 ID 목록, 알려진 영상에서 멈췄는지 여부, 재생목록 끝까지 읽었는지 여부)
+        """
+        new_ids = []
+        next_page_token = None
         
-        # Z-score 계산
-        mean_ratio = statistics.mean(ratios)
-        stdev_ratio = statistics.stdev(ratios) if len(ratios) > 1 else 1
+        while len(new_ids) < limit:
+            playlist_params = {
+                'part': 'contentDetails',
+                'playlistId': playlist_id,
+                'maxResults': min(config.MAX_RESULTS_PER_REQUEST, limit - len(new_ids))
+            }
+            if next_page_token:
+                playlist_params['pageToken'] = next_page_token
+            
+            playlist_response = self._execute('playlistItems.list', **playlist_params)
+            
+            for item in playlist_response.get('items', []):
+                video_id = item['contentDetails']['videoId']
+                if video_id in known_ids:
+                    return new_ids, True, False
+                new_ids.append(video_id)
+            
+            next_page_token = playlist_response.get('nextPageToken')
+            if not next_page_token or not playlist_response.get('items'):
+                return new_ids, False, True
         
-        for i, video in enumerate(videos):
-            if stdev_ratio > 0:
-                z_score = (ratios[i] - mean_ratio) / stdev_ratio
-                video['outlier_score'] = round(abs(z_score), 2)
+        return new_ids, False, False
+    
+    def fetch_channel_videos(self, channel_id, max_results=50):
+        """
+        채널의 영상 가져오기 (최신순, 증분 동기화)
+        
+        이전에 읽은 업로드 목록을 저장해 두고, 다시 열 때는 이미 아는 영상이 나올 때까지만
+        재생목록을 읽습니다. 새 영상만 전체 정보를 조회하고 기존 영상은 만료된 통계만
+        50개씩 묶어 갱신하므로, 큰 채널도 몇 단위의 할당량으로 다시 열 수 있습니다.
+        오류는 호출자에게 그대로 전달됩니다.
+        """
+        quota_before = self.quota_used
+        
+        # 채널의 업로드 재생목록 ID 가져오기
+        uploads_playlist_id = self._resolve_uploads_playlist_id(channel_id)
+        if not uploads_playlist_id:
+            return []
+        
+        # 새 업로드 확인 (이전 동기화 결과가 있으면 아는 영상에서 중단)
+        sync_state = self.metadata_cache.get_channel_sync(channel_id)
+        known_ids = sync_state['video_ids'] if sync_state else []
+        known_set = set(known_ids)
+        new_ids, reached_known, exhausted = self._read_upload_ids(uploads_playlist_id, max_results, known_set)
+        full_sync = not reached_known
+        
+        if reached_known:
+            synced_ids = list(dict.fromkeys(new_ids + known_ids))
+            exhausted = sync_state['exhausted']
+            if len(synced_ids) < max_results and not exhausted:
+                # 이전에 더 적은 수만 읽은 경우 처음부터 다시 읽기
+                # (페이지 토큰은 새 업로드가 생기면 위치가 달라지므로 재사용하지 않음)
+                synced_ids, _, exhausted = self._read_upload_ids(uploads_playlist_id, max_results)
+                new_ids = [video_id for video_id in synced_ids if video_id not in known_set]
+                full_sync = True
             else:
-                video['outlier_score'] = 0
+                # 저장 목록은 지금까지 요청한 가장 큰 max_results만큼만 유지
+                keep_count = max(max_results, len(known_ids))
+                if len(synced_ids) > keep_count:
+                    synced_ids = synced_ids[:keep_count]
+                    exhausted = False
+        else:
+            synced_ids = new_ids
+        
+        # 새 영상은 전체 정보, 기존 영상은 캐시 (통계가 만료된 영상만 묶어서 갱신)
+        video_ids = synced_ids[:max_results]
+        all_videos = self._get_videos_detail(video_ids)
+        
+        if all_videos:
+            # 삭제/비공개 전환되어 조회되지 않은 영상은 동기화 목록에서 제외
+            returned_ids = {video['video_id'] for video in all_videos}
+            removed_ids = {video_id for video_id in video_ids if video_id not in returned_ids}
+            self.metadata_cache.put_channel_sync(
+                channel_id, [video_id for video_id in synced_ids if video_id not in removed_ids], exhausted,
+                full_sync=full_sync
+            )
+        
+        print(f"채널 동기화 ({channel_id}): 새 영상 {len(new_ids)}개, 전체 {len(all_videos)}개 "
+              f"(사용한 할당량 {self.quota_used - quota_before})")
+        
+        # Outlier score 계산
+        self._calculate_outlier_scores(all_videos)
+        
+        return all_videos
     
     def get_channel_videos(self, channel_id, max_results=50):
-        """채널의 모든 영상 가져오기"""
+        """채널의 영상 가져오기 (오류 시 빈 목록)"""
         try:
-            # 채널의 업로드 재생목록 ID 가져오기
-            channel_response = self.youtube.channels().list(
-                part='contentDetails',
-                id=channel_id
-            ).execute()
-            
-            if not channel_response['items']:
-                return []
-            
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            
-            # 재생목록의 영상들 가져오기
-            all_videos = []
-            next_page_token = None
-            
-            while len(all_videos) < max_results:
-                remaining = max_results - len(all_videos)
-                results_per_request = min(config.MAX_RESULTS_PER_REQUEST, remaining)
-                
-                playlist_params = {
-                    'part': 'snippet',
-                    'playlistId': uploads_playlist_id,
-                    'maxResults': results_per_request
-                }
-                
-                if next_page_token:
-                    playlist_params['pageToken'] = next_page_token
-                
-                playlist_response = self.youtube.playlistItems().list(**playlist_params).execute()
-                
-                if not playlist_response.get('items'):
-                    break
-                
-                # 비디오 ID 추출
-                video_ids = [item['snippet']['resourceId']['videoId'] for item in playlist_response['items']]
-                
-                # 비디오 상세 정보 가져오기
-                videos_detail = self._get_videos_detail(video_ids)
-                all_videos.extend(videos_detail)
-                
-                next_page_token = playlist_response.get('nextPageToken')
-                if not next_page_token:
-                    break
-            
-            # Outlier score 계산
-            self._calculate_outlier_scores(all_videos)
-            
-            return all_videos[:max_results]
-            
+            return self.fetch_channel_videos(channel_id, max_results)
         except Exception as e:
             print(f"채널 영상 가져오기 오류: {e}")
             return []
     
-    def get_video_transcript(self, video_id, use_whisper=True, force_transcript_only=False):
+    def get_video_transcript(self, video_id, use_whisper=True, force_transcript_only=False,
+                             progress_callback=None):
         """
         순수한 대본 텍스트만 추출
         
@@ -355,6 +742,7 @@ class YouTubeAPI:
             video_id (str): YouTube 비디오 ID
             use_whisper (bool): Whisper 사용 여부
             force_transcript_only (bool): youtube-transcript-api만 사용 (할당량 절약)
+            progress_callback (function): Whisper 처리 진행상황 콜백
             
         Returns:
             str: 순수한 대본 텍스트 또는 None
@@ -380,14 +768,18 @@ class YouTubeAPI:
                 print(f"❌ 자막 없음 (Transcript-only 모드): {video_id}")
                 return None
             
-            # API 제한을 피하기 위한 대기
-            time.sleep(1)
-            
             # 2단계: Whisper로 오디오 추출 후 대본 생성 (할당량 사용 안 함)
             if use_whisper and WHISPER_AVAILABLE:
+                cached_whisper = self._get_cached_whisper_transcript(video_id)
+                if cached_whisper:
+                    return cached_whisper
+                
+                # API 제한을 피하기 위한 대기
+                time.sleep(1)
+                
                 if self.check_quota_available(0):  # Whisper는 할당량 사용 안 함
                     print(f"🎵 YouTube 자막이 없어 Whisper로 대본 추출 시도: {video_id}")
-                    return self._extract_transcript_with_whisper_improved(video_id)
+                    return self._extract_transcript_with_whisper_improved(video_id, progress_callback)
                 else:
                     print(f"⚠️ API 할당량 부족으로 Whisper 사용 제한: {video_id}")
             
@@ -397,7 +789,7 @@ class YouTubeAPI:
             print(f"대본 가져오기 오류 (Video ID: {video_id}): {e}")
             if use_whisper and WHISPER_AVAILABLE and not force_transcript_only:
                 print(f"🔄 오류 발생, Whisper로 재시도: {video_id}")
-                return self._extract_transcript_with_whisper_improved(video_id)
+                return self._extract_transcript_with_whisper_improved(video_id, progress_callback)
             else:
                 return None
     
@@ -405,35 +797,69 @@ class YouTubeAPI:
         """
         YouTube 자막에서 순수한 텍스트만 추출하는 새로운 함수
         """
+        # 우선순위: 수동 한국어 > 수동 영어 > 자동 한국어 > 자동 영어
+        language_priority = ['ko', 'en', 'ja', 'zh']
+        
+        # 캐시 확인 (네트워크 요청 없음)
+        cached = self.transcript_cache.get(video_id, [SOURCE_MANUAL, SOURCE_AUTO], language_priority)
+        if cached:
+            return cached['text']
+        if self.transcript_cache.is_unavailable(video_id):
+            return None
+        
         try:
+            self.transcript_rate_limiter.acquire()
             transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
             
-            # 우선순위: 수동 한국어 > 수동 영어 > 자동 한국어 > 자동 영어
-            language_priority = ['ko', 'en', 'ja', 'zh']
-            
             # 1. 수동 자막 시도
+            fetch_failed = False
             for lang in language_priority:
                 try:
                     transcript = transcript_list.find_transcript([lang])
-                    if not transcript.is_generated:  # 수동 자막인지 확인
-                        clean_text = self._process_transcript_data(transcript.fetch())
-                        if clean_text and len(clean_text.strip()) > 50:  # 의미있는 길이인지 확인
-                            return clean_text
-                except:
+                except NoTranscriptFound:
+                    continue
+                if transcript.is_generated:  # 수동 자막인지 확인
                     continue
+                try:
+                    clean_text = self._process_transcript_data(transcript.fetch())
+                except Exception as e:
+                    print(f"YouTube 자막 다운로드 오류 ({video_id}, {lang}): {e}")
+                    fetch_failed = True
+                    continue
+                if clean_text and len(clean_text.strip()) > 50:  # 의미있는 길이인지 확인
+                    self.transcript_cache.put(video_id, clean_text, lang, SOURCE_MANUAL)
+                    return clean_text
             
             # 2. 자동 생성 자막 시도
             for lang in language_priority:
                 try:
                     transcript = transcript_list.find_generated_transcript([lang])
+                except NoTranscriptFound:
+                    continue
+                try:
                     clean_text = self._process_transcript_data(transcript.fetch())
-                    if clean_text and len(clean_text.strip()) > 50:
-                        return clean_text
-                except:
+                except Exception as e:
+                    print(f"YouTube 자막 다운로드 오류 ({video_id}, {lang}): {e}")
+                    fetch_failed = True
                     continue
+                if clean_text and len(clean_text.strip()) > 50:
+                    self.transcript_cache.put(video_id, clean_text, lang, SOURCE_AUTO)
+                    return clean_text
+            
+            # 다운로드 오류(네트워크, 요청 제한 등)가 있었으면 기록하지 않고 다음에 다시 시도
+            if fetch_failed:
+                return None
             
+            # 자막 목록은 받았지만 사용할 자막이 없는 경우 기록
+            self.transcript_cache.mark_unavailable(video_id)
             return None
             
+        except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable) as e:
+            # 자막이 없는 영상은 기록하여 다음 일괄 추출에서 네트워크 요청 생략
+            # (일시적인 네트워크 오류는 기록하지 않고 다음에 다시 시도)
+            print(f"YouTube 자막 없음 ({video_id}): {type(e).__name__}")
+            self.transcript_cache.mark_unavailable(video_id)
+            return None
         except Exception as e:
             print(f"YouTube 자막 추출 오류: {e}")
             return None
@@ -485,7 +911,7 @@ class YouTubeAPI:
         
         return full_text if full_text else None
     
-    def get_transcript_batch(self, video_ids, progress_callback=None):
+    def get_transcript_batch(self, video_ids, progress_callback=None, max_workers=None):
         """
         여러 영상의 순수 대본을 효율적으로 일괄 추출
         API 할당량을 사용하지 않는 youtube-transcript-api만 사용
@@ -493,38 +919,61 @@ class YouTubeAPI:
         Args:
             video_ids (list): 비디오 ID 목록
             progress_callback (function): 진행상황 콜백
+            max_workers (int): 동시 추출 작업 수 (기본값: config.TRANSCRIPT_MAX_WORKERS, 1이면 순차 처리)
             
         Returns:
-            dict: {video_id: clean_transcript_text} 형태
+            dict: {video_id: clean_transcript_text} 형태 (입력 순서 유지)
         """
-        results = {}
+        if max_workers is None:
+            max_workers = config.TRANSCRIPT_MAX_WORKERS
+        
+        video_ids = list(dict.fromkeys(video_ids))
+        transcripts = {}
         failed_videos = []
         total = len(video_ids)
         
-        print(f"📋 순수 대본 일괄 추출 시작: {total}개 영상")
+        print(f"📋 순수 대본 일괄 추출 시작: {total}개 영상 (작업 {max_workers}개)")
         
-        for i, video_id in enumerate(video_ids):
-            if progress_callback:
-                progress_callback(f"순수 대본 추출 중... ({i+1}/{total})")
-            
-            try:
-                # 새로운 순수 대본 추출 방식 사용
-                clean_transcript = self._extract_clean_youtube_transcript(video_id)
-                
-                if clean_transcript and len(clean_transcript.strip()) > 50:
-                    results[video_id] = clean_transcript
-                    print(f"✅ {i+1}/{total} 성공: {video_id} ({len(clean_transcript)}자)")
-                else:
-                    failed_videos.append(video_id)
-                    print(f"❌ {i+1}/{total} 실패: {video_id} (자막 없음)")
-                
-            except Exception as e:
+        def extract(video_id):
+            # 요청 간격은 공유 토큰 버킷이 조정 (YouTube 서버 부하 방지)
+            clean_transcript = self._extract_clean_youtube_transcript(video_id)
+            if clean_transcript and len(clean_transcript.strip()) > 50:
+                return clean_transcript
+            return None
+        
+        def record(done, video_id, clean_transcript=None, error=None):
+            if clean_transcript:
+                transcripts[video_id] = clean_transcript
+                print(f"✅ {done}/{total} 성공: {video_id} ({len(clean_transcript)}자)")
+            elif error:
                 failed_videos.append(video_id)
-                print(f"❌ {i+1}/{total} 오류: {video_id} - {str(e)}")
-            
-            # 요청 간격 조정 (YouTube 서버 부하 방지)
-            import time
-            time.sleep(0.2)
+                print(f"❌ {done}/{total} 오류: {video_id} - {error}")
+            else:
+                failed_videos.append(video_id)
+                print(f"❌ {done}/{total} 실패: {video_id} (자막 없음)")
+        
+        if max_workers <= 1:
+            for i, video_id in enumerate(video_ids):
+                if progress_callback:
+                    progress_callback(f"순수 대본 추출 중... ({i+1}/{total})")
+                try:
+                    record(i + 1, video_id, extract(video_id))
+                except Exception as e:
+                    record(i + 1, video_id, error=str(e))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(extract, video_id): video_id for video_id in video_ids}
+                for done, future in enumerate(as_completed(futures), 1):
+                    video_id = futures[future]
+                    try:
+                        record(done, video_id, future.result())
+                    except Exception as e:
+                        record(done, video_id, error=str(e))
+                    if progress_callback:
+                        progress_callback(f"순수 대본 추출 중... ({done}/{total})")
+        
+        # 입력 순서대로 결과 정렬
+        results = {video_id: transcripts[video_id] for video_id in video_ids if video_id in transcripts}
         
         success_count = len(results)
         print(f"🎉 순수 대본 일괄 추출 완료: {success_count}/{total}개 성공")
@@ -534,208 +983,161 @@ class YouTubeAPI:
         
         return results
     
-    def _extract_transcript_with_whisper_improved(self, video_id):
-        """개선된 yt-dlp와 Whisper를 사용한 대본 추출"""
-        if not WHISPER_AVAILABLE:
+    def _get_whisper_model_tag(self):
+        """대본 캐시 구분용 음성 인식 모델 식별자 (백엔드/모델 크기/연산 형식)"""
+        return create_backend(config.ASR_BACKEND, config.WHISPER_MODEL, config.WHISPER_COMPUTE_TYPE).model_tag
+    
+    def _get_cached_whisper_transcript(self, video_id):
+        """캐시된 Whisper 대본 조회 (현재 백엔드/모델/언어 기준)"""
+        languages = [config.WHISPER_LANGUAGE] if config.WHISPER_LANGUAGE else None
+        cached = self.transcript_cache.get(
+            video_id, [SOURCE_WHISPER], languages, model=self._get_whisper_model_tag()
+        )
+        if cached:
+            print(f"Whisper 대본 캐시 사용: {video_id}")
+            return cached['text']
+        return None
+    
+    def _get_whisper_pool(self):
+        """Whisper 작업 프로세스 풀 반환 (처음 호출 시 시작, 각 프로세스가 모델을 한 번만 로드)"""
+        with self._whisper_lock:
+            if self.whisper_pool is None:
+                print(f"Whisper 작업 프로세스 시작 중... ({config.WHISPER_POOL_SIZE}개)")
+                self.whisper_pool = WhisperWorkerPool()
+            return self.whisper_pool
+    
+    def shutdown(self):
+        """백그라운드 작업 프로세스 종료"""
+        with self._whisper_lock:
+            if self.whisper_pool is not None:
+                self.whisper_pool.shutdown()
+                self.whisper_pool = None
+    
+    def _extract_transcript_with_whisper_improved(self, video_id, progress_callback=None):
+        """
+        개선된 yt-dlp와 Whisper를 사용한 대본 추출 (음성 인식은 작업 프로세스에서 실행)
+        
+        실패하면 원인을 출력하고 None을 반환합니다 (오류 문구를 대본으로 반환하지 않음).
+        """
+        if not WHISPER_AVAILABLE or not YT_DLP_AVAILABLE:
             return None
         
-        # Whisper 모델 로드 (한 번만 로드)
-        if self.whisper_model is None:
-            try:
-                print("Whisper 모델 로드 중...")
-                self.whisper_model = whisper.load_model("base")
-                print("Whisper 모델 로드 완료")
-            except Exception as e:
-                print(f"Whisper 모델 로드 실패: {e}")
-                return None
+        # 캐시 확인 (다운로드/음성 인식 생략)
+        cached = self._get_cached_whisper_transcript(video_id)
+        if cached:
+            return cached
+        
+        try:
+            whisper_pool = self._get_whisper_pool()
+        except Exception as e:
+            print(f"Whisper 작업 프로세스 시작 실패: {e}")
+            return None
         
-        temp_dir = None
         try:
             import time
+            import yt_dlp  # 처음 사용할 때 로드
             
             # 요청 간격 조정 (403 오류 방지)
             time.sleep(2)
             
-            # 임시 디렉토리 생성
-            temp_dir = tempfile.mkdtemp()
-            audio_path = os.path.join(temp_dir, f"{video_id}")
-            
-            # 개선된 yt-dlp 설정
+            # 개선된 yt-dlp 설정 (스트림 주소만 확인하고 파일로 내려받지 않음)
             ydl_opts = {
                 'format': 'bestaudio[ext=webm]/bestaudio[ext=m4a]/bestaudio',
-                'outtmpl': audio_path + '.%(ext)s',
                 'no_warnings': True,
                 'quiet': True,
-                'ignoreerrors': True,
                 'extract_flat': False,
                 'writesubtitles': False,
                 'writeautomaticsub': False,
-                'retries': 3,
-                'fragment_retries': 3,
-                'skip_unavailable_fragments': True,
                 # User-Agent와 헤더 설정
                 'http_headers': {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
                 },
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'wav',
-                    'preferredquality': '192',
-                }],
             }
             
-            # 오디오 다운로드 시도
+            # 오디오 스트림 주소 확인
+            if progress_callback:
+                progress_callback("오디오 스트림 확인 중...")
             try:
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                     video_url = f"https://www.youtube.com/watch?v={video_id}"
                     info = ydl.extract_info(video_url, download=False)
-                    
-                    # 짧은 영상만 처리 (10분 이하)
-                    duration = info.get('duration', 0)
-                    if duration > 600:  # 10분 초과
-                        print(f"영상이 너무 김 (Whisper 스킵): {video_id} - {duration}초")
-                        return "영상이 너무 길어 Whisper 처리를 건너뜁니다. (10분 초과)"
-                    
-                    # 실제 다운로드
-                    ydl.download([video_url])
-                    
             except Exception as download_error:
                 if "403" in str(download_error) or "Forbidden" in str(download_error):
-                    return "해당 영상은 다운로드가 제한되어 있어 대본을 추출할 수 없습니다."
-                else:
-                    print(f"yt-dlp 다운로드 오류: {download_error}")
+                    print(f"다운로드가 제한된 영상 (Whisper 스킵): {video_id}")
                     return None
+                print(f"yt-dlp 오류: {download_error}")
+                return None
             
-            # 다운로드된 오디오 파일 찾기
-            actual_audio_path = None
-            if os.path.exists(temp_dir):
-                for file in os.listdir(temp_dir):
-                    if video_id in file and file.endswith('.wav'):
-                        actual_audio_path = os.path.join(temp_dir, file)
-                        break
+            # 너무 긴 영상은 건너뜀 (config.WHISPER_MAX_DURATION)
+            duration = info.get('duration', 0) or 0
+            if config.WHISPER_MAX_DURATION and duration > config.WHISPER_MAX_DURATION:
+                print(f"영상이 너무 김 (Whisper 스킵): {video_id} - {duration}초 "
+                      f"({config.WHISPER_MAX_DURATION // 60}분 초과)")
+                return None
             
-            if not actual_audio_path or not os.path.exists(actual_audio_path):
-                return "오디오 파일 추출에 실패했습니다."
+            stream_url = info.get('url')
+            if not stream_url:
+                print(f"오디오 스트림을 찾을 수 없음: {video_id}")
+                return None
             
-            # Whisper로 텍스트 추출
+            # 오디오 스트림을 16 kHz 모노 PCM으로 디코딩하면서 무음 구간 기준으로 조각내어
+            # 여러 작업 프로세스에서 동시에 인식 (중간 파일 없음, 메모리는 조각 몇 개 분량만 사용)
+            if progress_callback:
+                progress_callback("오디오 디코딩 및 음성 인식 중...")
             try:
-                result = self.whisper_model.transcribe(
-                    actual_audio_path, 
-                    language="ko",
-                    task="transcribe",
-                    fp16=False  # 호환성 향상
+                chunks = iter_audio_chunks(stream_url, http_headers=info.get('http_headers'))
+                result = whisper_pool.transcribe_chunks(
+                    chunks,
+                    progress_callback=progress_callback,
+                    language=config.WHISPER_LANGUAGE  # None이면 자동 감지
                 )
-                
-                if result and result.get('text'):
-                    transcript_text = result['text'].strip()
-                    if len(transcript_text) > 10:  # 의미있는 텍스트인지 확인
-                        print(f"Whisper로 대본 추출 성공: {video_id}")
-                        return transcript_text
-                    else:
-                        return "추출된 대본이 너무 짧습니다."
-                else:
-                    return "Whisper가 텍스트를 추출하지 못했습니다."
-                    
+            except AudioDecodeError as decode_error:
+                if "403" in str(decode_error) or "Forbidden" in str(decode_error):
+                    print(f"다운로드가 제한된 영상 (Whisper 스킵): {video_id}")
+                    return None
+                print(f"오디오 디코딩 오류: {decode_error}")
+                return None
             except Exception as whisper_error:
                 print(f"Whisper 처리 오류: {whisper_error}")
-                return f"음성 인식 처리 중 오류가 발생했습니다: {str(whisper_error)}"
-                
-        except Exception as e:
-            print(f"대본 추출 전체 오류 (Video ID: {video_id}): {e}")
-            return f"대본 추출 중 오류가 발생했습니다: {str(e)}"
-        finally:
-            # 임시 파일 정리
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                except Exception as cleanup_error:
-                    print(f"임시 파일 정리 오류: {cleanup_error}")
-                    pass
-        """yt-dlp와 Whisper를 사용한 대본 추출"""
-        if not WHISPER_AVAILABLE:
-            return None
-        
-        # Whisper 모델 로드 (한 번만 로드)
-        if self.whisper_model is None:
-            try:
-                print("Whisper 모델 로드 중...")
-                self.whisper_model = whisper.load_model("base")
-                print("Whisper 모델 로드 완료")
-            except Exception as e:
-                print(f"Whisper 모델 로드 실패: {e}")
-                return None
-        
-        temp_dir = None
-        try:
-            # 임시 디렉토리 생성
-            temp_dir = tempfile.mkdtemp()
-            audio_path = os.path.join(temp_dir, f"{video_id}.wav")
-            
-            # yt-dlp 설정
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'outtmpl': audio_path[:-4] + '.%(ext)s',
-                'extractaudio': True,
-                'audioformat': 'wav',
-                'audioquality': '192K',
-                'no_warnings': True,
-                'quiet': True,
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'wav',
-                    'preferredquality': '192',
-                }],
-            }
-            
-            # 오디오 다운로드
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                ydl.download([video_url])
-            
-            # 실제 오디오 파일 경로 찾기
-            actual_audio_path = None
-            for file in os.listdir(temp_dir):
-                if file.startswith(video_id) and file.endswith('.wav'):
-                    actual_audio_path = os.path.join(temp_dir, file)
-                    break
-            
-            if not actual_audio_path or not os.path.exists(actual_audio_path):
-                print(f"오디오 파일을 찾을 수 없음: {video_id}")
                 return None
             
-            # 오디오에서 텍스트 추출
-            result = self.whisper_model.transcribe(actual_audio_path, language="ko")
-            
             if result and result.get('text'):
                 transcript_text = result['text'].strip()
-                print(f"Whisper로 대본 추출 성공: {video_id}")
-                return transcript_text
+                if len(transcript_text) > 10:  # 의미있는 텍스트인지 확인
+                    print(f"Whisper로 대본 추출 성공: {video_id} ({len(result['segments'])}개 구간)")
+                    self.transcript_cache.put(
+                        video_id, transcript_text, result.get('language') or config.WHISPER_LANGUAGE or '',
+                        SOURCE_WHISPER, model=self._get_whisper_model_tag()
+                    )
+                    return transcript_text
+                print(f"추출된 대본이 너무 짧음: {video_id}")
             else:
-                print(f"Whisper 추출 결과가 비어있음: {video_id}")
-                return None
+                print(f"Whisper가 텍스트를 추출하지 못함: {video_id}")
+            return None
                 
         except Exception as e:
-            print(f"Whisper 대본 추출 오류 (Video ID: {video_id}): {e}")
+            print(f"대본 추출 전체 오류 (Video ID: {video_id}): {e}")
             return None
-        finally:
-            # 임시 파일 정리
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                except:
-                    pass
+    
+    def export_thumbnails(self, items, progress_callback=None, max_workers=None):
+        """
+        썸네일 일괄 내보내기 (maxres 우선, 없으면 high / 이미 받은 파일은 건너뜀)
+        
+        Args:
+            items (list): [(video_id, 저장 경로), ...]
+            progress_callback (function): (완료 수, 전체 수, 결과) 콜백
+            max_workers (int): 동시 다운로드 수 (기본값: config.THUMBNAIL_MAX_WORKERS)
+            
+        Returns:
+            list: 입력 순서대로 {'video_id', 'path', 'status', 'variant', 'error'} 목록
+        """
+        exporter = ThumbnailExporter(self.http_session, max_workers=max_workers)
+        return exporter.export(items, progress_callback)
     
     def download_thumbnail(self, thumbnail_url, save_path):
-        """썸네일 다운로드"""
+        """썸네일 다운로드 (공유 HTTP 세션으로 연결 재사용)"""
         try:
-            response = requests.get(thumbnail_url)
-            if response.status_code == 200:
-                with open(save_path, 'wb') as f:
-                    f.write(response.content)
-                return True
-            return False
+            return self.http_session.download(thumbnail_url, save_path)
         except Exception as e:
             print(f"썸네일 다운로드 오류: {e}")
             return False